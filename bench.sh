@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+
+python3 src/bench_memory.py
+python3 src/bench_render.py
+python3 src/bench_blocks.py
+python3 src/bench_complexity.py
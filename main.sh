@@ -1,3 +1,3 @@
 #!/usr/bin/env bash
 
-python3 src/main.py
\ No newline at end of file
+python3 src/main.py build
\ No newline at end of file
@@ -0,0 +1,67 @@
+import random
+import sys
+import time
+
+from block_markdown import block_to_block_type, markdown_to_blocks, markdown_to_html_node
+
+
+def synthetic_blocks(count, seed=0):
+    """
+    Build a reproducible mix of markdown blocks, weighted like real content pages.
+
+    Args:
+        count (int): Number of blocks to generate.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list[str]: The blocks.
+    """
+    rng = random.Random(seed)
+    words = "the quick brown fox jumps over lazy dog static site generator markdown".split()
+
+    def sentence():
+        return " ".join(rng.choice(words) for _ in range(rng.randint(5, 15)))
+
+    makers = [
+        (50, lambda: "\n".join(sentence() for _ in range(rng.randint(1, 4)))),
+        (10, lambda: "#" * rng.randint(1, 6) + " " + sentence()),
+        (10, lambda: "```\n" + "\n".join(sentence() for _ in range(rng.randint(1, 8))) + "\n```"),
+        (10, lambda: "\n".join("> " + sentence() for _ in range(rng.randint(1, 4)))),
+        (10, lambda: "\n".join("- " + sentence() for _ in range(rng.randint(2, 8)))),
+        (10, lambda: "\n".join(f"{i}. " + sentence() for i in range(1, rng.randint(3, 12)))),
+    ]
+    weights = [weight for weight, _ in makers]
+    choices = rng.choices([make for _, make in makers], weights=weights, k=count)
+    return [make() for make in choices]
+
+
+def main():
+    """
+    Print blocks per second for block_to_block_type, markdown_to_blocks and the
+    whole markdown_to_html_node pipeline.
+
+    Usage: python3 src/bench_blocks.py [block count, default 200000]
+    """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    blocks = synthetic_blocks(count)
+    document = "\n\n".join(blocks)
+
+    start = time.perf_counter()
+    for block in blocks:
+        block_to_block_type(block)
+    elapsed = time.perf_counter() - start
+    print(f"block_to_block_type: {count:,} blocks in {elapsed:.3f}s ({count / elapsed:,.0f} blocks/s)")
+
+    start = time.perf_counter()
+    split = sum(1 for _ in markdown_to_blocks(document))
+    elapsed = time.perf_counter() - start
+    print(f"markdown_to_blocks:  {split:,} blocks in {elapsed:.3f}s ({split / elapsed:,.0f} blocks/s)")
+
+    start = time.perf_counter()
+    markdown_to_html_node(document).to_html()
+    elapsed = time.perf_counter() - start
+    print(f"markdown to HTML:    {split:,} blocks in {elapsed:.3f}s ({split / elapsed:,.0f} blocks/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+import gc
+import math
+import re
+import sys
+import time
+
+from textnode import TextNode, TextType
+from inline_markdown import split_nodes_delimiter, text_to_textnodes
+from inline_html import text_to_html_nodes
+from split_nodes_images_links import split_nodes_image, split_nodes_link
+from extract_markdown_images import extract_markdown_images, extract_markdown_links
+
+
+# Fitted log-log slopes above this are reported as super-linear. Linear code
+# fits close to 1.0 and quadratic code close to 2.0; the margin absorbs timer
+# noise and the n log n cost of growing lists and strings.
+MAX_SLOPE = 1.4
+
+# Cases still faster than this at the largest size are too quick to time
+# reliably (and too quick to stall a build), so they never fail the check
+MIN_SECONDS = 1e-3
+
+# Each input is built from n repetitions of a short unit, so sizes are in units
+DEFAULT_SIZES = (2_000, 4_000, 8_000, 16_000, 32_000)
+
+
+def _plain(text):
+    return [TextNode(text, TextType.PLAIN)]
+
+
+def _split_bold(text):
+    # An unclosed delimiter is a valid outcome for an adversarial input
+    try:
+        split_nodes_delimiter(_plain(text), "**", TextType.BOLD)
+    except ValueError:
+        pass
+
+
+def _text_to_textnodes(text):
+    try:
+        text_to_textnodes(text)
+    except ValueError:
+        pass
+
+
+# Link definitions for the reference-link inputs
+_REFERENCES = {"r": "https://boot.dev", "boot.dev": "https://boot.dev"}
+
+
+# Parsers under test, by name
+TARGETS = {
+    "split_nodes_delimiter": _split_bold,
+    "split_nodes_image": lambda text: split_nodes_image(_plain(text)),
+    "split_nodes_link": lambda text: split_nodes_link(_plain(text)),
+    "split_nodes_link (refs)": lambda text: split_nodes_link(_plain(text), references=_REFERENCES),
+    "extract_markdown_images": extract_markdown_images,
+    "extract_markdown_links": extract_markdown_links,
+    "text_to_textnodes": _text_to_textnodes,
+    "text_to_html_nodes": text_to_html_nodes,
+}
+
+# Adversarial inputs, by name: each builds a text from n repetitions of a unit
+INPUTS = {
+    "open brackets": lambda n: "[" * n,
+    "image openers": lambda n: "![" * n,
+    "closed brackets without url": lambda n: "[a]" * n,
+    "many links": lambda n: "[a](https://boot.dev) " * n,
+    "many images": lambda n: "![a](a.png) " * n,
+    "unclosed urls": lambda n: "[a](b" * n,
+    "unbalanced parens": lambda n: "[a](b(" * n,
+    "close brackets": lambda n: "](" * n,
+    "reference links": lambda n: "[a][r] [boot.dev] " * n,
+    "undefined references": lambda n: "[a][x] [y][] " * n,
+    "bare urls": lambda n: "see https://boot.dev/a_(b)). " * n,
+    "unterminated angle links": lambda n: "<https://a" * n,
+    "url punctuation run": lambda n: "http://a" + ")" * n,
+    "delimiter run": lambda n: "**" * n,
+    "unmatched openers": lambda n: "*a " * n,
+    "unclosed bold": lambda n: "**a " * n,
+}
+
+
+# The regex extractors scan_brackets replaced. They mis-read nested brackets and
+# parentheses, but on ordinary text they are the speed to match.
+_OLD_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+_OLD_LINK_PATTERN = re.compile(r"(?<!!)\[([^\]]+)\]\(([^)]+)\)")
+
+# Link-dense paragraphs like those of a real page, with the occasional image
+TYPICAL = (
+    "Read the [getting started guide](https://boot.dev/guide), then the [API reference](https://boot.dev/api) "
+    "and the [changelog](https://boot.dev/changelog) before you [open an issue](https://github.com/boot/issues).",
+    "![Screenshot of the dashboard](/images/dashboard.png)",
+    "The [CLI](/docs/cli.html) wraps the [HTTP API](/docs/api.html); see [auth](/docs/auth.html), "
+    "[rate limits](/docs/limits.html) and [errors](/docs/errors.html) for details.",
+    "Thanks to [Ada](https://github.com/ada), [Grace](https://github.com/grace) and "
+    "[Linus](https://github.com/linus) for reviewing, and to ![the team](/img/team.jpg) for the photo.",
+    "A plain paragraph with no markup at all, like most of any page, which still has to be looked at once.",
+)
+
+# Extractors and the old regex versions they replaced, by name: (new, old)
+BASELINES = {
+    "extract_markdown_links": (extract_markdown_links, lambda text: _OLD_LINK_PATTERN.findall(text)),
+    "extract_markdown_images": (extract_markdown_images, lambda text: _OLD_IMAGE_PATTERN.findall(text)),
+}
+
+# Being slower than the old version by less than this fraction is timer noise:
+# the two take microseconds per paragraph, so a busy machine moves the ratio
+# by several percent between runs
+SLOWDOWN_TOLERANCE = 0.10
+
+
+def time_call(func, text, repeats=3):
+    """
+    Return the fastest of repeats calls of func(text), in seconds.
+
+    The minimum is the least noisy estimate of the cost of the code itself.
+    The garbage collector is paused while timing, as timeit does, so a
+    collection landing in one call can't skew a single size.
+    """
+    best = math.inf
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(text)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def fit_slope(sizes, seconds):
+    """
+    Fit log(seconds) = slope * log(size) + c by least squares and return the slope.
+
+    The slope is the exponent of the growth: about 1 for O(n) and 2 for O(n^2).
+
+    Args:
+        sizes (Sequence[int]): Input sizes.
+        seconds (Sequence[float]): Time taken at each size.
+
+    Returns:
+        float: The fitted exponent.
+    """
+    xs = [math.log(size) for size in sizes]
+    # Clamp to the timer resolution so a 0.0 reading can't break the log
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure(func, make_input, sizes=DEFAULT_SIZES, repeats=3, time_limit=None):
+    """
+    Time func on make_input(n) for each n in sizes and fit the growth exponent.
+
+    Args:
+        func (callable): The parser under test, called with one str.
+        make_input (callable): Builds the input text for a size.
+        sizes (Sequence[int], optional): Sizes to time, smallest first. Defaults to DEFAULT_SIZES.
+        repeats (int, optional): Calls per size; the fastest is kept. Defaults to 3.
+        time_limit (float, optional): Stop growing once one size takes longer than
+            this many seconds, so a quadratic parser can't stall the run. At least
+            three sizes are always timed. Defaults to None (no limit).
+
+    Returns:
+        tuple[float, list[int], list[float]]: (slope, sizes timed, seconds per size)
+    """
+    timed_sizes, seconds = [], []
+    for n in sizes:
+        timed_sizes.append(n)
+        seconds.append(time_call(func, make_input(n), repeats))
+        if time_limit is not None and seconds[-1] > time_limit and len(seconds) >= 3:
+            break
+    return fit_slope(timed_sizes, seconds), timed_sizes, seconds
+
+
+def check_complexity(targets=None, inputs=None, sizes=DEFAULT_SIZES, repeats=3, max_slope=MAX_SLOPE, time_limit=0.5,
+                     min_seconds=MIN_SECONDS):
+    """
+    Time every target on every adversarial input and collect the super-linear pairs.
+
+    Args:
+        targets (dict[str, callable], optional): Parsers by name. Defaults to TARGETS.
+        inputs (dict[str, callable], optional): Input builders by name. Defaults to INPUTS.
+        sizes (Sequence[int], optional): Sizes to time. Defaults to DEFAULT_SIZES.
+        repeats (int, optional): Calls per size. Defaults to 3.
+        max_slope (float, optional): Largest acceptable exponent. Defaults to MAX_SLOPE.
+        time_limit (float, optional): See measure(). Defaults to 0.5.
+        min_seconds (float, optional): Only fail cases that take at least this long
+            at the largest size timed. Defaults to MIN_SECONDS.
+
+    Returns:
+        tuple[list, list]: (results, failures), each a list of
+            (target name, input name, slope, seconds at the largest size timed)
+    """
+    targets = TARGETS if targets is None else targets
+    inputs = INPUTS if inputs is None else inputs
+    results, failures = [], []
+    for target_name, func in targets.items():
+        for input_name, make_input in inputs.items():
+            slope, _, seconds = measure(func, make_input, sizes, repeats, time_limit)
+            result = (target_name, input_name, slope, seconds[-1])
+            results.append(result)
+            if slope > max_slope and seconds[-1] >= min_seconds:
+                failures.append(result)
+    return results, failures
+
+
+def compare_with_baselines(baselines=None, texts=TYPICAL, calls=2_000, repeats=7):
+    """
+    Time each extractor against the old version it replaced, on typical text.
+
+    The two are timed in turns within each repeat, so a machine that slows
+    down or speeds up during the run affects both alike.
+
+    Args:
+        baselines (dict[str, tuple[callable, callable]], optional): (new, old) by name.
+            Defaults to BASELINES.
+        texts (Sequence[str], optional): The paragraphs to extract from. Defaults to TYPICAL.
+        calls (int, optional): Times each paragraph is extracted per repeat. Defaults to 2,000.
+        repeats (int, optional): The fastest repeat is kept. Defaults to 7.
+
+    Returns:
+        list[tuple[str, float, float]]: (name, old seconds, new seconds) per extractor.
+    """
+    baselines = BASELINES if baselines is None else baselines
+    results = []
+    for name, (new, old) in baselines.items():
+        best = {old: math.inf, new: math.inf}
+        for _ in range(repeats):
+            for func in (old, new):
+                start = time.perf_counter()
+                for _ in range(calls):
+                    for text in texts:
+                        func(text)
+                best[func] = min(best[func], time.perf_counter() - start)
+        results.append((name, best[old], best[new]))
+    return results
+
+
+def main():
+    """
+    Print the fitted exponent of every parser on every adversarial input.
+
+    Then compare the extractors with the regexes they replaced on typical
+    text. Exits with status 1 if any parser grows faster than MAX_SLOPE
+    (ignoring cases under MIN_SECONDS), or any extractor is slower than its
+    old version by more than SLOWDOWN_TOLERANCE.
+    """
+    results, failures = check_complexity()
+    print(f"{'parser':<25}{'input':<30}{'slope':>7}{'largest (s)':>13}")
+    for target_name, input_name, slope, seconds in results:
+        flag = "  SUPER-LINEAR" if slope > MAX_SLOPE and seconds >= MIN_SECONDS else ""
+        print(f"{target_name:<25}{input_name:<30}{slope:>7.2f}{seconds:>13.4f}{flag}")
+
+    print(f"\n{'typical text':<25}{'old (s)':>10}{'new (s)':>10}{'new/old':>9}")
+    slower = []
+    for name, old_seconds, new_seconds in compare_with_baselines():
+        ratio = new_seconds / old_seconds
+        flag = "  SLOWER" if ratio > 1 + SLOWDOWN_TOLERANCE else ""
+        if flag:
+            slower.append(name)
+        print(f"{name:<25}{old_seconds:>10.4f}{new_seconds:>10.4f}{ratio:>9.2f}{flag}")
+
+    if failures:
+        print(f"{len(failures)} super-linear case(s), slope > {MAX_SLOPE}")
+    if slower:
+        print(f"{len(slower)} extractor(s) slower than the regexes they replaced")
+    if failures or slower:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
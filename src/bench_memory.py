@@ -0,0 +1,82 @@
+import sys
+import tracemalloc
+
+from textnode import TextNode, TextType
+from htmlnode import HTMLNode, LeafNode, ParentNode
+
+
+# Dict-backed copies of the node classes, as they were before __slots__ was added.
+# They only exist so the benchmark can show the "before" numbers side by side.
+class DictTextNode:
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictHTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+
+class DictLeafNode(DictHTMLNode):
+    def __init__(self, tag=None, value=None, props=None):
+        super().__init__(tag=tag, value=value, children=None, props=props)
+
+
+class DictParentNode(DictHTMLNode):
+    def __init__(self, tag=None, children=None, props=None):
+        super().__init__(tag=tag, value=None, children=children, props=props)
+
+
+def bytes_per_node(factory, count=100_000):
+    """
+    Measure the heap cost of one node built by factory.
+
+    The text, tags and children list are shared by every node, so the number
+    reported is the size of the node object itself (plus its __dict__, if any).
+
+    Args:
+        factory (callable): Zero-argument function returning a new node.
+        count (int, optional): How many nodes to allocate. Defaults to 100_000.
+
+    Returns:
+        float: Average number of bytes allocated per node.
+    """
+    nodes = [None] * count
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        nodes[i] = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main():
+    """
+    Print bytes per node for the dict-backed and the slotted node classes.
+    """
+    text = "shared text"
+    children = [LeafNode("b", text)]
+    props = {"href": "https://boot.dev"}
+    cases = [
+        ("TextNode", lambda: DictTextNode(text, TextType.PLAIN), lambda: TextNode(text, TextType.PLAIN)),
+        ("HTMLNode", lambda: DictHTMLNode("p", text), lambda: HTMLNode("p", text)),
+        ("LeafNode", lambda: DictLeafNode("a", text, props), lambda: LeafNode("a", text, props)),
+        ("ParentNode", lambda: DictParentNode("p", children), lambda: ParentNode("p", children)),
+    ]
+
+    print(f"Python {sys.version.split()[0]}")
+    print(f"{'class':<12}{'before (B)':>12}{'after (B)':>12}{'saved':>8}")
+    for name, before_factory, after_factory in cases:
+        before = bytes_per_node(before_factory)
+        after = bytes_per_node(after_factory)
+        print(f"{name:<12}{before:>12.1f}{after:>12.1f}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import sys
+import time
+
+from textnode import TextNode, TextType
+from htmlnode import LeafNode, ParentNode, attributes_to_html, text_node_to_html_node
+
+
+def recursive_to_html(node):
+    """
+    The old recursive ParentNode.to_html(), kept here as the baseline.
+
+    Args:
+        node (HTMLNode): Root of the tree to render.
+
+    Returns:
+        str: The rendered HTML.
+    """
+    if isinstance(node, LeafNode):
+        return node.to_html()
+    children_html = ""
+    for child in node.children:
+        children_html += recursive_to_html(child)
+    return f"<{node.tag}>{children_html}</{node.tag}>"
+
+
+def old_props_to_html(props):
+    """
+    The old HTMLNode.props_to_html(), kept here as the baseline. It doesn't escape values.
+    """
+    b = ""
+    if props:
+        for key, value in props.items():
+            a = f'{key}="{value}" '
+            b += a
+    return b.strip()
+
+
+# The props of a typical page's elements: each is a new dict, as the parser builds them
+TYPICAL_PROPS = (
+    {"href": "https://boot.dev/docs"},
+    {"class": "nav-link", "href": "/blog/"},
+    {"src": "/images/dashboard.png", "alt": "Screenshot of the dashboard"},
+    {"href": "https://github.com/boot/issues", "class": "external", "target": "_blank"},
+)
+
+
+def time_props(props_to_html, rounds=200_000, repeats=5):
+    """
+    Return the fastest of repeats runs of props_to_html over rounds copies of TYPICAL_PROPS, in seconds.
+    """
+    batches = [[dict(props) for props in TYPICAL_PROPS] for _ in range(100)]
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(rounds // len(batches)):
+            for batch in batches:
+                for props in batch:
+                    props_to_html(props)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def old_text_node_to_html_node(text_node):
+    """
+    The old text_node_to_html_node(), kept here as the baseline. It doesn't escape the text.
+    """
+    text = text_node.raw_text
+    if text_node.text_type == TextType.PLAIN:
+        return LeafNode(tag=None, value=text) #type: ignore
+    elif text_node.text_type == TextType.LINK:
+        return LeafNode(tag="a", value=text, props={"href": text_node.url})
+    elif text_node.text_type == TextType.BOLD:
+        return LeafNode(tag="b", value=text)
+    elif text_node.text_type == TextType.ITALIC:
+        return LeafNode(tag="i", value=text)
+    elif text_node.text_type == TextType.CODE:
+        return LeafNode(tag="code", value=text)
+    else:
+        raise ValueError(f"Unsupported TextType: {text_node.text_type}")
+
+
+def time_text_nodes(converters, count=200_000, repeats=7):
+    """
+    Time each converter on count plain text nodes, in turns, and return the fastest run of each in seconds.
+
+    Timing them in turns within each repeat means a machine that slows down
+    during the run slows them all alike.
+    """
+    nodes = [TextNode(f"Plain text run {i} of a paragraph, the most common node.", TextType.PLAIN) for i in range(count)]
+    best = [float("inf")] * len(converters)
+    for _ in range(repeats):
+        for i, convert in enumerate(converters):
+            start = time.perf_counter()
+            for node in nodes:
+                convert(node)
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best
+
+
+def deep_tree(depth):
+    """
+    Build a chain of depth nested <div>s around one leaf (like nested lists/quotes).
+    """
+    node = LeafNode("span", "bottom")
+    for _ in range(depth):
+        node = ParentNode("div", [node])
+    return node
+
+
+def wide_tree(width):
+    """
+    Build one <ul> with width <li> leaves (like a huge list or table).
+    """
+    return ParentNode("ul", [LeafNode("li", "item") for _ in range(width)])
+
+
+def timed(render, tree):
+    """
+    Render tree once and return (seconds, output length), or the error name.
+    """
+    start = time.perf_counter()
+    try:
+        html = render(tree)
+    except RecursionError:
+        return "RecursionError"
+    return f"{time.perf_counter() - start:8.3f}s  ({len(html):,} chars)"
+
+
+def main():
+    """
+    Time the recursive baseline against the explicit-stack renderer, the old
+    attribute serializer against the cached one, and the old text node
+    conversion against the escaping one.
+    """
+    print(f"Python {sys.version.split()[0]}, recursion limit {sys.getrecursionlimit()}")
+    cases = [
+        ("10k levels deep", deep_tree(10_000)),
+        ("1M nodes wide", wide_tree(1_000_000)),
+    ]
+    for name, tree in cases:
+        print(name)
+        print(f"  recursive +=     {timed(recursive_to_html, tree)}")
+        print(f"  explicit stack   {timed(ParentNode.to_html, tree)}")
+    print(f"{len(TYPICAL_PROPS) * 200_000:,} props of typical elements")
+    print(f"  old props_to_html  {time_props(old_props_to_html):8.3f}s")
+    print(f"  attributes_to_html {time_props(attributes_to_html):8.3f}s")
+    old, new = time_text_nodes((old_text_node_to_html_node, text_node_to_html_node))
+    print("200,000 plain text nodes")
+    print(f"  old text_node_to_html_node {old:8.3f}s")
+    print(f"  text_node_to_html_node     {new:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
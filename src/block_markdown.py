@@ -0,0 +1,385 @@
+import re
+from enum import Enum
+
+from htmlnode import LeafNode, ParentNode, escape_html
+from extract_markdown_images import parse_link_definition
+from inline_html import text_to_html_nodes
+from inline_markdown import text_to_textnodes
+
+
+# The class `BlockType` defines an enumeration for the different kinds of markdown blocks.
+class BlockType(Enum):
+    """
+    Enumeration of block types for markdown parsing.
+
+    Attributes:
+        PARAGRAPH (str): Plain paragraph text.
+        HEADING (str): "# " to "###### " heading.
+        CODE (str): Fenced code block between ``` lines.
+        QUOTE (str): Every line starts with ">".
+        UNORDERED_LIST (str): Every line starts with "- " (or "* ").
+        ORDERED_LIST (str): Every line starts with "1. ", "2. ", ... in order.
+    """
+    PARAGRAPH = "paragraph"
+    HEADING = "heading"
+    CODE = "code"
+    QUOTE = "quote"
+    UNORDERED_LIST = "unordered_list"
+    ORDERED_LIST = "ordered_list"
+
+
+# Precompiled patterns used by block_to_block_type
+_HEADING = re.compile(r"#{1,6} ")
+# A line break followed by a line that does NOT have the required prefix
+_NON_QUOTE_LINE = re.compile(r"\n(?!>)")
+_NON_UNORDERED_ITEM = re.compile(r"\n(?![-*] )")
+_ORDERED_ITEM = re.compile(r"(\d+)\. ")
+
+
+def _iter_lines(source):
+    """
+    Yield the lines of source one at a time, without their line endings.
+
+    Args:
+        source (str | Iterable[str]): A whole markdown string, an open file, or any
+            iterable of lines.
+
+    Yields:
+        str: One line of text.
+    """
+    if isinstance(source, str):
+        # Walk the string with find() so it is never split into a list of all its lines
+        start = 0
+        while True:
+            end = source.find("\n", start)
+            if end == -1:
+                if start < len(source):
+                    yield source[start:].rstrip("\r")
+                return
+            yield source[start:end].rstrip("\r")
+            start = end + 1
+    else:
+        for line in source:
+            yield line.rstrip("\r\n")
+
+
+def markdown_to_blocks(source):
+    """
+    Split markdown into blocks (paragraphs, headings, lists, ...), lazily.
+
+    Blocks are separated by one or more blank lines. Each block is stripped of
+    leading and trailing whitespace, and empty blocks are dropped. A fenced code
+    block (```) is kept together even if it contains blank lines.
+
+    The source is read line by line and each block is yielded as soon as it is
+    complete, so memory use is bounded by the largest block rather than the
+    whole document.
+
+    Args:
+        source (str | Iterable[str]): A markdown string, an open file, or any iterable of lines.
+
+    Yields:
+        str: One block of markdown.
+
+    Examples:
+        >>> list(markdown_to_blocks("# Heading\\n\\nA paragraph\\non two lines\\n\\n- item"))
+        ['# Heading', 'A paragraph\\non two lines', '- item']
+    """
+    lines = []
+    in_fence = False
+
+    for line in _iter_lines(source):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and not line.strip():
+            # A blank line outside a code fence ends the current block
+            if lines:
+                block = "\n".join(lines).strip()
+                lines = []
+                if block:
+                    yield block
+            continue
+        lines.append(line)
+
+    if lines:
+        block = "\n".join(lines).strip()
+        if block:
+            yield block
+
+
+def blocks_to_textnodes(blocks):
+    """
+    Run the inline parser over each block, one block at a time.
+
+    Args:
+        blocks (Iterable[str]): Blocks of markdown, e.g. from markdown_to_blocks().
+
+    Yields:
+        list[TextNode]: The inline nodes of each block, in order.
+    """
+    for block in blocks:
+        yield text_to_textnodes(block)
+
+
+def _is_ordered_list(block):
+    """
+    Check that every line of block starts with "1. ", "2. ", ... in order.
+    """
+    expected = 1
+    start = 0
+    while True:
+        match = _ORDERED_ITEM.match(block, start)
+        if match is None or int(match.group(1)) != expected:
+            return False
+        start = block.find("\n", match.end())
+        if start == -1:
+            return True
+        start += 1
+        expected += 1
+
+
+def block_to_block_type(block):
+    """
+    Classify a block of markdown.
+
+    The first character of the block decides which single candidate type is
+    checked, and that check is one precompiled-regex scan over the block, so
+    most blocks (paragraphs) are classified after looking at one character.
+
+    Args:
+        block (str): One block, as produced by markdown_to_blocks().
+
+    Returns:
+        BlockType: The type of the block.
+
+    Examples:
+        >>> block_to_block_type("## Heading")
+        <BlockType.HEADING: 'heading'>
+        >>> block_to_block_type("1. one\\n2. two")
+        <BlockType.ORDERED_LIST: 'ordered_list'>
+    """
+    if not block:
+        return BlockType.PARAGRAPH
+    first = block[0]
+
+    if first == "#":
+        if _HEADING.match(block):
+            return BlockType.HEADING
+    elif first == "`":
+        if len(block) >= 6 and block.startswith("```") and block.endswith("```"):
+            return BlockType.CODE
+    elif first == ">":
+        if _NON_QUOTE_LINE.search(block) is None:
+            return BlockType.QUOTE
+    elif first == "-" or first == "*":
+        if block[1:2] == " " and _NON_UNORDERED_ITEM.search(block) is None:
+            return BlockType.UNORDERED_LIST
+    elif first == "1":
+        if _is_ordered_list(block):
+            return BlockType.ORDERED_LIST
+
+    return BlockType.PARAGRAPH
+
+
+def _inline_parent(tag, text, references=None):
+    """
+    Build the element tag around the inline HTML of text.
+    """
+    return ParentNode(tag, text_to_html_nodes(text, references))
+
+
+def _iter_list_items(block, marker_end, references=None):
+    """
+    Yield one <li> per line of a list block, with the marker cut off by marker_end(line).
+    """
+    for line in _iter_lines(block):
+        yield _inline_parent("li", line[marker_end(line):], references)
+
+
+def _strip_quote_marker(line):
+    """
+    Remove the leading ">" (and one following space) from a quote line.
+    """
+    line = line[1:]
+    return line[1:] if line.startswith(" ") else line
+
+
+def block_to_html_node(block, block_type=None, references=None):
+    """
+    Convert one block of markdown to its HTML element.
+
+    PARAGRAPH becomes <p>, HEADING <h1> to <h6>, CODE <pre><code>, QUOTE
+    <blockquote>, UNORDERED_LIST <ul> and ORDERED_LIST <ol> with one <li> per
+    line. The lines of paragraphs and quotes are joined with spaces. Inline
+    markdown, including nested emphasis, is parsed with text_to_html_nodes()
+    everywhere except in code blocks, whose text is only escaped.
+
+    Args:
+        block (str): One block, as produced by markdown_to_blocks().
+        block_type (BlockType, optional): The type of the block if it is already
+            known. Defaults to block_to_block_type(block).
+        references (dict[str, str], optional): Link definitions used to resolve
+            reference links and images. Defaults to None.
+
+    Returns:
+        ParentNode: The HTML element of the block.
+
+    Raises:
+        ValueError: If block_type is not a BlockType.
+    """
+    if block_type is None:
+        block_type = block_to_block_type(block)
+
+    if block_type is BlockType.PARAGRAPH:
+        return _inline_parent("p", " ".join(_iter_lines(block)), references)
+
+    if block_type is BlockType.HEADING:
+        level = _HEADING.match(block).end() - 1
+        return _inline_parent(f"h{level}", block[level + 1:], references)
+
+    if block_type is BlockType.CODE:
+        # Drop the opening fence line (and any language name on it) and the closing fence
+        newline = block.find("\n", 3, len(block) - 3)
+        code = block[newline + 1:-3] if newline != -1 else block[3:-3]
+        return ParentNode("pre", [LeafNode("code", escape_html(code))])
+
+    if block_type is BlockType.QUOTE:
+        return _inline_parent("blockquote", " ".join(map(_strip_quote_marker, _iter_lines(block))), references)
+
+    if block_type is BlockType.UNORDERED_LIST:
+        return ParentNode("ul", list(_iter_list_items(block, lambda line: 2, references)))
+
+    if block_type is BlockType.ORDERED_LIST:
+        return ParentNode("ol", list(_iter_list_items(block, lambda line: line.index(". ") + 2, references)))
+
+    raise ValueError(f"Unsupported BlockType: {block_type}")
+
+
+def strip_link_definitions(blocks, references):
+    """
+    Take the "[label]: url" link definitions out of blocks, adding them to references.
+
+    Definitions are recognised on the lines at the start of a block, so they
+    never interrupt a paragraph, and a block holding nothing but definitions is
+    dropped. Only blocks starting with "[" are looked at any closer.
+
+    Args:
+        blocks (Iterable[str]): Blocks of markdown, e.g. from markdown_to_blocks().
+        references (dict[str, str]): Index of normalized label -> url to add to.
+
+    Yields:
+        str: The blocks, without their definitions.
+    """
+    for block in blocks:
+        if not block.startswith("["):
+            yield block
+            continue
+        start = 0
+        while start < len(block):
+            newline = block.find("\n", start)
+            if newline == -1:
+                newline = len(block)
+            if not parse_link_definition(block[start:newline], references):
+                break
+            start = newline + 1
+        block = block[start:].strip() if start else block
+        if block:
+            yield block
+
+
+def extract_link_definitions(markdown):
+    """
+    Build the index of every "[label]: url" definition in a markdown document.
+
+    This is the first of two passes: the index is built once per document, and
+    every [text][label], [label][] or [label] reference is then resolved with a
+    single dict lookup, wherever in the document its definition is. Definitions
+    are found exactly as strip_link_definitions() finds them, so lines inside
+    code blocks or paragraphs are never indexed.
+
+    Args:
+        markdown (str): The document.
+
+    Returns:
+        dict[str, str]: Normalized label -> url.
+
+    Examples:
+        >>> extract_link_definitions("See [the docs][docs].\\n\\n[docs]: https://boot.dev")
+        {'docs': 'https://boot.dev'}
+    """
+    references = {}
+    for _ in strip_link_definitions(markdown_to_blocks(markdown), references):
+        pass
+    return references
+
+
+def iter_block_html_nodes(source, references=None):
+    """
+    Lazily yield the HTML element of each block of a markdown document.
+
+    Link definitions are taken out of the output as they stream past and added
+    to references, so in this single pass a reference only resolves if its
+    definition came first. markdown_to_html_node() reads the whole document
+    first to resolve definitions anywhere.
+
+    Args:
+        source (str | Iterable[str]): A markdown string, an open file, or any iterable of lines.
+        references (dict[str, str], optional): Link definitions known up front;
+            definitions found in source are added to it. Defaults to a new dict.
+
+    Yields:
+        ParentNode: The HTML element of each block, in document order.
+    """
+    if references is None:
+        references = {}
+    for block in strip_link_definitions(markdown_to_blocks(source), references):
+        yield block_to_html_node(block, references=references)
+
+
+def iter_document_html_nodes(markdown, partial=None):
+    """
+    Yield the HTML element of each block of a markdown document, resolving references anywhere in it.
+
+    The document is read twice, one block at a time: extract_link_definitions()
+    builds the index of every definition first, then the blocks are streamed
+    again, without their definitions, and converted with that index. No list
+    of all the blocks is ever held.
+
+    Args:
+        markdown (str | Iterable[str]): A markdown string, an open file, or any iterable of lines.
+        partial (callable, optional): Called with each block; a node it returns
+            replaces the block, and None converts the block as usual. Defaults to None.
+
+    Yields:
+        HTMLNode: The element of each block, in document order.
+    """
+    if not isinstance(markdown, str):
+        # A file or iterator can only be read once, and the index needs a pass of its own
+        markdown = "\n".join(_iter_lines(markdown))
+    references = extract_link_definitions(markdown)
+    for block in strip_link_definitions(markdown_to_blocks(markdown), {}):
+        node = None if partial is None else partial(block)
+        yield block_to_html_node(block, references=references) if node is None else node
+
+
+def markdown_to_html_node(markdown):
+    """
+    Convert a whole markdown document to one <div> ParentNode.
+
+    This takes two passes over the blocks, streamed by iter_document_html_nodes().
+    The first builds a dict index of every "[label]: url" link definition,
+    wherever it is in the document. The second classifies each block and parses its inline
+    text straight to HTMLNodes, resolving each [text][label] reference with a
+    single lookup in that index.
+
+    Args:
+        markdown (str | Iterable[str]): A markdown string, an open file, or any iterable of lines.
+
+    Returns:
+        ParentNode: A <div> with one child element per block.
+
+    Examples:
+        >>> markdown_to_html_node("# Title\\n\\nSome **bold** text").to_html()
+        '<div><h1>Title</h1><p>Some <b>bold</b> text</p></div>'
+    """
+    return ParentNode("div", list(iter_document_html_nodes(markdown)))
@@ -0,0 +1,216 @@
+import json
+import os
+from collections import defaultdict, deque
+from hashlib import blake2b
+
+
+# The manifest is kept inside the output directory it describes, so deleting
+# the output also forgets the manifest and the next build starts clean
+MANIFEST_NAME = ".build-manifest.json"
+
+# Bumped whenever the layout changes; a manifest of another version is ignored
+MANIFEST_VERSION = 3
+
+
+def file_hash(path):
+    """
+    Return a hex blake2b digest of the bytes of a file.
+
+    Args:
+        path (str): The file to hash.
+
+    Returns:
+        str: 32 hex digits.
+    """
+    digest = blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def page_entry(source_hash, template_path, partials_dir, data_dir, output_path):
+    """
+    Build the manifest record of one page.
+
+    A page is up to date when its record from the last build equals the one
+    built now, its output file still exists and none of the files it depends
+    on changed.
+
+    Args:
+        source_hash (str): file_hash() of the markdown source.
+        template_path (str): The template it is rendered into.
+        partials_dir (str): Where its {{> name }} partials are found.
+        data_dir (str): Where its {{ data.name.key }} files are found.
+        output_path (str): Where the page is written.
+
+    Returns:
+        dict[str, str]: The record, as stored in the manifest.
+    """
+    return {
+        "source_hash": source_hash,
+        "template": template_path,
+        "partials": partials_dir,
+        "data": data_dir,
+        "output": output_path,
+    }
+
+
+def empty_manifest():
+    """
+    Return a manifest with no pages, dependencies or static files, as if nothing had been built.
+    """
+    return {"version": MANIFEST_VERSION, "pages": {}, "dependencies": {}, "files": {}, "static": []}
+
+
+def dependents(dependencies, changed):
+    """
+    Find every node that depends on one of the changed files, directly or not.
+
+    The graph is walked backwards, breadth first, from the changed files, so
+    a partial used by a partial of the template reaches every page, while a
+    partial only one page includes reaches only that page.
+
+    Args:
+        dependencies (dict[str, list[str]]): Node -> the files it uses.
+        changed (Iterable[str]): The files that changed.
+
+    Returns:
+        set[str]: The nodes that depend on the changed files (not including them,
+            unless one depends on another).
+
+    Examples:
+        >>> graph = {"a.md": ["t.html"], "b.md": ["t.html", "p/ad.html"], "t.html": ["p/nav.html"]}
+        >>> sorted(dependents(graph, ["p/nav.html"]))
+        ['a.md', 'b.md', 't.html']
+        >>> sorted(dependents(graph, ["p/ad.html"]))
+        ['b.md']
+    """
+    users = defaultdict(list)
+    for node, paths in dependencies.items():
+        for path in paths:
+            users[path].append(node)
+    found = set()
+    queue = deque(changed)
+    while queue:
+        for node in users.get(queue.popleft(), ()):
+            if node not in found:
+                found.add(node)
+                queue.append(node)
+    return found
+
+
+def reachable(dependencies, roots):
+    """
+    Find every node the roots depend on, directly or not, and the roots themselves.
+
+    Args:
+        dependencies (dict[str, list[str]]): Node -> the files it uses.
+        roots (Iterable[str]): Where to start, e.g. the page sources.
+
+    Returns:
+        set[str]: The roots and every file they reach.
+    """
+    found = set(roots)
+    stack = list(found)
+    while stack:
+        for path in dependencies.get(stack.pop(), ()):
+            if path not in found:
+                found.add(path)
+                stack.append(path)
+    return found
+
+
+def load_manifest(path):
+    """
+    Read the manifest of the last build.
+
+    A missing, unreadable or outdated manifest is not an error: it just means
+    every page is rebuilt.
+
+    Args:
+        path (str): The manifest file.
+
+    Returns:
+        dict: {
+            "version": int,
+            "pages": {source path: page_entry()},
+            "dependencies": {page source or file: [files it uses]},
+            "files": {file in dependencies: file_hash()},
+            "static": [output path],
+        }
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty_manifest()
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return empty_manifest()
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """
+    Write the manifest, replacing the old one atomically.
+
+    The file is written next to its final path and renamed over it, so an
+    interrupted build never leaves a half-written manifest behind.
+
+    Args:
+        path (str): The manifest file.
+        manifest (dict): The manifest, as returned by load_manifest().
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def remove_output(path, output_dir):
+    """
+    Delete a generated file, and any directories of output_dir it leaves empty.
+
+    A file that is already gone is ignored.
+
+    Args:
+        path (str): The file to delete.
+        output_dir (str): The root of the generated site; never removed itself.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    root = os.path.abspath(output_dir)
+    directory = os.path.dirname(os.path.abspath(path))
+    while directory != root and directory.startswith(root + os.sep):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            # Not empty, so nothing above it is empty either
+            break
+        directory = os.path.dirname(directory)
+
+
+def sweep_outputs(output_dir, keep):
+    """
+    Delete every file in output_dir except those in keep, for when the manifest can't say what was generated.
+
+    Args:
+        output_dir (str): The root of the generated site.
+        keep (set[str]): The files to leave, as paths joined onto output_dir.
+
+    Returns:
+        list[str]: The deleted files, sorted.
+    """
+    removed = []
+    for directory, _, names in os.walk(output_dir):
+        for name in names:
+            path = os.path.join(directory, name)
+            if path not in keep:
+                removed.append(path)
+    removed.sort()
+    for path in removed:
+        remove_output(path, output_dir)
+    return removed
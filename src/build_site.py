@@ -0,0 +1,463 @@
+import math
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from htmlnode import LeafNode, ParentNode, escape_html
+from build_manifest import (
+    MANIFEST_NAME,
+    dependents,
+    empty_manifest,
+    file_hash,
+    load_manifest,
+    page_entry,
+    reachable,
+    remove_output,
+    save_manifest,
+    sweep_outputs,
+)
+from block_markdown import (
+    BlockType,
+    block_to_block_type,
+    iter_document_html_nodes,
+    markdown_to_blocks,
+)
+from templates import DEFAULT_DATA_DIR, DEFAULT_PARTIALS_DIR, PARTIAL_BLOCK, TemplateLoader, parse_template
+
+
+# Where main.py looks for the site by default, relative to the working directory
+DEFAULT_CONTENT_DIR = "content"
+DEFAULT_TEMPLATE_PATH = "template.html"
+DEFAULT_STATIC_DIR = "static"
+DEFAULT_OUTPUT_DIR = "public"
+
+# Chunks handed out per worker; more than one keeps the pool busy when some
+# chunks hold slower pages than others
+_CHUNKS_PER_WORKER = 4
+
+# The template loader and template path of each worker process, set once by _init_worker
+_worker_loader = None
+_worker_template_path = None
+
+
+def extract_title(markdown):
+    """
+    Return the text of the first "# " (h1) heading of a markdown document.
+
+    Blocks are streamed, so only the document up to the heading is split, and a
+    "# " line inside a code block is not mistaken for the title.
+
+    Args:
+        markdown (str | Iterable[str]): A markdown string, an open file, or any iterable of lines.
+
+    Returns:
+        str: The heading text, stripped of the "# " and surrounding whitespace.
+
+    Raises:
+        ValueError: If the document has no h1 heading.
+
+    Examples:
+        >>> extract_title("Intro\\n\\n# Hello  \\n\\n## Sub")
+        'Hello'
+    """
+    for block in markdown_to_blocks(markdown):
+        if block.startswith("# ") and block_to_block_type(block) is BlockType.HEADING:
+            return block[2:].strip()
+    raise ValueError("No h1 heading found")
+
+
+def page_to_html_node(markdown, loader=None, title=None):
+    """
+    Convert a page's markdown to one <div> ParentNode, expanding partial includes.
+
+    This is markdown_to_html_node(), except that a block holding nothing but
+    {{> name }} is replaced by the rendered partial, as raw HTML.
+
+    Args:
+        markdown (str): The markdown document.
+        loader (TemplateLoader, optional): Where partials are loaded from. Defaults to None
+            (includes are left as text).
+        title (str, optional): Escaped HTML for {{ Title }} inside the partials. Defaults to None.
+
+    Returns:
+        tuple[ParentNode, list[str]]: The page, and the partial files it includes directly.
+    """
+    partials = []
+
+    def include(block):
+        match = PARTIAL_BLOCK.fullmatch(block)
+        if match is None:
+            return None
+        path = loader.partial_path(match.group(1))
+        fragments = []
+        loader.write(loader.template(path), fragments, title, _including=(path,))
+        partials.append(path)
+        return LeafNode(None, "".join(fragments))
+
+    page = ParentNode("div", list(iter_document_html_nodes(markdown, include if loader is not None else None)))
+    return page, partials
+
+
+def write_page(markdown, pieces, sink, loader=None):
+    """
+    Render a markdown document into a parsed template, writing the HTML to sink.
+
+    The page body is streamed fragment by fragment with ParentNode.write_html(),
+    so the finished page is never held in memory as one string.
+
+    Args:
+        markdown (str): The markdown document.
+        pieces (list[tuple]): The template, as returned by parse_template().
+        sink (list | file-like): A list to append fragments to, or an object with write(str).
+        loader (TemplateLoader, optional): Where partials and data files are
+            loaded from. Defaults to a TemplateLoader() for the default directories.
+
+    Returns:
+        list[str]: The partial files the markdown includes directly.
+
+    Raises:
+        ValueError: If the document has no h1 heading, or a partial or data value is missing.
+    """
+    if loader is None:
+        loader = TemplateLoader()
+    title = escape_html(extract_title(markdown))
+    page, partials = page_to_html_node(markdown, loader, title)
+    loader.write(pieces, sink, title, page)
+    return partials
+
+
+def render_page(markdown, template, loader=None):
+    """
+    Render a markdown document into a template and return the whole page.
+
+    Args:
+        markdown (str): The markdown document.
+        template (str): The page template; see parse_template() for its placeholders.
+        loader (TemplateLoader, optional): See write_page().
+
+    Returns:
+        str: The HTML page.
+
+    Raises:
+        ValueError: If the document has no h1 heading, or a partial or data value is missing.
+
+    Examples:
+        >>> render_page("# Hi\\n\\nSome *text*", "<title>{{ Title }}</title>{{ Content }}")
+        '<title>Hi</title><div><h1>Hi</h1><p>Some <i>text</i></p></div>'
+    """
+    fragments = []
+    write_page(markdown, parse_template(template), fragments, loader)
+    return "".join(fragments)
+
+
+def generate_page(source_path, dest_path, template_path, loader):
+    """
+    Render one markdown file into its HTML output file, creating directories as needed.
+
+    The files the page was built from (the template and the partials the
+    markdown includes) are recorded as edges of source_path in loader.
+
+    Args:
+        source_path (str): The markdown file.
+        dest_path (str): The HTML file to write.
+        template_path (str): The page template.
+        loader (TemplateLoader): Loads the template, partials and data files.
+
+    Raises:
+        ValueError: If the page has no h1 heading, or a template, partial or data
+            value is missing; the message names the page.
+    """
+    with open(source_path, encoding="utf-8") as f:
+        markdown = f.read()
+    os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+    try:
+        with open(dest_path, "w", encoding="utf-8") as f:
+            partials = write_page(markdown, loader.template(template_path), f, loader)
+    except ValueError as error:
+        # Don't leave a half-written page behind
+        os.remove(dest_path)
+        raise ValueError(f"{source_path}: {error}") from error
+    loader.add_edges(source_path, [template_path] + partials)
+
+
+def find_pages(content_dir, output_dir):
+    """
+    Walk content_dir for markdown files and pair each with its output path.
+
+    content/blog/post.md is written to output/blog/post.html. Directories and
+    files are visited in sorted order, so builds are reproducible.
+
+    Args:
+        content_dir (str): The root of the markdown sources.
+        output_dir (str): The root of the generated site.
+
+    Yields:
+        tuple[str, str]: (source path, output path) for each page.
+    """
+    for root, dirs, files in os.walk(content_dir):
+        dirs.sort()
+        relative = os.path.relpath(root, content_dir)
+        for name in sorted(files):
+            stem, extension = os.path.splitext(name)
+            if extension != ".md":
+                continue
+            yield os.path.join(root, name), os.path.normpath(os.path.join(output_dir, relative, stem + ".html"))
+
+
+def copy_static(static_dir, output_dir):
+    """
+    Copy every file of static_dir to the same place under output_dir.
+
+    Files are copied with their modification times, so a file whose copy
+    already has the same size and mtime is skipped instead of copied again.
+
+    Args:
+        static_dir (str): The static files.
+        output_dir (str): The root of the generated site.
+
+    Returns:
+        list[str]: The output path of every static file, copied or not.
+    """
+    outputs = []
+    for root, dirs, files in os.walk(static_dir):
+        dirs.sort()
+        target = os.path.normpath(os.path.join(output_dir, os.path.relpath(root, static_dir)))
+        for name in sorted(files):
+            source_path, dest_path = os.path.join(root, name), os.path.join(target, name)
+            outputs.append(dest_path)
+            source = os.stat(source_path)
+            try:
+                dest = os.stat(dest_path)
+                if dest.st_size == source.st_size and dest.st_mtime_ns == source.st_mtime_ns:
+                    continue
+            except FileNotFoundError:
+                os.makedirs(target, exist_ok=True)
+            shutil.copy2(source_path, dest_path)
+    return outputs
+
+
+class BuildReport:
+    """
+    What a build_site() call did.
+
+    Attributes:
+        pages (list[str]): The output path of every page of the site, in the order the sources were found.
+        rendered (list[str]): The output paths of the pages rendered by this build.
+        removed (list[str]): Output files deleted because their source is gone.
+    """
+    __slots__ = ("pages", "rendered", "removed")
+
+    def __init__(self, pages, rendered, removed):
+        self.pages = pages
+        self.rendered = rendered
+        self.removed = removed
+
+    def __repr__(self):
+        return f"BuildReport({len(self.pages)} pages, {len(self.rendered)} rendered, {len(self.removed)} removed)"
+
+
+def _init_worker(template_path, partials_dir, data_dir):
+    """
+    Give the worker process its own TemplateLoader, so the template, partials
+    and data files are read once per worker rather than once per page.
+    """
+    global _worker_loader, _worker_template_path
+    _worker_loader = TemplateLoader(partials_dir, data_dir)
+    _worker_template_path = template_path
+
+
+def _generate_page_task(paths):
+    """
+    Render one (source path, output path) pair in a worker process.
+
+    Returns the output path and the dependency edges recorded while rendering it.
+    """
+    source_path, dest_path = paths
+    generate_page(source_path, dest_path, _worker_template_path, _worker_loader)
+    return dest_path, _worker_loader.take_edges()
+
+
+def default_chunksize(pages, workers):
+    """
+    Pick how many pages to send to a worker at a time.
+
+    Sending pages one by one costs a round trip to the pool per page; sending
+    them in a few big chunks leaves workers idle at the end of the build. This
+    aims for _CHUNKS_PER_WORKER chunks per worker.
+
+    Args:
+        pages (int): Number of pages to build.
+        workers (int): Number of worker processes.
+
+    Returns:
+        int: The chunk size, at least 1.
+    """
+    return max(1, math.ceil(pages / (workers * _CHUNKS_PER_WORKER)))
+
+
+def render_pages(pages, template_path, workers=None, chunksize=None, partials_dir=DEFAULT_PARTIALS_DIR,
+                 data_dir=DEFAULT_DATA_DIR):
+    """
+    Render (source path, output path) pairs, spread over a ProcessPoolExecutor.
+
+    Rendering a page is CPU-bound and independent of every other page, so pages
+    are handed out to worker processes in chunks. Each worker loads the
+    template, partials and data files once, when it first needs them.
+
+    Args:
+        pages (list[tuple[str, str]]): The pages to render, e.g. from find_pages().
+        template_path (str): The page template.
+        workers (int, optional): Worker processes. 1 renders in this process
+            without a pool. Defaults to os.cpu_count().
+        chunksize (int, optional): Pages sent to a worker at a time. Defaults to
+            default_chunksize().
+        partials_dir (str, optional): Where partials are found. Defaults to "partials".
+        data_dir (str, optional): Where data files are found. Defaults to "data".
+
+    Returns:
+        tuple[list[str], dict[str, list[str]]]: The output paths, in the order of
+            pages, and the dependency edges recorded while rendering: each page's
+            source and each template, partial or data file read -> the files it uses.
+
+    Raises:
+        ValueError: If workers or chunksize is less than 1, or a page can't be rendered.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    if workers == 1 or len(pages) <= 1:
+        loader = TemplateLoader(partials_dir, data_dir)
+        for source_path, dest_path in pages:
+            generate_page(source_path, dest_path, template_path, loader)
+        return [dest_path for _, dest_path in pages], loader.take_edges()
+
+    workers = min(workers, len(pages))
+    if chunksize is None:
+        chunksize = default_chunksize(len(pages), workers)
+    rendered, edges = [], {}
+    initargs = (template_path, partials_dir, data_dir)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        for dest_path, page_edges in executor.map(_generate_page_task, pages, chunksize=chunksize):
+            rendered.append(dest_path)
+            edges.update(page_edges)
+    return rendered, edges
+
+
+def build_site(content_dir=DEFAULT_CONTENT_DIR, template_path=DEFAULT_TEMPLATE_PATH, output_dir=DEFAULT_OUTPUT_DIR,
+               static_dir=DEFAULT_STATIC_DIR, workers=None, chunksize=None, full=False,
+               partials_dir=DEFAULT_PARTIALS_DIR, data_dir=DEFAULT_DATA_DIR, changed=None):
+    """
+    Build the site: copy the static files and render the markdown pages that changed.
+
+    The build keeps a manifest in output_dir (MANIFEST_NAME). It records, for
+    each source, a hash of its content, the template, the partials and data
+    directories and its output path, and a dependency graph recorded while
+    rendering: page -> template and included partials, template or partial ->
+    the partials and data files it uses. The hash of every file in the graph
+    is kept too.
+
+    A page is rendered again if its record differs from the last build's, its
+    output file is missing, or it depends, directly or through other files, on
+    a file whose hash changed; those pages are found by walking the graph
+    backwards from the changed files. The outputs of sources that were removed
+    are deleted; if the manifest can't be read, every file in output_dir this
+    build doesn't write is. The result is the same, byte for byte, as a clean
+    build.
+
+    Args:
+        content_dir (str, optional): The root of the markdown sources. Defaults to "content".
+        template_path (str, optional): The page template. Defaults to "template.html".
+        output_dir (str, optional): Where the site is written. Defaults to "public".
+        static_dir (str | None, optional): Files copied as they are into output_dir,
+            skipped if None or missing. Defaults to "static".
+        workers (int, optional): See render_pages(). Defaults to os.cpu_count().
+        chunksize (int, optional): See render_pages(). Defaults to default_chunksize().
+        full (bool, optional): Render every page, whatever the manifest says. The outputs
+            of removed sources are still deleted. Defaults to False.
+        partials_dir (str, optional): Where {{> name }} partials are found. Defaults to "partials".
+        data_dir (str, optional): Where {{ data.name.key }} data files are found. Defaults to "data".
+        changed (set[str], optional): Every file that may have changed since the last
+            build, e.g. from watch mode's snapshots. Only these are hashed again; the
+            hashes of all other sources and files are taken from the manifest.
+            Defaults to None (hash everything).
+
+    Returns:
+        BuildReport: The pages of the site, and which were rendered or removed.
+
+    Raises:
+        ValueError: If content_dir is not a directory, workers or chunksize is less
+            than 1, or a page can't be rendered.
+    """
+    # Checked before anything is deleted: a missing content directory would look
+    # like a site whose pages were all removed
+    if not os.path.isdir(content_dir):
+        raise ValueError(f"Content directory not found: {content_dir}")
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    # A manifest that is there but can't be used (corrupt, or of another version)
+    # no longer says what the last build wrote
+    unknown_outputs = previous == empty_manifest() and os.path.exists(manifest_path)
+    manifest = empty_manifest()
+
+    if static_dir is not None and os.path.isdir(static_dir):
+        manifest["static"] = copy_static(static_dir, output_dir)
+
+    # Templates, partials and data files that changed or were removed since the last build
+    hashes = {}
+    modified = []
+    for path, old_hash in ({} if full else previous["files"]).items():
+        if changed is not None and path not in changed:
+            hashes[path] = old_hash
+            continue
+        try:
+            hashes[path] = file_hash(path)
+        except FileNotFoundError:
+            modified.append(path)
+            continue
+        if hashes[path] != old_hash:
+            modified.append(path)
+    affected = dependents(previous["dependencies"], modified)
+
+    pages = list(find_pages(content_dir, output_dir))
+    stale = []
+    for source_path, dest_path in pages:
+        old_entry = previous["pages"].get(source_path)
+        if changed is not None and old_entry is not None and source_path not in changed:
+            source_hash = old_entry["source_hash"]
+        else:
+            source_hash = file_hash(source_path)
+        entry = page_entry(source_hash, template_path, partials_dir, data_dir, dest_path)
+        manifest["pages"][source_path] = entry
+        if full or old_entry != entry or source_path in affected or not os.path.exists(dest_path):
+            stale.append((source_path, dest_path))
+
+    # Delete what the last build wrote that this one no longer does
+    outputs = {dest_path for _, dest_path in pages}
+    outputs.update(manifest["static"])
+    if unknown_outputs:
+        removed = sweep_outputs(output_dir, outputs | {manifest_path})
+    else:
+        old_outputs = [entry["output"] for entry in previous["pages"].values()] + previous["static"]
+        removed = [path for path in old_outputs if path not in outputs]
+        for path in removed:
+            remove_output(path, output_dir)
+
+    rendered, edges = render_pages(stale, template_path, workers, chunksize, partials_dir, data_dir)
+
+    # Edges of pages and files not rendered or read this time still hold; keep the
+    # part of the graph the current pages reach
+    graph = {} if full else previous["dependencies"]
+    graph.update(edges)
+    for node in reachable(graph, manifest["pages"]):
+        if node in graph:
+            manifest["dependencies"][node] = graph[node]
+        if node not in manifest["pages"]:
+            manifest["files"][node] = hashes[node] if node in hashes else file_hash(node)
+
+    save_manifest(manifest_path, manifest)
+    return BuildReport([dest_path for _, dest_path in pages], rendered, removed)
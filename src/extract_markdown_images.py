@@ -1,9 +1,325 @@
-from textnode import TextNode, TextType
-from inline_markdown import split_nodes_delimiter
-from htmlnode import HTMLNode, LeafNode, ParentNode
 import re
 
-def extract_markdown_images(text):
+from textnode import TextType
+
+# The characters _match_brackets pairs up
+_BRACKET_CHARS = re.compile(r"[\[\]()]")
+
+def _match_brackets(text, start=0, end=None):
+    """
+    Pair every "[" with its "]" and every "(" with its ")" in text[start:end].
+
+    One left to right pass with a stack per bracket kind, so nested and balanced
+    brackets pair the way a reader would: in "[a [b] c](x_(y))" the first "["
+    closes at the "]" before "(", and that "(" closes at the last ")". Brackets
+    without a partner are left out.
+
+    Args:
+        text (str): The text to scan.
+        start (int, optional): Offset where scanning starts. Defaults to 0.
+        end (int, optional): Offset where scanning stops. Defaults to len(text).
+
+    Returns:
+        dict[int, int]: Offset of each paired opener mapped to the offset of its closer.
+    """
+    if end is None:
+        end = len(text)
+    closes = {}
+    square, round_ = [], []
+    for match in _BRACKET_CHARS.finditer(text, start, end):
+        char = match.group()
+        pos = match.start()
+        if char == "[":
+            square.append(pos)
+        elif char == "(":
+            round_.append(pos)
+        elif char == "]":
+            if square:
+                closes[square.pop()] = pos
+        elif round_:
+            closes[round_.pop()] = pos
+    return closes
+
+# An inline [label](url) with no brackets in the label and no parentheses in the
+# url, which is what nearly every link looks like. Its brackets always pair the
+# way _match_brackets would pair them, whatever comes before, so a match is the
+# span _bracket_span would find without pairing up the whole text first. The
+# quantifiers are possessive: each class stops at the delimiter after it, so
+# backtracking could never find another match anyway.
+_SIMPLE_SPAN = re.compile(r"\[([^\[\]]++)\]\(([^()]++)\)")
+# The same spans for whole-text extraction, with the cheaper classes of a plain
+# regex extractor: the label runs to the first "]" and the url to the first ")".
+# A match is a simple span if its label has no "[" and its url no "("; an opener
+# that starts no match at all is matched on its own, with empty groups.
+_SIMPLE_IMAGES = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)|!\[")
+_SIMPLE_LINKS = re.compile(r"\[([^\]]+)\]\(([^)]+)\)|\[")
+_SIMPLE_LINKS_AND_IMAGES = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)|\[([^\]]+)\]\(([^)]+)\)|!?\[")
+
+def _simple_span(text, pos, end):
+    """
+    Fast path of _bracket_span for a simple [label](url) at text[pos].
+
+    Returns:
+        tuple[int, str, int] | None: As for _bracket_span, or None if there is no
+            simple span at pos and _bracket_span has to decide.
+    """
+    match = _SIMPLE_SPAN.match(text, pos, end)
+    if match is None:
+        return None
+    return match.end(1), match.group(2), match.end()
+
+def _simple_links_among_images(text):
+    """
+    Fast path of extract_markdown_links for text that may hold images.
+
+    Returns:
+        list[tuple[str, str]] | None: The links, or None if some "[" or "![" of
+            text doesn't start a simple span and scan_brackets has to decide.
+    """
+    links = []
+    for alt, image_url, label, url in _SIMPLE_LINKS_AND_IMAGES.findall(text):
+        if image_url:
+            # An image is skipped whole, so no part of it is read as a link
+            if "[" in alt or "(" in image_url:
+                return None
+        elif not url or "[" in label or "(" in url:
+            return None
+        else:
+            links.append((label, url))
+    return links
+
+def normalize_link_label(label):
+    """
+    Normalize a reference label so "[Foo  Bar]" and "[foo bar]" find the same definition.
+
+    Labels are matched case-insensitively with runs of whitespace collapsed.
+
+    ```python
+    print(normalize_link_label("  Boot\tDEV "))
+    # "boot dev"
+    ```
+    """
+    return " ".join(label.split()).casefold()
+
+# A "[label]: url" definition on a line of its own, with an optional "title" that is ignored
+LINK_DEFINITION_PATTERN = re.compile(
+    r' {0,3}\[([^\]]+)\]:[ \t]*(?:<([^>]*)>|(\S+))(?:[ \t]+(?:"[^"]*"|\'[^\']*\'|\([^)]*\)))?[ \t]*'
+)
+
+def parse_link_definition(line, references):
+    """
+    Add the link definition on line to references, if line is one.
+
+    The first definition of a label wins, like in CommonMark.
+
+    Args:
+        line (str): One line of markdown.
+        references (dict[str, str]): Index of normalized label -> url to add to.
+
+    Returns:
+        bool: Whether line was a link definition.
+    """
+    match = LINK_DEFINITION_PATTERN.fullmatch(line)
+    if match is None:
+        return False
+    label = normalize_link_label(match.group(1))
+    if label and label not in references:
+        references[label] = match.group(2) if match.group(2) is not None else match.group(3)
+    return True
+
+def _bracket_span(text, pos, closes, image, references=None):
+    """
+    Check whether the "[" at text[pos] starts a complete link or image.
+
+    An inline [label](url) is tried first. With references, a full
+    [label][ref], collapsed [label][] or shortcut [label] reference is then
+    resolved with one lookup in the index.
+
+    Args:
+        text (str): The text being scanned.
+        pos (int): Offset of the "[".
+        closes (dict[int, int]): Bracket pairs from _match_brackets.
+        image (bool): Whether the "[" follows a "!"; images may have an empty label.
+        references (dict[str, str], optional): Normalized label -> url index from
+            extract_link_definitions. Defaults to None (inline links only).
+
+    Returns:
+        tuple[int, str, int] | None: (offset of the "]" closing the label, url,
+            offset just past the markup), or None if there is no link or image at pos.
+    """
+    label_end = closes.get(pos)
+    if label_end is None or (label_end == pos + 1 and not image):
+        return None
+    after = text[label_end + 1:label_end + 2]
+    if after == "(":
+        # The "(" must follow the "]" directly, and the url can't be empty
+        url_end = closes.get(label_end + 1)
+        if url_end is not None and url_end > label_end + 2:
+            return label_end, text[label_end + 2:url_end], url_end + 1
+    if not references:
+        return None
+
+    end = label_end + 1
+    ref = text[pos + 1:label_end]
+    if after == "[" and label_end + 1 in closes:
+        ref_end = closes[label_end + 1]
+        # A collapsed reference "[label][]" uses the label itself
+        if ref_end > label_end + 2:
+            ref = text[label_end + 2:ref_end]
+        end = ref_end + 1
+    url = references.get(normalize_link_label(ref))
+    if url is None:
+        return None
+    return label_end, url, end
+
+# Regex fragment matching where an autolink could start: the prefilter that keeps
+# every other position of ordinary prose from being looked at
+AUTOLINK_OPENERS = r"<|https?://|www\."
+# <scheme:...> and <user@example.com> autolinks
+_ANGLE_URL = re.compile(r"<([A-Za-z][A-Za-z0-9+.\-]{1,31}:[^\s<>]*)>")
+_ANGLE_EMAIL = re.compile(
+    r"<([\w.!#$%&'*+/=?^`{|}~-]+@[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?)*)>"
+)
+# A bare URL runs up to the next whitespace or "<"
+_BARE_URL = re.compile(r"(?:https?://|www\.)[^\s<]+")
+# Besides whitespace and the start of the text, a bare URL may only follow these
+_BEFORE_BARE_URL = frozenset("*_~(")
+# Punctuation at the end of a bare URL belongs to the sentence, not the URL
+_TRAILING_PUNCTUATION = frozenset("?!.,:*_~'\"")
+
+def may_contain_autolink(text, start=0, end=None):
+    """
+    Cheap check that text[start:end] could contain an autolink at all.
+
+    Three substring searches, so prose without "://", "www." or "<" can skip
+    autolink detection entirely instead of stopping at every "h" and "w".
+    """
+    if end is None:
+        end = len(text)
+    # Single characters are found with memchr, so look for the rare "<" and ":" first
+    return (
+        text.find("<", start, end) != -1
+        or (text.find(":", start, end) != -1 and text.find("://", start, end) != -1)
+        or text.find("www.", start, end) != -1
+    )
+
+def _autolink_at(text, pos, start=0, end=None):
+    """
+    Check whether an autolink starts at text[pos].
+
+    Recognises <https://...> (any scheme), <user@example.com> and bare
+    http://, https:// and www. URLs. A bare URL must start the text or follow
+    whitespace or one of *_~( and loses any trailing punctuation, or ")"
+    without a partner "(", so "(see https://boot.dev)." links just the URL.
+
+    Args:
+        text (str): The text being scanned.
+        pos (int): Offset of the "<", "h" or "w".
+        start (int, optional): Offset where the scanned range starts. Defaults to 0.
+        end (int, optional): Offset where the scanned range ends. Defaults to len(text).
+
+    Returns:
+        tuple[int, int, str, int] | None: (label start, label end, url, offset just
+            past the markup), or None if no autolink starts at pos.
+    """
+    if end is None:
+        end = len(text)
+    if text[pos] == "<":
+        match = _ANGLE_URL.match(text, pos, end)
+        if match is not None:
+            return match.start(1), match.end(1), match.group(1), match.end()
+        match = _ANGLE_EMAIL.match(text, pos, end)
+        if match is not None:
+            return match.start(1), match.end(1), "mailto:" + match.group(1), match.end()
+        return None
+
+    if pos > start and not (text[pos - 1].isspace() or text[pos - 1] in _BEFORE_BARE_URL):
+        return None
+    match = _BARE_URL.match(text, pos, end)
+    if match is None:
+        return None
+    stop = match.end()
+    # Count the parentheses once; trimming a ")" only updates the count
+    unmatched = text.count(")", pos, stop) - text.count("(", pos, stop)
+    while True:
+        char = text[stop - 1]
+        if char in _TRAILING_PUNCTUATION:
+            stop -= 1
+        elif char == ")" and unmatched > 0:
+            stop -= 1
+            unmatched -= 1
+        else:
+            break
+    www = text[pos] == "w"
+    # Something has to be left after the "www." or "://"
+    if stop <= (pos + 4 if www else text.index("://", pos) + 3):
+        return None
+    url = text[pos:stop]
+    return pos, stop, "http://" + url if www else url, stop
+
+def scan_brackets(text, start=0, end=None, images=True, links=True, references=None):
+    """
+    Find every ![alt](url) image and [text](url) link in text, in one linear pass.
+
+    Labels may contain balanced brackets ("![a [b]](x.png)") and URLs balanced
+    parentheses ("[wiki](https://en.wikipedia.org/wiki/Foo_(bar))"). The bracket
+    pairs are worked out once up front, so every "[" is checked in constant time
+    and no part of the text is rescanned, however many brackets never close.
+
+    Args:
+        text (str): The raw markdown text to scan.
+        start (int, optional): Offset where scanning starts. Defaults to 0.
+        end (int, optional): Offset where scanning stops. Defaults to len(text).
+        images (bool, optional): Whether to report images. Defaults to True.
+        links (bool, optional): Whether to report links. Defaults to True.
+        references (dict[str, str], optional): Link definitions from
+            extract_link_definitions, to also resolve reference links and
+            images. Defaults to None.
+
+    Returns:
+        list[tuple]: (kind, label, url, start, end) per match in document order,
+            where kind is TextType.IMAGE or TextType.LINK and text[start:end] is
+            the full markup. A "[" right after "!" is never a link.
+
+    ```python
+    text = "A ![cat](cat.png) and [docs](https://boot.dev)"
+    print(scan_brackets(text))
+    # [(TextType.IMAGE, "cat", "cat.png", 2, 17), (TextType.LINK, "docs", "https://boot.dev", 22, 46)]
+    ```
+    """
+    if end is None:
+        end = len(text)
+    spans = []
+    closes = None
+    pos = start
+    while True:
+        pos = text.find("[", pos, end)
+        if pos == -1:
+            return spans
+        image = pos > start and text[pos - 1] == "!"
+        if not image and not links:
+            pos += 1
+            continue
+        found = _simple_span(text, pos, end)
+        if found is None:
+            if closes is None:
+                closes = _match_brackets(text, pos, end)
+            found = _bracket_span(text, pos, closes, image, references)
+        if found is None:
+            pos += 1
+            continue
+        label_end, url, span_end = found
+        if image and not images:
+            # Skip the whole image, so no part of it is read as a link
+            pos = span_end
+            continue
+        if image:
+            spans.append((TextType.IMAGE, text[pos + 1:label_end], url, pos - 1, span_end))
+        else:
+            spans.append((TextType.LINK, text[pos + 1:label_end], url, pos, span_end))
+        pos = span_end
+
+def extract_markdown_images(text, references=None):
     """
     Create a function extract_markdown_images(text) that takes raw markdown text and returns a list of tuples. Each tuple should contain the alt text and the 
     URL of any markdown images. For example:
@@ -13,12 +329,22 @@ def extract_markdown_images(text):
     print(extract_markdown_images(text))
     # [("rick roll", "https://i.imgur.com/aKaOqIh.gif"), ("obi wan", "https://i.imgur.com/fJRm4Vk.jpeg")]
     ```
+
+    Pass the references index from extract_link_definitions to also resolve
+    ![alt][ref] images.
     """ 
-    pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-    matches = re.findall(pattern, text)
-    return matches
+    if "!" not in text:
+        return []
+    # Fast path: when every "![" starts a simple image, one findall is the answer
+    images = _SIMPLE_IMAGES.findall(text)
+    for label, url in images:
+        if not url or "[" in label or "(" in url:
+            break
+    else:
+        return images
+    return [(label, url) for _, label, url, _, _ in scan_brackets(text, links=False, references=references)]
 
-def extract_markdown_links(text):
+def extract_markdown_links(text, references=None):
     """
     Create a function extract_markdown_links(text) that takes raw markdown text and returns a list of tuples. Each tuple should contain the link text and the 
     URL of any markdown links. For example:
@@ -28,7 +354,68 @@ def extract_markdown_links(text):
     print(extract_markdown_links(text))
     # [("Google", "https://www.google.com"), ("GitHub", "https://github.com)]
     ```
+
+    Pass the references index from extract_link_definitions to also resolve
+    [text][ref], [ref][] and [ref] links.
     """ 
-    pattern = r'(?<!!)\[([^\]]+)\]\(([^)]+)\)'
-    matches = re.findall(pattern, text)
-    return matches
+    # Fast path: when every "[" starts a simple link or image, one findall is the answer
+    if "!" in text:
+        links = _simple_links_among_images(text)
+        if links is not None:
+            return links
+    else:
+        links = _SIMPLE_LINKS.findall(text)
+        for label, url in links:
+            if not url or "[" in label or "(" in url:
+                break
+        else:
+            return links
+    return [(label, url) for _, label, url, _, _ in scan_brackets(text, images=False, references=references)]
+
+def extract_markdown_image_spans(text, start=0, end=None, references=None):
+    """
+    Like extract_markdown_images, but also return where each image sits in text.
+
+    Each tuple is (alt, url, start, end) where text[start:end] is the full
+    ![alt](url) markup, so callers can slice the original text around matches
+    instead of rebuilding the markdown and searching for it again. Pass start
+    and end to search only text[start:end] without slicing it.
+
+    ```python
+    text = "A ![cat](cat.png) here"
+    print(extract_markdown_image_spans(text))
+    # [("cat", "cat.png", 2, 17)]
+    ```
+    """
+    return [span[1:] for span in scan_brackets(text, start, end, links=False, references=references)]
+
+def extract_markdown_link_spans(text, start=0, end=None, references=None):
+    """
+    Like extract_markdown_links, but also return where each link sits in text.
+
+    Each tuple is (link_text, url, start, end) where text[start:end] is the full
+    [link_text](url) markup. Image markup is never reported as a link. Pass
+    start and end to search only text[start:end] without slicing it.
+
+    ```python
+    text = "See [docs](https://boot.dev) now"
+    print(extract_markdown_link_spans(text))
+    # [("docs", "https://boot.dev", 4, 28)]
+    ```
+    """
+    return [span[1:] for span in scan_brackets(text, start, end, images=False, references=references)]
+
+def extract_markdown_images_and_links(text, references=None):
+    """
+    Return the images and links of text together, from a single scan.
+
+    Each tuple is (kind, label, url) with kind TextType.IMAGE or TextType.LINK,
+    in document order.
+
+    ```python
+    text = "![cat](cat.png) [docs](https://boot.dev)"
+    print(extract_markdown_images_and_links(text))
+    # [(TextType.IMAGE, "cat", "cat.png"), (TextType.LINK, "docs", "https://boot.dev")]
+    ```
+    """
+    return [span[:3] for span in scan_brackets(text, references=references)]
@@ -0,0 +1,399 @@
+import re
+import unicodedata
+from collections import defaultdict, deque
+
+from textnode import TextNode, TextType
+from htmlnode import TEXT_TYPE_TAGS, LeafNode, ParentNode, escape_html, text_node_to_html_node
+from extract_markdown_images import (
+    AUTOLINK_OPENERS,
+    _autolink_at,
+    _bracket_span,
+    _match_brackets,
+    _simple_span,
+    may_contain_autolink,
+)
+
+
+# Characters that can start inline syntax; everything else is literal text
+_SPECIAL = re.compile(r"[*_`!\[]")
+_SPECIAL_WITH_AUTOLINKS = re.compile(r"[*_`!\[]|" + AUTOLINK_OPENERS)
+_BACKTICK_RUNS = re.compile(r"`+")
+
+# Tag wrapped around text by a matched pair of one or two delimiter characters
+_EMPHASIS_TAGS = {1: TEXT_TYPE_TAGS[TextType.ITALIC], 2: TEXT_TYPE_TAGS[TextType.BOLD]}
+
+
+def _is_punctuation(char):
+    """
+    Check for ASCII or Unicode punctuation/symbol characters, as CommonMark defines them.
+    """
+    return unicodedata.category(char)[0] in "PS"
+
+
+class _Item:
+    """
+    One entry of the doubly linked list of inline pieces being built for a line.
+
+    Attributes:
+        value (str | HTMLNode): Literal text, or an already finished node.
+        prev (_Item | None): The previous piece.
+        next (_Item | None): The next piece.
+    """
+    __slots__ = ("value", "prev", "next")
+
+    def __init__(self, value, prev=None):
+        self.value = value
+        self.prev = prev
+        self.next = None
+
+
+class _Delimiter:
+    """
+    A run of "*" or "_" characters on the delimiter stack.
+
+    Attributes:
+        item (_Item): The text item holding the characters of the run not used yet.
+        char (str): "*" or "_".
+        length (int): Number of characters of the run not used yet.
+        original_length (int): Length of the run as written.
+        can_open (bool): Whether the run may open emphasis.
+        can_close (bool): Whether the run may close emphasis.
+        previous (_Delimiter | None): The delimiter below this one on the stack.
+        next (_Delimiter | None): The delimiter above this one on the stack.
+    """
+    __slots__ = ("item", "char", "length", "original_length", "can_open", "can_close", "previous", "next")
+
+    def __init__(self, item, char, length, can_open, can_close, previous):
+        self.item = item
+        self.char = char
+        self.length = length
+        self.original_length = length
+        self.can_open = can_open
+        self.can_close = can_close
+        self.previous = previous
+        self.next = None
+
+
+def _flanking(text, start, end):
+    """
+    Work out whether the delimiter run text[start:end] can open and/or close emphasis.
+
+    Args:
+        text (str): The line being parsed.
+        start (int): Offset of the first character of the run.
+        end (int): Offset just past the last character of the run.
+
+    Returns:
+        tuple[bool, bool]: (can_open, can_close)
+    """
+    # The start and end of the line count as whitespace
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    before_space, after_space = before.isspace(), after.isspace()
+    before_punct = not before_space and _is_punctuation(before)
+    after_punct = not after_space and _is_punctuation(after)
+
+    left_flanking = not after_space and (not after_punct or before_space or before_punct)
+    right_flanking = not before_space and (not before_punct or after_space or after_punct)
+
+    if text[start] == "*":
+        return left_flanking, right_flanking
+    # "_" doesn't open or close inside a word, so snake_case_names stay literal
+    return (
+        left_flanking and (not right_flanking or before_punct),
+        right_flanking and (not left_flanking or after_punct),
+    )
+
+
+def _code_span_closer(runs, length, after):
+    """
+    Find the next backtick run of exactly length characters starting at or after after.
+
+    Runs before after are discarded from the queue, so every run is looked at
+    once no matter how many openers fail to find a closer.
+
+    Args:
+        runs (dict[int, deque[tuple[int, int]]]): (start, end) of the backtick runs, by length.
+        length (int): Length of the opening run.
+        after (int): Offset just past the opening run.
+
+    Returns:
+        tuple[int, int] | None: (start, end) of the closing run, or None.
+    """
+    queue = runs[length]
+    while queue and queue[0][0] < after:
+        queue.popleft()
+    return queue[0] if queue else None
+
+
+def _items_to_nodes(first, stop):
+    """
+    Convert the items from first up to (not including) stop into HTMLNodes,
+    merging adjacent runs of literal text into one escaped LeafNode.
+    """
+    nodes = []
+    text = []
+    item = first
+    while item is not stop:
+        value = item.value
+        if type(value) is str:
+            text.append(value)
+        else:
+            if text:
+                nodes.append(LeafNode(None, escape_html("".join(text))))
+                text = []
+            nodes.append(value)
+        item = item.next
+    if text:
+        nodes.append(LeafNode(None, escape_html("".join(text))))
+    return nodes
+
+
+def _tokenize(text, references=None, autolinks=True):
+    """
+    Split text into a linked list of inline items and a stack of delimiter runs.
+
+    Code spans, images, links and autolinks are turned into finished LeafNodes here; every
+    "*" and "_" run becomes a text item with a _Delimiter pointing at it.
+
+    Args:
+        text (str): The line to parse.
+        references (dict[str, str], optional): Link definitions used to resolve
+            reference links and images. Defaults to None.
+        autolinks (bool, optional): Whether to turn <https://...> and bare URLs
+            into links. Defaults to True.
+
+    Returns:
+        tuple[_Item, _Delimiter | None]: The head of the item list (a sentinel
+            holding "") and the top of the delimiter stack.
+    """
+    head = tail = _Item("")
+    top = None
+    backtick_runs = closes = None
+    plain_start = pos = 0
+    # Ordinary prose without "://", "www." or "<" doesn't stop at every "h" and "w"
+    special = _SPECIAL_WITH_AUTOLINKS if autolinks and may_contain_autolink(text) else _SPECIAL
+
+    def append(value):
+        nonlocal tail
+        item = _Item(value, tail)
+        tail.next = item
+        tail = item
+        return item
+
+    while True:
+        match = special.search(text, pos)
+        if match is None:
+            break
+        start = match.start()
+        char = text[start]
+
+        if char == "*" or char == "_":
+            end = start + 1
+            while end < len(text) and text[end] == char:
+                end += 1
+            if start > plain_start:
+                append(text[plain_start:start])
+            can_open, can_close = _flanking(text, start, end)
+            item = append(text[start:end])
+            if can_open or can_close:
+                delimiter = _Delimiter(item, char, end - start, can_open, can_close, top)
+                if top is not None:
+                    top.next = delimiter
+                top = delimiter
+            pos = plain_start = end
+            continue
+
+        if char == "`":
+            if backtick_runs is None:
+                # Index every backtick run once, so closers are found in linear time overall
+                backtick_runs = defaultdict(deque)
+                for run in _BACKTICK_RUNS.finditer(text, start):
+                    backtick_runs[run.end() - run.start()].append(run.span())
+            end = start + 1
+            while end < len(text) and text[end] == "`":
+                end += 1
+            closer = _code_span_closer(backtick_runs, end - start, end)
+            if closer is None:
+                # An unmatched run is literal text
+                pos = end
+                continue
+            if start > plain_start:
+                append(text[plain_start:start])
+            append(text_node_to_html_node(TextNode(text[end:closer[0]], TextType.CODE)))
+            pos = plain_start = closer[1]
+            continue
+
+        if char in "<hw":
+            found = _autolink_at(text, start)
+            if found is None:
+                pos = start + 1
+                continue
+            label_start, label_end, url, span_end = found
+            if start > plain_start:
+                append(text[plain_start:start])
+            append(text_node_to_html_node(TextNode(text[label_start:label_end], TextType.LINK, url)))
+            pos = plain_start = span_end
+            continue
+
+        image = char == "!"
+        bracket = start + 1 if image else start
+        if image and text[bracket:bracket + 1] != "[":
+            pos = bracket
+            continue
+        found = _simple_span(text, bracket, len(text))
+        if found is None:
+            if closes is None:
+                # Pair up the brackets once, the first time they are needed
+                closes = _match_brackets(text, bracket)
+            found = _bracket_span(text, bracket, closes, image, references)
+        if found is None:
+            # Not a complete image/link; a "[" after "!" is never a link either
+            pos = bracket + 1
+            continue
+        label_end, url, span_end = found
+        if start > plain_start:
+            append(text[plain_start:start])
+        text_type = TextType.IMAGE if image else TextType.LINK
+        append(text_node_to_html_node(TextNode(text[bracket + 1:label_end], text_type, url)))
+        pos = plain_start = span_end
+
+    if len(text) > plain_start:
+        append(text[plain_start:])
+    return head, top
+
+
+def _remove_delimiter(delimiter):
+    """
+    Unlink delimiter from the delimiter stack.
+    """
+    if delimiter.previous is not None:
+        delimiter.previous.next = delimiter.next
+    if delimiter.next is not None:
+        delimiter.next.previous = delimiter.previous
+
+
+def _remove_item(item):
+    """
+    Unlink item from the item list (never the head sentinel).
+    """
+    item.prev.next = item.next
+    if item.next is not None:
+        item.next.prev = item.prev
+
+
+def _process_emphasis(top):
+    """
+    Match the delimiter runs on the stack and wrap the text between each pair in <i> or <b>.
+
+    This is the CommonMark "process emphasis" procedure. Closers are visited left
+    to right and each searches down the stack for an opener. When that search
+    fails, the place it stopped is remembered for closers of the same kind, so
+    the next search ends there instead of walking the same openers again; that
+    keeps the whole pass linear, even for thousands of unmatched delimiters.
+
+    Args:
+        top (_Delimiter | None): The top of the delimiter stack from _tokenize.
+    """
+    if top is None:
+        return
+    closer = top
+    while closer.previous is not None:
+        closer = closer.previous
+
+    # Lowest opener worth trying, per (char, closer.can_open, original_length % 3)
+    openers_bottom = {}
+
+    while closer is not None:
+        if not closer.can_close:
+            closer = closer.next
+            continue
+
+        key = (closer.char, closer.can_open, closer.original_length % 3)
+        bottom = openers_bottom.get(key)
+        opener = closer.previous
+        found = False
+        while opener is not None and opener is not bottom:
+            if opener.char == closer.char and opener.can_open:
+                # The "rule of 3": a run that can both open and close only pairs with
+                # another run if the sum of their lengths isn't a multiple of 3
+                odd_match = (
+                    (closer.can_open or opener.can_close)
+                    and closer.original_length % 3 != 0
+                    and (opener.original_length + closer.original_length) % 3 == 0
+                )
+                if not odd_match:
+                    found = True
+                    break
+            opener = opener.previous
+
+        if not found:
+            openers_bottom[key] = closer.previous
+            next_closer = closer.next
+            if not closer.can_open:
+                _remove_delimiter(closer)
+            closer = next_closer
+            continue
+
+        used = 2 if opener.length >= 2 and closer.length >= 2 else 1
+        opener.length -= used
+        closer.length -= used
+        opener_item, closer_item = opener.item, closer.item
+        opener_item.value = opener_item.value[used:]
+        closer_item.value = closer_item.value[used:]
+
+        # Replace everything between the two runs with one element
+        children = _items_to_nodes(opener_item.next, closer_item)
+        element = _Item(ParentNode(_EMPHASIS_TAGS[used], children), opener_item)
+        element.next = closer_item
+        opener_item.next = element
+        closer_item.prev = element
+
+        # Delimiters between the pair can no longer match anything
+        opener.next = closer
+        closer.previous = opener
+
+        if opener.length == 0:
+            _remove_item(opener_item)
+            _remove_delimiter(opener)
+        if closer.length == 0:
+            next_closer = closer.next
+            _remove_item(closer_item)
+            _remove_delimiter(closer)
+            closer = next_closer
+
+
+def text_to_html_nodes(text, references=None, autolinks=True):
+    """
+    Parse a line of inline markdown straight to HTMLNodes, with nested emphasis.
+
+    Unlike text_to_textnodes, emphasis may nest ("**bold _and italic_**") and
+    delimiters that never close are kept as literal text instead of raising.
+    Runs of "*" or "_" are resolved with the CommonMark delimiter-stack
+    algorithm: one character emphasises (<i>), two make it strong (<b>), and
+    "_" only works at word boundaries. Code spans (`code`, or ``code`` to
+    include a backtick), images, links and autolinks are recognised as before
+    and their contents are not parsed for emphasis.
+
+    The line is tokenized in one pass and the delimiters are matched in a
+    second pass that never revisits a failed search, so the work is linear in
+    the length of the line.
+
+    Args:
+        text (str): The raw markdown text to convert
+        references (dict[str, str], optional): Link definitions from
+            extract_link_definitions, to resolve [text][ref] links. Defaults to None.
+        autolinks (bool, optional): Turn <https://...> autolinks and bare
+            http(s):// and www. URLs into links. Defaults to True.
+
+    Returns:
+        list[HTMLNode]: LeafNodes for text, code, images and links, and
+            ParentNodes for (possibly nested) emphasis, in document order
+
+    Examples:
+        >>> "".join(node.to_html() for node in text_to_html_nodes("**bold _both_** *"))
+        '<b>bold <i>both</i></b> *'
+    """
+    head, top = _tokenize(text, references, autolinks)
+    _process_emphasis(top)
+    return _items_to_nodes(head.next, None)
@@ -1,25 +1,224 @@
-from textnode import TextNode, TextType
+import re
+from functools import lru_cache
 
+from textnode import TextNode, TextSpan, TextType
+from extract_markdown_images import (
+    AUTOLINK_OPENERS,
+    _autolink_at,
+    _bracket_span,
+    _match_brackets,
+    _simple_span,
+    may_contain_autolink,
+)
 
-def split_nodes_delimiter(old_nodes, delimiter, text_type):
+
+# Inline delimiters recognised by text_to_textnodes, mapped to the TextType they produce
+INLINE_DELIMITERS = {
+    "**": TextType.BOLD,
+    "_": TextType.ITALIC,
+    "`": TextType.CODE,
+}
+
+
+@lru_cache(maxsize=None)
+def _opener_pattern(delimiters, images, links, autolinks=False):
+    """
+    Build (once per combination) a regex that finds the next position where any
+    enabled inline syntax could start.
+
+    Args:
+        delimiters (tuple[str]): Delimiter strings to look for
+        images (bool): Whether "![" starts a candidate image
+        links (bool): Whether "[" starts a candidate link
+        autolinks (bool): Whether "<", "http(s)://" and "www." start a candidate autolink
+
+    Returns:
+        re.Pattern: Alternation of all openers, longest delimiters first
+    """
+    alternatives = [re.escape(d) for d in sorted(delimiters, key=len, reverse=True)]
+    if images:
+        alternatives.append(r"!\[")
+    if links:
+        alternatives.append(r"\[")
+    if autolinks:
+        alternatives.append(AUTOLINK_OPENERS)
+    return re.compile("|".join(alternatives))
+
+
+def _scan_inline(text, delimiters, images=False, links=False, start=0, end=None, references=None, autolinks=False):
+    """
+    Walk text once, left to right, and yield the spans of the final inline nodes.
+
+    At every step the earliest opener wins: a delimiter consumes everything up to
+    its matching closer, and "![" / "[" are checked for a complete image or link
+    at that exact offset, using bracket pairs worked out once per call (see
+    extract_markdown_images.scan_brackets). Text between recognised spans is PLAIN.
+
+    Args:
+        text (str): The raw markdown text to scan
+        delimiters (dict[str, TextType]): Enabled delimiters and the TextType each produces
+        images (bool): Whether to recognise ![alt](url)
+        links (bool): Whether to recognise [text](url)
+        start (int): Offset in text where scanning starts. Defaults to 0.
+        end (int, optional): Offset in text where scanning stops. Defaults to len(text).
+        references (dict[str, str], optional): Link definitions used to resolve
+            reference links and images. Defaults to None.
+        autolinks (bool): Whether to turn <https://...> and bare URLs into links. Defaults to False.
+
+    Yields:
+        tuple: (text_type, start, end, url) where text[start:end] is the node text
+
+    Raises:
+        ValueError: If a delimiter is opened but not closed (invalid markdown syntax)
+    """
+    if end is None:
+        end = len(text)
+    if autolinks and not may_contain_autolink(text, start, end):
+        # Ordinary prose: don't stop at every "h" and "w"
+        autolinks = False
+    opener = _opener_pattern(tuple(delimiters), images, links, autolinks)
+    plain_start = pos = start
+    closes = None
+
+    while True:
+        match = opener.search(text, pos, end)
+        if match is None:
+            break
+        token = match.group()
+        token_start = match.start()
+
+        if token in delimiters:
+            close = text.find(token, match.end(), end)
+            if close == -1:
+                raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{token}' in text: {text[start:end]}")
+            if token_start > plain_start:
+                yield (TextType.PLAIN, plain_start, token_start, None)
+            # Empty delimited sections ("``") produce no node
+            if close > match.end():
+                yield (delimiters[token], match.end(), close, None)
+            pos = plain_start = close + len(token)
+            continue
+
+        if token[-1] != "[":
+            # Only autolink openers are left
+            found = _autolink_at(text, token_start, start, end)
+            if found is None:
+                pos = token_start + 1
+                continue
+            label_start, label_end, url, span_end = found
+            if token_start > plain_start:
+                yield (TextType.PLAIN, plain_start, token_start, None)
+            yield (TextType.LINK, label_start, label_end, url)
+            pos = plain_start = span_end
+            continue
+
+        image = token == "!["
+        # "![" with images disabled is never a link
+        skipped_image = not image and token_start > start and text[token_start - 1] == "!"
+        bracket = match.end() - 1
+        found = _simple_span(text, bracket, end)
+        if found is None:
+            if closes is None:
+                # Pair up the brackets once, the first time they are needed
+                closes = _match_brackets(text, token_start, end)
+            found = _bracket_span(text, bracket, closes, image or skipped_image, references)
+        if found is None:
+            # Not a complete image/link, keep scanning after the opener
+            pos = match.end()
+            continue
+        label_end, url, span_end = found
+        if skipped_image:
+            # Skip the whole image, so no part of it is read as a link
+            pos = span_end
+            continue
+        if token_start > plain_start:
+            yield (TextType.PLAIN, plain_start, token_start, None)
+        yield (TextType.IMAGE if image else TextType.LINK, bracket + 1, label_end, url)
+        pos = plain_start = span_end
+
+    if end > plain_start:
+        yield (TextType.PLAIN, plain_start, end, None)
+
+
+def _node_source(node):
+    """
+    Return the buffer holding a node's text and the bounds of the text inside it.
+
+    Args:
+        node (TextNode): A plain or view-backed TextNode
+
+    Returns:
+        tuple: (source, start, end) with source[start:end] == node.text
+    """
+    raw = node.raw_text
+    if type(raw) is TextSpan:
+        return raw.source, raw.start, raw.end
+    return raw, 0, len(raw)
+
+
+def _split_delimiter_views(node, delimiter, text_type, views, append):
+    """
+    Split one PLAIN node on a delimiter inside its source buffer, without copying it first.
+
+    The view-aware half of split_nodes_delimiter: str.find walks from each
+    opener to its closer, so the pieces keep their offsets into the buffer.
+
+    Args:
+        node (TextNode): A PLAIN node, plain or view-backed
+        delimiter (str): The delimiter string to split on
+        text_type (TextType): The TextType of text between delimiters
+        views (bool): Whether to emit TextNode.view() nodes instead of copying each piece
+        append (callable): Called with each new node, in order
+
+    Raises:
+        ValueError: If a delimiter is opened but not closed
+    """
+    source, lo, hi = _node_source(node)
+    opening = source.find(delimiter, lo, hi)
+    if opening == -1:
+        append(node)
+        return
+    step = len(delimiter)
+    pieces = []
+    plain_start = lo
+    while opening != -1:
+        close = source.find(delimiter, opening + step, hi)
+        if close == -1:
+            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text: {source[lo:hi]}")
+        pieces.append((plain_start, opening, TextType.PLAIN))
+        pieces.append((opening + step, close, text_type))
+        plain_start = close + step
+        opening = source.find(delimiter, plain_start, hi)
+    pieces.append((plain_start, hi, TextType.PLAIN))
+    # Empty pieces, such as the text before a leading delimiter or inside "``", produce no node
+    for start, end, piece_type in pieces:
+        if end > start:
+            if views:
+                append(TextNode.view(source, start, end, piece_type))
+            else:
+                append(TextNode(source[start:end], piece_type))
+
+
+def split_nodes_delimiter(old_nodes, delimiter, text_type, views=False):
     """
     Split text nodes based on a delimiter, creating new nodes with different text types.
-    
+
     This function processes a list of TextNode objects and splits any PLAIN text nodes
     that contain the specified delimiter. Text between delimiters is converted to the
     specified text_type, while text outside delimiters remains PLAIN.
-    
+
     Args:
         old_nodes (list[TextNode]): List of TextNode objects to process
         delimiter (str): The delimiter string to split on (e.g., "`", "**", "_")
         text_type (TextType): The TextType to apply to text found between delimiters
-        
+        views (bool, optional): Emit TextNode.view() nodes instead of copying text. Defaults to False.
+
     Returns:
         list[TextNode]: A new list of TextNode objects with delimited text split out
-        
+
     Raises:
         ValueError: If a delimiter is opened but not closed (invalid markdown syntax)
-        
+
     Examples:
         >>> node = TextNode("This is text with a `code block` word", TextType.PLAIN)
         >>> new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
@@ -29,37 +228,103 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
         >>>     TextNode(" word", TextType.PLAIN)
         >>> # ]
     """
+    # One delimiter needs no opener regex: each occurrence alternately opens and
+    # closes, which is exactly where str.split cuts the text
     new_nodes = []
-    
+    append = new_nodes.append
+
     for old_node in old_nodes:
         # If the node is not PLAIN text, add it as-is (no splitting needed)
         if old_node.text_type != TextType.PLAIN:
-            new_nodes.append(old_node)
+            append(old_node)
             continue
-        
-        # Split the text by the delimiter
-        parts = old_node.text.split(delimiter)
-        
+
+        text = old_node.raw_text
+        if views or type(text) is TextSpan:
+            _split_delimiter_views(old_node, delimiter, text_type, views, append)
+            continue
+
+        parts = text.split(delimiter)
         # If there's only one part, no delimiter was found
         if len(parts) == 1:
-            new_nodes.append(old_node)
+            append(old_node)
             continue
-        
         # If there's an even number of parts, we have an unclosed delimiter
         if len(parts) % 2 == 0:
-            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text: {old_node.text}")
-        
-        # Process the parts: even indices are plain text, odd indices are delimited text
+            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text: {text}")
+        # Even indices are plain text, odd indices delimited text; empty parts produce no node
         for i, part in enumerate(parts):
-            # Skip empty strings
-            if part == "":
-                continue
-                
-            if i % 2 == 0:
-                # Even index: plain text
-                new_nodes.append(TextNode(part, TextType.PLAIN))
-            else:
-                # Odd index: delimited text (use the provided text_type)
-                new_nodes.append(TextNode(part, text_type))
-    
+            if part:
+                append(TextNode(part, text_type if i % 2 else TextType.PLAIN))
+
     return new_nodes
+
+
+def text_to_textnodes(text, views=False, references=None, autolinks=True):
+    """
+    Convert a line of raw markdown into its final list of TextNode objects.
+
+    Bold, italic, code, images, links and autolinks are all recognised in a
+    single left to right pass over the text, instead of chaining
+    split_nodes_delimiter three times followed by split_nodes_image and
+    split_nodes_link. Code spans and link URLs are taken literally, so a "_"
+    inside them does not start italics.
+
+    Args:
+        text (str): The raw markdown text to convert
+        views (bool, optional): Emit TextNode.view() nodes that point into text
+            instead of copying each piece. Defaults to False.
+        references (dict[str, str], optional): Link definitions from
+            extract_link_definitions, to resolve [text][ref] links. Defaults to None.
+        autolinks (bool, optional): Turn <https://...> autolinks and bare
+            http(s):// and www. URLs into LINK nodes. Defaults to True.
+
+    Returns:
+        list[TextNode]: The inline nodes, in document order
+
+    Raises:
+        ValueError: If a delimiter is opened but not closed (invalid markdown syntax)
+
+    Examples:
+        >>> text_to_textnodes("This is **bold** with a [link](https://boot.dev)")
+        >>> # Returns: [
+        >>>     TextNode("This is ", TextType.PLAIN),
+        >>>     TextNode("bold", TextType.BOLD),
+        >>>     TextNode(" with a ", TextType.PLAIN),
+        >>>     TextNode("link", TextType.LINK, "https://boot.dev")
+        >>> # ]
+    """
+    return list(iter_textnodes(text, views, references, autolinks))
+
+
+def iter_textnodes(text, views=False, references=None, autolinks=True):
+    """
+    Lazily yield the inline nodes of a line of raw markdown.
+
+    Generator form of text_to_textnodes, for pipelines that consume the nodes
+    one at a time and don't need the intermediate list.
+
+    Args:
+        text (str): The raw markdown text to convert
+        views (bool, optional): Yield TextNode.view() nodes that point into text
+            instead of copying each piece. Defaults to False.
+        references (dict[str, str], optional): Link definitions from
+            extract_link_definitions, to resolve [text][ref] links. Defaults to None.
+        autolinks (bool, optional): Turn <https://...> autolinks and bare
+            http(s):// and www. URLs into LINK nodes. Defaults to True.
+
+    Yields:
+        TextNode: The inline nodes, in document order
+
+    Raises:
+        ValueError: If a delimiter is opened but not closed (invalid markdown syntax)
+    """
+    spans = _scan_inline(
+        text, INLINE_DELIMITERS, images=True, links=True, references=references, autolinks=autolinks
+    )
+    if views:
+        for text_type, start, end, url in spans:
+            yield TextNode.view(text, start, end, text_type, url)
+    else:
+        for text_type, start, end, url in spans:
+            yield TextNode(text[start:end], text_type, url)
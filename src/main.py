@@ -1,24 +1,149 @@
-from textnode import TextNode, TextType
+import argparse
+import sys
+import time
 
-print("Hello World")
+from templates import DEFAULT_DATA_DIR, DEFAULT_PARTIALS_DIR
+from build_site import (
+    DEFAULT_CONTENT_DIR,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_STATIC_DIR,
+    DEFAULT_TEMPLATE_PATH,
+    build_site,
+)
+from watch import DEFAULT_INTERVAL, DEFAULT_QUIET, watch
+from serve import DEFAULT_HOST, DEFAULT_PORT, serve
 
-def main():
+
+def _positive_int(value):
+    """
+    argparse type for options that must be at least 1.
     """
-    Main entry point for the module.
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    Creates a TextNode with the text "Hello, World!", using TextType.PLAIN and the URL
-    "https://boot.dev", then prints the resulting node to standard output.
 
-    This function takes no arguments and returns None.
+def _positive_float(value):
+    """
+    argparse type for durations that must be above 0.
+    """
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be above 0, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    """
+    Parse the command line.
 
-    Side effects:
-    - Prints the TextNode representation to stdout.
+    Args:
+        argv (list[str], optional): The arguments, without the program name. Defaults to sys.argv[1:].
 
-    Raises:
-    - NameError: If TextNode or TextType are not defined in the current scope.
+    Returns:
+        argparse.Namespace: The command and its options.
     """
-    node = TextNode(text="Hello, World!", text_type=TextType.PLAIN, url="https://boot.dev")
-    print(node)
+    # Where the site's sources are, shared by every command
+    site = argparse.ArgumentParser(add_help=False)
+    site.add_argument("--content", default=DEFAULT_CONTENT_DIR, help="markdown sources (default: %(default)s)")
+    site.add_argument("--template", default=DEFAULT_TEMPLATE_PATH, help="page template (default: %(default)s)")
+    site.add_argument("--partials", default=DEFAULT_PARTIALS_DIR, help="{{> name }} partials (default: %(default)s)")
+    site.add_argument("--data", default=DEFAULT_DATA_DIR, help="{{ data.name.key }} JSON files (default: %(default)s)")
+    site.add_argument("--static", default=DEFAULT_STATIC_DIR, help="files copied as-is (default: %(default)s)")
+
+    # Where and how the commands that write the site render it
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="output directory (default: %(default)s)")
+    output.add_argument("--workers", type=_positive_int, help="worker processes (default: one per CPU)")
+    output.add_argument("--chunksize", type=_positive_int, help="pages sent to a worker at a time (default: automatic)")
+
+    parser = argparse.ArgumentParser(description="Static site generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build", parents=[site, output], help="render the markdown pages of the content directory that changed"
+    )
+    build.add_argument("--full", action="store_true", help="render every page, not only those that changed")
+
+    watcher = commands.add_parser("watch", parents=[site, output], help="build, then rebuild affected pages on every change")
+    watcher.add_argument(
+        "--interval", type=_positive_float, default=DEFAULT_INTERVAL, help="seconds between checks (default: %(default)s)"
+    )
+    watcher.add_argument(
+        "--quiet", type=_positive_float, default=DEFAULT_QUIET,
+        help="seconds without changes before rebuilding (default: %(default)s)",
+    )
+
+    server = commands.add_parser("serve", parents=[site], help="serve pages rendered on demand from memory")
+    server.add_argument("--host", default=DEFAULT_HOST, help="address to listen on (default: %(default)s)")
+    server.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    server.add_argument(
+        "--interval", type=_positive_float, default=DEFAULT_INTERVAL,
+        help="seconds between checks for changed files (default: %(default)s)",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Main entry point: run the command given on the command line.
+
+    Usage: python3 src/main.py build|watch|serve [--content DIR] [--template FILE] [--partials DIR]
+        [--data DIR] [--static DIR]
+        build: [--output DIR] [--workers N] [--chunksize N] [--full]
+        watch: [--output DIR] [--workers N] [--chunksize N] [--interval SECONDS] [--quiet SECONDS]
+        serve: [--host HOST] [--port PORT] [--interval SECONDS]
+
+    Args:
+        argv (list[str], optional): The arguments, without the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    args = parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        try:
+            report = build_site(
+                args.content, args.template, args.output, args.static, args.workers, args.chunksize, args.full,
+                args.partials, args.data,
+            )
+        except (OSError, ValueError) as error:
+            print(f"build failed: {error}", file=sys.stderr)
+            return 1
+        print(
+            f"built {len(report.pages):,} pages into {args.output} in {time.perf_counter() - start:.2f}s "
+            f"({len(report.rendered):,} rendered, {len(report.removed):,} removed)"
+        )
+
+    elif args.command == "watch":
+        print(f"watching {args.content}, {args.template}, {args.partials}, {args.data} and {args.static} (Ctrl+C to stop)")
+        try:
+            watch(
+                args.content, args.template, args.output, args.static, args.partials, args.data, args.workers,
+                args.chunksize, args.interval, args.quiet,
+            )
+        except KeyboardInterrupt:
+            pass
+
+    elif args.command == "serve":
+        def started(server):
+            host, port = server.server_address[:2]
+            print(f"serving {args.content} at http://{host}:{port}/ (Ctrl+C to stop)")
+
+        try:
+            serve(args.content, args.template, args.static, args.partials, args.data, args.host, args.port,
+                  args.interval, on_start=started)
+        except KeyboardInterrupt:
+            pass
+        except OSError as error:
+            print(f"serve failed: {error}", file=sys.stderr)
+            return 1
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,283 @@
+import mimetypes
+import os
+import posixpath
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from templates import DEFAULT_DATA_DIR, DEFAULT_PARTIALS_DIR, TemplateLoader
+from build_manifest import dependents
+from build_site import DEFAULT_CONTENT_DIR, DEFAULT_STATIC_DIR, DEFAULT_TEMPLATE_PATH, write_page
+from watch import DEFAULT_INTERVAL, diff_snapshots, snapshot
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+class SiteRenderer:
+    """
+    Render the pages of a site on demand and keep them in memory.
+
+    Each page is rendered the first time it is asked for, with the same
+    markdown -> ParentNode -> HTML pipeline as build_site(), and the bytes are
+    kept until one of the files it was built from changes. Those files are
+    tracked with the dependency edges the TemplateLoader records while
+    rendering, so a change to a partial drops only the pages that use it.
+    Nothing is written to disk.
+
+    Pages are safe to ask for from many threads: cached pages are returned
+    without waiting, and each page renders under its own lock, so one slow
+    page doesn't hold up the others.
+
+    Attributes:
+        content_dir (str): The root of the markdown sources.
+        template_path (str): The page template.
+        static_dir (str | None): Files served as they are.
+        loader (TemplateLoader): Keeps the template, partials and data files parsed.
+    """
+    __slots__ = (
+        "content_dir", "template_path", "static_dir", "loader", "_pages", "_graph", "_snapshot", "_lock", "_rendering",
+        "_generation",
+    )
+
+    def __init__(self, content_dir=DEFAULT_CONTENT_DIR, template_path=DEFAULT_TEMPLATE_PATH,
+                 static_dir=DEFAULT_STATIC_DIR, partials_dir=DEFAULT_PARTIALS_DIR, data_dir=DEFAULT_DATA_DIR):
+        self.content_dir = content_dir
+        self.template_path = template_path
+        self.static_dir = static_dir
+        self.loader = TemplateLoader(partials_dir, data_dir)
+        # Source path -> rendered page
+        self._pages = {}
+        # Source path or file -> the files it uses
+        self._graph = {}
+        self._snapshot = snapshot(self._watched())
+        # Guards _graph, _rendering, _generation and writes to _pages; held only briefly
+        self._lock = threading.Lock()
+        # Source path -> lock held while that page renders
+        self._rendering = {}
+        # Bumped by every invalidate(), so a render that overlapped one isn't cached
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._pages)
+
+    def _watched(self):
+        return (self.content_dir, self.template_path, self.loader.partials_dir, self.loader.data_dir)
+
+    def resolve(self, url_path):
+        """
+        Map the path of a URL to the file that answers it.
+
+        /blog/post.html, /blog/post and /blog/post/ (via index.md) are pages from
+        the content directory, as build_site() would write them; anything else is
+        looked up in the static directory.
+
+        Args:
+            url_path (str): The path part of the URL, still percent-encoded.
+
+        Returns:
+            tuple[str, str] | None: ("page", markdown path) or ("static", file path),
+                or None if nothing matches.
+        """
+        # Normalizing below "/" drops any "..", so the path can't leave the site
+        path = posixpath.normpath("/" + unquote(url_path)).lstrip("/")
+        if "\0" in path:
+            return None
+        if not path or url_path.endswith("/"):
+            path = posixpath.join(path, "index.html")
+        stem, extension = posixpath.splitext(path)
+        if extension in (".html", ""):
+            source_path = os.path.join(self.content_dir, *stem.split("/")) + ".md"
+            if os.path.isfile(source_path):
+                return "page", source_path
+        if self.static_dir is not None:
+            static_path = os.path.join(self.static_dir, *path.split("/"))
+            if os.path.isfile(static_path):
+                return "static", static_path
+        return None
+
+    def page(self, source_path):
+        """
+        Return a page's HTML, rendering it if it isn't cached.
+
+        Args:
+            source_path (str): The markdown file.
+
+        Returns:
+            bytes: The page, UTF-8 encoded.
+
+        Raises:
+            ValueError: If the page can't be rendered (no h1, a missing partial, ...).
+        """
+        # A cached page is a single dict lookup, never blocked by a render
+        html = self._pages.get(source_path)
+        if html is not None:
+            return html
+        with self._lock:
+            rendering = self._rendering.setdefault(source_path, threading.Lock())
+        # Requests for the same page wait for one render; other pages render alongside
+        with rendering:
+            html = self._pages.get(source_path)
+            if html is not None:
+                return html
+            generation = self._generation
+            loader = self.loader.fork()
+            with open(source_path, encoding="utf-8") as f:
+                markdown = f.read()
+            fragments = []
+            try:
+                partials = write_page(markdown, loader.template(self.template_path), fragments, loader)
+            except ValueError as error:
+                raise ValueError(f"{source_path}: {error}") from error
+            finally:
+                # Keep the edges of the files read, even for a page that failed
+                edges = loader.take_edges()
+                with self._lock:
+                    if self._generation == generation:
+                        self._graph.update(edges)
+                    else:
+                        # Files changed while rendering, so what this render parsed may be stale
+                        self.loader.forget(edges)
+            html = "".join(fragments).encode("utf-8")
+            with self._lock:
+                self._graph[source_path] = [self.template_path] + partials
+                if self._generation == generation:
+                    self._pages[source_path] = html
+            return html
+
+    def invalidate(self, changed):
+        """
+        Forget the cached pages built from any of the changed files, directly or not.
+
+        Args:
+            changed (Iterable[str]): Sources, templates, partials or data files that changed.
+
+        Returns:
+            int: How many cached pages were dropped.
+        """
+        changed = set(changed)
+        with self._lock:
+            self._generation += 1
+            self.loader.forget(changed)
+            dropped = 0
+            for node in changed | dependents(self._graph, changed):
+                if self._pages.pop(node, None) is not None:
+                    dropped += 1
+            return dropped
+
+    def refresh(self):
+        """
+        Snapshot the sources and invalidate whatever changed since the last refresh.
+
+        Returns:
+            set[str]: The files that changed.
+        """
+        latest = snapshot(self._watched())
+        changed = diff_snapshots(self._snapshot, latest)
+        self._snapshot = latest
+        if changed:
+            self.invalidate(changed)
+        return changed
+
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answer GET and HEAD requests from the server's SiteRenderer (server.site).
+    """
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        site = self.server.site
+        found = site.resolve(urlsplit(self.path).path)
+        if found is None:
+            self._send(HTTPStatus.NOT_FOUND, b"Not found", "text/plain; charset=utf-8", send_body)
+            return
+        kind, path = found
+        try:
+            if kind == "page":
+                body, content_type = site.page(path), "text/html; charset=utf-8"
+            else:
+                with open(path, "rb") as f:
+                    body = f.read()
+                content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        except (OSError, ValueError) as error:
+            # Show the error in the browser, where the writer is looking
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, str(error).encode("utf-8"), "text/plain; charset=utf-8",
+                       send_body)
+            return
+        self._send(HTTPStatus.OK, body, content_type, send_body)
+
+    def _send(self, status, body, content_type, send_body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(site, host=DEFAULT_HOST, port=DEFAULT_PORT, quiet=False):
+    """
+    Create a threaded HTTP server for site; call serve_forever() on it to start.
+
+    Args:
+        site (SiteRenderer): Renders the pages.
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on, 0 for any free port. Defaults to 8000.
+        quiet (bool, optional): Don't log each request to stderr. Defaults to False.
+
+    Returns:
+        ThreadingHTTPServer: The server, with .site and .quiet set.
+    """
+    server = ThreadingHTTPServer((host, port), SiteRequestHandler)
+    server.site = site
+    server.quiet = quiet
+    return server
+
+
+def serve(content_dir=DEFAULT_CONTENT_DIR, template_path=DEFAULT_TEMPLATE_PATH, static_dir=DEFAULT_STATIC_DIR,
+          partials_dir=DEFAULT_PARTIALS_DIR, data_dir=DEFAULT_DATA_DIR, host=DEFAULT_HOST, port=DEFAULT_PORT,
+          interval=DEFAULT_INTERVAL, on_start=None):
+    """
+    Serve the site from memory until interrupted, dropping pages whose files change.
+
+    A background thread snapshots the sources every interval seconds, like the
+    watch command does, and invalidates only the cached pages that depend on
+    the files that changed. The next request for such a page renders it again.
+
+    Args:
+        content_dir, template_path, static_dir, partials_dir, data_dir: As for build_site().
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on. Defaults to 8000.
+        interval (float, optional): Seconds between snapshots. Defaults to DEFAULT_INTERVAL.
+        on_start (callable, optional): Called with the server once it is listening. Defaults to None.
+    """
+    site = SiteRenderer(content_dir, template_path, static_dir, partials_dir, data_dir)
+    stop = threading.Event()
+
+    def poll():
+        while not stop.wait(interval):
+            site.refresh()
+
+    poller = threading.Thread(target=poll, daemon=True)
+    with make_server(site, host, port) as server:
+        if on_start is not None:
+            on_start(server)
+        poller.start()
+        try:
+            server.serve_forever()
+        finally:
+            stop.set()
+            poller.join()
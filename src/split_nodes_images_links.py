@@ -1,8 +1,70 @@
 from textnode import TextNode, TextType
-from extract_markdown_images import extract_markdown_images, extract_markdown_links
+from inline_markdown import _node_source
+from extract_markdown_images import scan_brackets
 
 
-def split_nodes_image(old_nodes):
+def _make_node(source, start, end, text_type, url, views):
+    """Build a node for source[start:end], as a view or as a copied string."""
+    if views:
+        return TextNode.view(source, start, end, text_type, url)
+    return TextNode(source[start:end], text_type, url)
+
+
+def _split_nodes_by_spans(old_nodes, images, links, views=False, references=None):
+    """
+    Split PLAIN nodes around the images and/or links found by scan_brackets.
+
+    The original text is scanned once and sliced once per match, so the cost is
+    linear in the length of the text no matter how many images or links it
+    contains.
+
+    Args:
+        old_nodes (list[TextNode]): List of TextNode objects to process
+        images (bool): Whether to split out images
+        links (bool): Whether to split out links
+        views (bool): Whether to emit TextNode.view() nodes instead of copying text
+        references (dict[str, str], optional): Link definitions to resolve references with
+
+    Returns:
+        list[TextNode]: New list with the matched markdown split into separate nodes
+    """
+    new_nodes = []
+
+    for node in old_nodes:
+        # If not a PLAIN node, add it unchanged
+        if node.text_type != TextType.PLAIN:
+            new_nodes.append(node)
+            continue
+
+        # Views are searched in place inside their source buffer
+        source, cursor, stop = _node_source(node)
+        spans = scan_brackets(source, cursor, stop, images, links, references)
+
+        # If nothing found, add the node unchanged
+        if not spans:
+            new_nodes.append(node)
+            continue
+
+        for text_type, label, url, start, end in spans:
+            # Add the text before the match (if not empty)
+            if start > cursor:
+                new_nodes.append(_make_node(source, cursor, start, TextType.PLAIN, None, views))
+            if views:
+                # The label sits right after the "![" or "["
+                label_start = start + (2 if text_type == TextType.IMAGE else 1)
+                new_nodes.append(TextNode.view(source, label_start, label_start + len(label), text_type, url))
+            else:
+                new_nodes.append(TextNode(label, text_type, url))
+            cursor = end
+
+        # Add any remaining text after the last match (if not empty)
+        if cursor < stop:
+            new_nodes.append(_make_node(source, cursor, stop, TextType.PLAIN, None, views))
+
+    return new_nodes
+
+
+def split_nodes_image(old_nodes, views=False, references=None):
     """
     Splits TextNodes containing image markdown into separate TextNodes.
     
@@ -13,6 +75,9 @@ def split_nodes_image(old_nodes):
     
     Args:
         old_nodes (list[TextNode]): List of TextNode objects to process
+        views (bool, optional): Emit TextNode.view() nodes instead of copying text. Defaults to False.
+        references (dict[str, str], optional): Link definitions from extract_link_definitions,
+            to also resolve reference-style markup. Defaults to None.
         
     Returns:
         list[TextNode]: New list with image markdown split into separate nodes
@@ -25,57 +90,24 @@ def split_nodes_image(old_nodes):
             TextNode("img", TextType.IMAGE, "url.png")
         ]
     """
-    new_nodes = []
-    
-    for node in old_nodes:
-        # If not a PLAIN node, add it unchanged
-        if node.text_type != TextType.PLAIN:
-            new_nodes.append(node)
-            continue
-            
-        # Extract all images from the text
-        images = extract_markdown_images(node.text)
-        
-        # If no images found, add the node unchanged
-        if not images:
-            new_nodes.append(node)
-            continue
-            
-        # Process the text and split around images
-        remaining_text = node.text
-        
-        for image_alt, image_url in images:
-            # Split the text at the image markdown
-            sections = remaining_text.split(f"![{image_alt}]({image_url})", 1)
-            
-            # Add the text before the image (if not empty)
-            if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.PLAIN))
-                
-            # Add the image node
-            new_nodes.append(TextNode(image_alt, TextType.IMAGE, image_url))
-            
-            # Continue with the remaining text after the image
-            remaining_text = sections[1] if len(sections) > 1 else ""
-        
-        # Add any remaining text after the last image (if not empty)
-        if remaining_text:
-            new_nodes.append(TextNode(remaining_text, TextType.PLAIN))
-    
-    return new_nodes
+    return _split_nodes_by_spans(old_nodes, images=True, links=False, views=views, references=references)
 
 
-def split_nodes_link(old_nodes):
+def split_nodes_link(old_nodes, views=False, references=None):
     """
     Splits TextNodes containing link markdown into separate TextNodes.
     
     Takes a list of TextNodes and splits any TEXT type nodes that contain
-    link markdown syntax ([text](url)) into multiple nodes:
+    link markdown syntax ([text](url), or [text][ref], [ref][] and [ref] when
+    references are given) into multiple nodes:
     - TEXT nodes for plain text portions
     - LINK nodes for the links
     
     Args:
         old_nodes (list[TextNode]): List of TextNode objects to process
+        views (bool, optional): Emit TextNode.view() nodes instead of copying text. Defaults to False.
+        references (dict[str, str], optional): Link definitions from extract_link_definitions,
+            to also resolve reference-style markup. Defaults to None.
         
     Returns:
         list[TextNode]: New list with link markdown split into separate nodes
@@ -88,41 +120,24 @@ def split_nodes_link(old_nodes):
             TextNode("link", TextType.LINK, "url.com")
         ]
     """
-    new_nodes = []
-    
-    for node in old_nodes:
-        # If not a PLAIN node, add it unchanged
-        if node.text_type != TextType.PLAIN:
-            new_nodes.append(node)
-            continue
-            
-        # Extract all links from the text
-        links = extract_markdown_links(node.text)
-        
-        # If no links found, add the node unchanged
-        if not links:
-            new_nodes.append(node)
-            continue
-            
-        # Process the text and split around links
-        remaining_text = node.text
-        
-        for link_text, link_url in links:
-            # Split the text at the link markdown
-            sections = remaining_text.split(f"[{link_text}]({link_url})", 1)
-            
-            # Add the text before the link (if not empty)
-            if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.PLAIN))
-                
-            # Add the link node
-            new_nodes.append(TextNode(link_text, TextType.LINK, link_url))
-            
-            # Continue with the remaining text after the link
-            remaining_text = sections[1] if len(sections) > 1 else ""
-        
-        # Add any remaining text after the last link (if not empty)
-        if remaining_text:
-            new_nodes.append(TextNode(remaining_text, TextType.PLAIN))
-    
-    return new_nodes
+    return _split_nodes_by_spans(old_nodes, images=False, links=True, views=views, references=references)
+
+
+def split_nodes_images_and_links(old_nodes, views=False, references=None):
+    """
+    Split out both images and links with a single scan of each node.
+
+    Gives the same result as split_nodes_link(split_nodes_image(old_nodes)),
+    except that a link whose text contains an image stays one link, without
+    building the intermediate list or scanning the text twice.
+
+    Args:
+        old_nodes (list[TextNode]): List of TextNode objects to process
+        views (bool, optional): Emit TextNode.view() nodes instead of copying text. Defaults to False.
+        references (dict[str, str], optional): Link definitions from extract_link_definitions,
+            to also resolve reference-style markup. Defaults to None.
+
+    Returns:
+        list[TextNode]: New list with image and link markdown split into separate nodes
+    """
+    return _split_nodes_by_spans(old_nodes, images=True, links=True, views=views, references=references)
@@ -0,0 +1,252 @@
+import json
+import os
+import re
+
+from htmlnode import escape_html
+
+
+# Where partials and data files are looked up by default, relative to the working directory
+DEFAULT_PARTIALS_DIR = "partials"
+DEFAULT_DATA_DIR = "data"
+
+# A partial name is a path below the partials directory, never one that climbs out of it
+_NAME = r"[\w-]+(?:/[\w-]+)*"
+
+# {{> partial }}, with or without spaces around the ">" and before the "}}"
+_PARTIAL = r"\{\{ ?> *(" + _NAME + r") *\}\}"
+
+# {{ Title }}, {{ Content }}, {{> partial }} and {{ data.file.key.path }}; the
+# closing "}}" takes the same optional spaces as in a partial
+_PLACEHOLDER = re.compile(
+    r"\{\{ (Title|Content) *\}\}|" + _PARTIAL + r"|\{\{ data\.([\w-]+)\.([\w-]+(?:\.[\w-]+)*) *\}\}"
+)
+
+# A markdown block that is nothing but a partial include
+PARTIAL_BLOCK = re.compile(_PARTIAL)
+
+# Kinds of template piece
+TEXT, TITLE, CONTENT, PARTIAL, DATA = "text", "title", "content", "partial", "data"
+
+
+def parse_template(template):
+    """
+    Split a template into literal text and the placeholders between it.
+
+    The placeholders are:
+        {{ Title }}             the page title
+        {{ Content }}           the page body
+        {{> footer }}           the partial partials/footer.html, itself a template
+        {{ data.site.author }}  the "author" key of data/site.json, escaped
+
+    Args:
+        template (str): The template text.
+
+    Returns:
+        list[tuple]: (kind, value) pieces in order: (TEXT, str), (TITLE, None),
+            (CONTENT, None), (PARTIAL, name) or (DATA, (file name, tuple of keys)).
+
+    Examples:
+        >>> parse_template("<h1>{{ Title }}</h1>{{> nav }}")
+        [('text', '<h1>'), ('title', None), ('text', '</h1>'), ('partial', 'nav')]
+    """
+    pieces = []
+    pos = 0
+    for match in _PLACEHOLDER.finditer(template):
+        if match.start() > pos:
+            pieces.append((TEXT, template[pos:match.start()]))
+        field, partial, data_file, keys = match.groups()
+        if field is not None:
+            pieces.append((TITLE if field == "Title" else CONTENT, None))
+        elif partial is not None:
+            pieces.append((PARTIAL, partial))
+        else:
+            pieces.append((DATA, (data_file, tuple(keys.split(".")))))
+        pos = match.end()
+    if len(template) > pos:
+        pieces.append((TEXT, template[pos:]))
+    return pieces
+
+
+class TemplateLoader:
+    """
+    Load templates, partials and data files on first use and keep them parsed.
+
+    Every file the loader parses records its dependency edges: the partial and
+    data files its placeholders name. Pages record theirs with add_edges(). The
+    build collects them with take_edges() to know what each page was built from.
+
+    Attributes:
+        partials_dir (str): Where {{> name }} finds name.html.
+        data_dir (str): Where {{ data.name.key }} finds name.json.
+        edges (dict[str, list[str]]): File -> files it uses, recorded since the
+            last take_edges().
+    """
+    __slots__ = ("partials_dir", "data_dir", "edges", "_templates", "_data")
+
+    def __init__(self, partials_dir=DEFAULT_PARTIALS_DIR, data_dir=DEFAULT_DATA_DIR):
+        self.partials_dir = partials_dir
+        self.data_dir = data_dir
+        self.edges = {}
+        self._templates = {}
+        self._data = {}
+
+    def fork(self):
+        """
+        Return a loader that shares this one's parsed files but records its own edges.
+
+        Renders running at the same time each use their own fork, so the edges
+        one takes are only those of the files it read. A file parsed by one fork
+        is seen by all the others, and forget() on any of them drops it for all.
+
+        Returns:
+            TemplateLoader: The new loader.
+        """
+        loader = TemplateLoader(self.partials_dir, self.data_dir)
+        loader._templates = self._templates
+        loader._data = self._data
+        return loader
+
+    def partial_path(self, name):
+        """
+        Return the path of the partial {{> name }}.
+        """
+        return os.path.join(self.partials_dir, name + ".html")
+
+    def data_path(self, name):
+        """
+        Return the path of the data file of {{ data.name.key }}.
+        """
+        return os.path.join(self.data_dir, name + ".json")
+
+    def dependencies(self, pieces):
+        """
+        Return the partial and data files that pieces name directly, in order, without repeats.
+        """
+        paths = {}
+        for kind, value in pieces:
+            if kind == PARTIAL:
+                paths[self.partial_path(value)] = None
+            elif kind == DATA:
+                paths[self.data_path(value[0])] = None
+        return list(paths)
+
+    def template(self, path):
+        """
+        Return the parsed template at path, reading it the first time it is asked for.
+
+        Args:
+            path (str): A template or partial file.
+
+        Returns:
+            list[tuple]: The pieces, as returned by parse_template().
+
+        Raises:
+            ValueError: If the file doesn't exist.
+        """
+        pieces = self._templates.get(path)
+        if pieces is None:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    pieces = parse_template(f.read())
+            except FileNotFoundError:
+                raise ValueError(f"Template not found: {path}") from None
+            self._templates[path] = pieces
+            self.edges[path] = self.dependencies(pieces)
+        return pieces
+
+    def data(self, name, keys):
+        """
+        Look up a value in a data file, reading the file the first time it is used.
+
+        Args:
+            name (str): The data file name, without ".json".
+            keys (tuple[str, ...]): The keys leading to the value in nested objects.
+
+        Returns:
+            str: The value, as text.
+
+        Raises:
+            ValueError: If the file doesn't exist or isn't JSON, or a key is missing.
+        """
+        path = self.data_path(name)
+        data = self._data.get(path)
+        if data is None:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                raise ValueError(f"Data file not found: {path}") from None
+            except ValueError as error:
+                raise ValueError(f"{path}: {error}") from None
+            self._data[path] = data
+            self.edges[path] = []
+        value = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                raise ValueError(f"{path} has no key {'.'.join(keys)}")
+            value = value[key]
+        return value if isinstance(value, str) else json.dumps(value)
+
+    def forget(self, paths):
+        """
+        Drop the parsed copies of paths, so they are read again the next time they are used.
+
+        Args:
+            paths (Iterable[str]): Templates, partials or data files that changed.
+        """
+        for path in paths:
+            self._templates.pop(path, None)
+            self._data.pop(path, None)
+
+    def add_edges(self, node, paths):
+        """
+        Record that node (e.g. a page's source file) was built from paths.
+        """
+        self.edges[node] = list(dict.fromkeys(paths))
+
+    def take_edges(self):
+        """
+        Return the edges recorded since the last call, and forget them.
+
+        Files stay parsed, so a file's edges are only reported by the call
+        after it was first read.
+
+        Returns:
+            dict[str, list[str]]: File -> files it uses.
+        """
+        edges, self.edges = self.edges, {}
+        return edges
+
+    def write(self, pieces, sink, title=None, page=None, _including=()):
+        """
+        Render parsed template pieces to sink, expanding partials recursively.
+
+        Args:
+            pieces (list[tuple]): The pieces, as returned by parse_template().
+            sink (list | file-like): A list to append fragments to, or an object with write(str).
+            title (str, optional): Escaped HTML for {{ Title }}. Defaults to None.
+            page (HTMLNode, optional): The node written for {{ Content }}. Defaults to None.
+
+        Raises:
+            ValueError: If a partial includes itself, a file or key is missing, or
+                a placeholder has no value to fill it.
+        """
+        write = sink.append if isinstance(sink, list) else sink.write
+        for kind, value in pieces:
+            if kind == TEXT:
+                write(value)
+            elif kind == TITLE:
+                if title is None:
+                    raise ValueError("{{ Title }} used where there is no title")
+                write(title)
+            elif kind == CONTENT:
+                if page is None:
+                    raise ValueError("{{ Content }} used where there is no content")
+                page.write_html(sink)
+            elif kind == PARTIAL:
+                path = self.partial_path(value)
+                if path in _including:
+                    raise ValueError(f"Partial includes itself: {' -> '.join(_including + (path,))}")
+                self.write(self.template(path), sink, title, page, _including + (path,))
+            else:
+                write(escape_html(self.data(*value)))
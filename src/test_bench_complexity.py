@@ -0,0 +1,98 @@
+import os
+import unittest
+
+from bench_complexity import INPUTS, MAX_SLOPE, TARGETS, TYPICAL, check_complexity, compare_with_baselines, fit_slope
+
+
+# Wall-clock growth swings when the machine is busy, so the timing tests only
+# run when asked for; bench.sh runs the same check through bench_complexity.py
+TIMING_TESTS = os.environ.get("SSG_TIMING_TESTS") == "1"
+
+
+class TestFitSlope(unittest.TestCase):
+    """
+    Unit tests for the log-log growth fit.
+    """
+
+    def test_linear_and_quadratic(self):
+        """Test that exact power laws fit their exponent"""
+        sizes = [1, 2, 4, 8, 16]
+        self.assertAlmostEqual(fit_slope(sizes, [3 * n for n in sizes]), 1.0)
+        self.assertAlmostEqual(fit_slope(sizes, [0.5 * n * n for n in sizes]), 2.0)
+
+    def test_zero_time(self):
+        """Test that readings below the timer resolution don't break the fit"""
+        self.assertAlmostEqual(fit_slope([1, 2, 4], [0.0, 0.0, 0.0]), 0.0)
+
+    @unittest.skipUnless(TIMING_TESTS, "timing test; set SSG_TIMING_TESTS=1 to run")
+    def test_flags_quadratic_parser(self):
+        """Test that a parser rescanning the rest of the text from every "[" is caught"""
+        def rescanning(text):
+            for i in range(len(text)):
+                for char in text[i:]:
+                    if char == "]":
+                        break
+
+        _, failures = check_complexity(
+            {"rescanning": rescanning}, {"open brackets": INPUTS["open brackets"]}, sizes=(250, 500, 1_000, 2_000)
+        )
+        self.assertEqual(len(failures), 1)
+
+
+class TestCompareWithBaselines(unittest.TestCase):
+    """
+    Unit tests for the comparison with the old regex extractors.
+    """
+
+    def test_reports_every_baseline(self):
+        """Test that each (new, old) pair is timed and reported by name"""
+        calls = []
+        baselines = {"pair": (lambda text: calls.append("new"), lambda text: calls.append("old"))}
+        results = compare_with_baselines(baselines, texts=TYPICAL[:1], calls=2, repeats=3)
+        self.assertEqual([name for name, _, _ in results], ["pair"])
+        self.assertEqual(calls.count("new"), 6)
+        self.assertEqual(calls.count("old"), 6)
+
+
+@unittest.skipUnless(TIMING_TESTS, "timing test; set SSG_TIMING_TESTS=1 to run")
+class TestParserComplexity(unittest.TestCase):
+    """
+    Check that every inline parser stays linear on every adversarial input.
+    """
+
+    SIZES = (1_000, 2_000, 4_000, 8_000)
+    # Stop growing an input early once it is clearly slow, to keep the suite fast
+    TIME_LIMIT = 0.05
+
+    def assertLinear(self, target_name):
+        _, failures = check_complexity({target_name: TARGETS[target_name]}, INPUTS, sizes=self.SIZES, time_limit=self.TIME_LIMIT)
+        self.assertEqual(
+            [(input_name, round(slope, 2)) for _, input_name, slope, _ in failures],
+            [],
+            f"super-linear growth (slope > {MAX_SLOPE})",
+        )
+
+    def test_split_nodes_delimiter(self):
+        self.assertLinear("split_nodes_delimiter")
+
+    def test_split_nodes_image(self):
+        self.assertLinear("split_nodes_image")
+
+    def test_split_nodes_link(self):
+        self.assertLinear("split_nodes_link")
+
+    def test_extract_markdown_images(self):
+        self.assertLinear("extract_markdown_images")
+
+    def test_extract_markdown_links(self):
+        self.assertLinear("extract_markdown_links")
+
+    def test_text_to_textnodes(self):
+        self.assertLinear("text_to_textnodes")
+
+    def test_text_to_html_nodes(self):
+        self.assertLinear("text_to_html_nodes")
+
+
+if __name__ == "__main__":
+    unittest.main()
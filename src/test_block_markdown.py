@@ -0,0 +1,279 @@
+import io
+import unittest
+
+from textnode import TextNode, TextType
+from htmlnode import ParentNode
+from block_markdown import (
+    BlockType,
+    block_to_block_type,
+    block_to_html_node,
+    blocks_to_textnodes,
+    extract_link_definitions,
+    iter_block_html_nodes,
+    iter_document_html_nodes,
+    markdown_to_blocks,
+    markdown_to_html_node,
+    strip_link_definitions,
+)
+
+
+class TestMarkdownToBlocks(unittest.TestCase):
+    """
+    Unit tests for the streaming markdown_to_blocks splitter.
+    """
+
+    def test_markdown_to_blocks(self):
+        """Test splitting a document into paragraph and list blocks"""
+        md = """
+This is **bolded** paragraph
+
+This is another paragraph with _italic_ text and `code` here
+This is the same paragraph on a new line
+
+- This is a list
+- with items
+"""
+        self.assertEqual(
+            list(markdown_to_blocks(md)),
+            [
+                "This is **bolded** paragraph",
+                "This is another paragraph with _italic_ text and `code` here\nThis is the same paragraph on a new line",
+                "- This is a list\n- with items",
+            ],
+        )
+
+    def test_extra_blank_lines(self):
+        """Test that runs of blank lines and whitespace-only lines separate blocks"""
+        md = "\n\n\nfirst\n\n\n\n  \nsecond\n\n"
+        self.assertEqual(list(markdown_to_blocks(md)), ["first", "second"])
+
+    def test_empty(self):
+        """Test that an empty document has no blocks"""
+        self.assertEqual(list(markdown_to_blocks("")), [])
+        self.assertEqual(list(markdown_to_blocks("\n \n")), [])
+
+    def test_crlf_line_endings(self):
+        """Test Windows line endings"""
+        self.assertEqual(list(markdown_to_blocks("a\r\nb\r\n\r\nc\r\n")), ["a\nb", "c"])
+
+    def test_code_fence_kept_together(self):
+        """Test that blank lines inside a code fence don't split it"""
+        md = "intro\n\n```\nline one\n\nline two\n```\n\noutro"
+        self.assertEqual(
+            list(markdown_to_blocks(md)),
+            ["intro", "```\nline one\n\nline two\n```", "outro"],
+        )
+
+    def test_file_input(self):
+        """Test reading blocks from a file object"""
+        f = io.StringIO("# Title\n\nBody text\n")
+        self.assertEqual(list(markdown_to_blocks(f)), ["# Title", "Body text"])
+
+    def test_is_lazy(self):
+        """Test that blocks are yielded before the whole input is read"""
+        consumed = []
+
+        def lines():
+            for line in ["one\n", "\n", "two\n", "\n", "three\n"]:
+                consumed.append(line)
+                yield line
+
+        blocks = markdown_to_blocks(lines())
+        self.assertEqual(next(blocks), "one")
+        self.assertEqual(len(consumed), 2)
+
+    def test_blocks_to_textnodes(self):
+        """Test feeding blocks to the inline parser one by one"""
+        md = "Some **bold**\n\nA [link](https://boot.dev)"
+        self.assertEqual(
+            list(blocks_to_textnodes(markdown_to_blocks(md))),
+            [
+                [TextNode("Some ", TextType.PLAIN), TextNode("bold", TextType.BOLD)],
+                [TextNode("A ", TextType.PLAIN), TextNode("link", TextType.LINK, "https://boot.dev")],
+            ],
+        )
+
+    def test_extract_link_definitions(self):
+        """Test indexing definitions, first one winning, from the start of blocks only"""
+        text = (
+            "Intro [docs][d]\n\n"
+            "[d]: https://boot.dev/docs\n"
+            "  [Logo Image]: <logo.png> \"The logo\"\n"
+            "[D]: https://ignored.example\n"
+            "not [a]: definition"
+        )
+        self.assertDictEqual(
+            extract_link_definitions(text),
+            {"d": "https://boot.dev/docs", "logo image": "logo.png"},
+        )
+
+    def test_extract_link_definitions_skips_code(self):
+        """Test that definition-like lines in code blocks and paragraphs aren't indexed"""
+        text = "```\n[code]: https://not.a.link\n```\n\nText\n[para]: https://nope\n\n[real]: https://boot.dev"
+        self.assertDictEqual(extract_link_definitions(text), {"real": "https://boot.dev"})
+
+    def test_strip_link_definitions_empty_block(self):
+        """Test that an empty block from another source is passed through, not an IndexError"""
+        references = {}
+        blocks = list(strip_link_definitions(["", "[a]: /a", "text"], references))
+        self.assertListEqual(blocks, ["", "text"])
+        self.assertDictEqual(references, {"a": "/a"})
+
+
+class TestBlockToBlockType(unittest.TestCase):
+    """
+    Unit tests for block_to_block_type.
+    """
+
+    def test_headings(self):
+        """Test one to six # followed by a space"""
+        for level in range(1, 7):
+            self.assertEqual(block_to_block_type("#" * level + " Heading"), BlockType.HEADING)
+        self.assertEqual(block_to_block_type("####### Too deep"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("#NoSpace"), BlockType.PARAGRAPH)
+
+    def test_code(self):
+        """Test fenced code blocks"""
+        self.assertEqual(block_to_block_type("```\nprint('hi')\n```"), BlockType.CODE)
+        self.assertEqual(block_to_block_type("```\nunterminated"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("```"), BlockType.PARAGRAPH)
+
+    def test_quote(self):
+        """Test that every line must start with >"""
+        self.assertEqual(block_to_block_type("> one\n> two\n>three"), BlockType.QUOTE)
+        self.assertEqual(block_to_block_type("> one\ntwo"), BlockType.PARAGRAPH)
+
+    def test_unordered_list(self):
+        """Test that every line must start with "- " """
+        self.assertEqual(block_to_block_type("- one\n- two"), BlockType.UNORDERED_LIST)
+        self.assertEqual(block_to_block_type("* one\n* two"), BlockType.UNORDERED_LIST)
+        self.assertEqual(block_to_block_type("- one\ntwo"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("-one"), BlockType.PARAGRAPH)
+
+    def test_ordered_list(self):
+        """Test that items must be numbered 1, 2, 3, ... in order"""
+        items = "\n".join(f"{i}. item" for i in range(1, 13))
+        self.assertEqual(block_to_block_type(items), BlockType.ORDERED_LIST)
+        self.assertEqual(block_to_block_type("1. one\n3. three"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("2. two"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type("1. one\ntwo"), BlockType.PARAGRAPH)
+
+    def test_paragraph(self):
+        """Test plain text and the empty block"""
+        self.assertEqual(block_to_block_type("Just some text\nover two lines"), BlockType.PARAGRAPH)
+        self.assertEqual(block_to_block_type(""), BlockType.PARAGRAPH)
+
+
+class TestMarkdownToHTMLNode(unittest.TestCase):
+    """
+    Unit tests for the markdown_to_html_node pipeline.
+    """
+
+    def test_paragraphs(self):
+        """Test that paragraph lines are joined and inline markdown is parsed"""
+        md = """
+This is **bolded** paragraph
+text in a p
+tag here
+
+This is another paragraph with _italic_ text and `code` here
+"""
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p>"
+            "<p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>",
+        )
+
+    def test_codeblock(self):
+        """Test that code blocks are escaped but not parsed"""
+        md = """
+```
+This is text that _should_ remain
+the **same** <even> with inline stuff
+```
+"""
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><pre><code>This is text that _should_ remain\n"
+            "the **same** &lt;even&gt; with inline stuff\n</code></pre></div>",
+        )
+
+    def test_headings_and_quote(self):
+        """Test heading levels and joined quote lines"""
+        md = "# One\n\n### Three with [link](https://boot.dev)\n\n> quoted _text_\n>more"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            '<div><h1>One</h1><h3>Three with <a href="https://boot.dev">link</a></h3>'
+            "<blockquote>quoted <i>text</i> more</blockquote></div>",
+        )
+
+    def test_lists(self):
+        """Test unordered and ordered lists"""
+        md = "- first **item**\n- second\n\n1. one\n2. ![img](a.png)"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><ul><li>first <b>item</b></li><li>second</li></ul>"
+            '<ol><li>one</li><li><img src="a.png" alt="img"></li></ol></div>',
+        )
+
+    def test_nested_emphasis(self):
+        """Test nested emphasis and literal unmatched delimiters inside blocks"""
+        md = "# A **bold _title_**\n\n- 2 * 3 = 6"
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            "<div><h1>A <b>bold <i>title</i></b></h1><ul><li>2 * 3 = 6</li></ul></div>",
+        )
+
+    def test_reference_links(self):
+        """Test that definitions anywhere in the document resolve and aren't rendered"""
+        md = (
+            "Read [the docs][docs] and [Boot.dev].\n\n"
+            "- ![logo][]\n\n"
+            "[docs]: https://boot.dev/docs\n"
+            "[boot.dev]: https://boot.dev\n"
+            "[logo]: logo.png"
+        )
+        self.assertEqual(
+            markdown_to_html_node(md).to_html(),
+            '<div><p>Read <a href="https://boot.dev/docs">the docs</a> and <a href="https://boot.dev">Boot.dev</a>.</p>'
+            '<ul><li><img src="logo.png" alt="logo"></li></ul></div>',
+        )
+
+    def test_streaming_references_need_definition_first(self):
+        """Test that the single-pass iterator only resolves definitions it has already seen"""
+        md = "[a]: /a\n\n[a] and [b]\n\n[b]: /b"
+        html = "".join(node.to_html() for node in iter_block_html_nodes(md))
+        self.assertEqual(html, '<p><a href="/a">a</a> and [b]</p>')
+
+    def test_document_references_resolve_anywhere(self):
+        """Test that the two-pass iterator resolves definitions after their use, from a file too"""
+        md = "[a] and [b]\n\n[b]: /b\n\n[a]: /a\n"
+        for source in (md, io.StringIO(md)):
+            html = "".join(node.to_html() for node in iter_document_html_nodes(source))
+            self.assertEqual(html, '<p><a href="/a">a</a> and <a href="/b">b</a></p>')
+
+    def test_document_partial_hook(self):
+        """Test that a node returned by the partial hook replaces its block"""
+        def partial(block):
+            return ParentNode("nav", []) if block == "NAV" else None
+
+        html = "".join(node.to_html() for node in iter_document_html_nodes("NAV\n\ntext", partial))
+        self.assertEqual(html, "<nav></nav><p>text</p>")
+
+    def test_empty_document(self):
+        """Test that an empty document is an empty div"""
+        self.assertEqual(markdown_to_html_node("").to_html(), "<div></div>")
+
+    def test_block_to_html_node(self):
+        """Test converting a single block with a known type"""
+        node = block_to_html_node("- a\n- b", BlockType.UNORDERED_LIST)
+        self.assertEqual(node.to_html(), "<ul><li>a</li><li>b</li></ul>")
+
+    def test_file_input(self):
+        """Test converting straight from a file object"""
+        f = io.StringIO("## Title\n\nBody & more\n")
+        self.assertEqual(markdown_to_html_node(f).to_html(), "<div><h2>Title</h2><p>Body &amp; more</p></div>")
+
+
+if __name__ == "__main__":
+    unittest.main()
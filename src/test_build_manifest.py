@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+from build_manifest import (
+    dependents,
+    empty_manifest,
+    load_manifest,
+    reachable,
+    remove_output,
+    save_manifest,
+    sweep_outputs,
+)
+
+
+GRAPH = {
+    "index.md": ["template.html"],
+    "post.md": ["template.html", "partials/ad.html"],
+    "template.html": ["partials/nav.html"],
+    "partials/nav.html": ["data/site.json"],
+    "partials/ad.html": [],
+    "data/site.json": [],
+}
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """
+    Unit tests for walking the dependency graph.
+    """
+
+    def test_dependents(self):
+        """Test that only the nodes depending on a changed file are found"""
+        self.assertEqual(dependents(GRAPH, ["partials/ad.html"]), {"post.md"})
+        self.assertEqual(
+            dependents(GRAPH, ["data/site.json"]),
+            {"partials/nav.html", "template.html", "index.md", "post.md"},
+        )
+        self.assertEqual(dependents(GRAPH, ["partials/unknown.html"]), set())
+
+    def test_dependents_with_cycle(self):
+        """Test that a cycle in the graph doesn't loop forever"""
+        self.assertEqual(dependents({"a": ["b"], "b": ["a"]}, ["a"]), {"a", "b"})
+
+    def test_reachable(self):
+        """Test that everything a page uses, directly or not, is reached"""
+        self.assertEqual(
+            reachable(GRAPH, ["index.md"]),
+            {"index.md", "template.html", "partials/nav.html", "data/site.json"},
+        )
+
+
+class TestManifestFile(unittest.TestCase):
+    """
+    Unit tests for reading, writing and cleaning up after the manifest.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "manifest.json")
+
+    def test_round_trip(self):
+        """Test that a saved manifest loads back the same"""
+        manifest = empty_manifest()
+        manifest["dependencies"] = GRAPH
+        save_manifest(self.path, manifest)
+        self.assertEqual(load_manifest(self.path), manifest)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_unusable_manifest(self):
+        """Test that a missing, corrupt or outdated manifest loads as empty"""
+        self.assertEqual(load_manifest(self.path), empty_manifest())
+        for text in ["{not json", '{"version": 0, "pages": {}}', "[]"]:
+            with open(self.path, "w") as f:
+                f.write(text)
+            self.assertEqual(load_manifest(self.path), empty_manifest())
+
+    def test_remove_output(self):
+        """Test that removing a file prunes the directories it empties, up to the output root"""
+        output = os.path.join(self.tmp.name, "public")
+        os.makedirs(os.path.join(output, "a", "b"))
+        os.makedirs(os.path.join(output, "a", "c"))
+        path = os.path.join(output, "a", "b", "page.html")
+        open(path, "w").close()
+        remove_output(path, output)
+        self.assertFalse(os.path.exists(os.path.join(output, "a", "b")))
+        self.assertTrue(os.path.exists(os.path.join(output, "a", "c")))
+        remove_output(path, output)
+        self.assertTrue(os.path.isdir(output))
+
+    def test_sweep_outputs(self):
+        """Test that sweeping deletes every file but those kept, and the directories left empty"""
+        output = os.path.join(self.tmp.name, "public")
+        kept = os.path.join(output, "index.html")
+        for path in [kept, os.path.join(output, "old.html"), os.path.join(output, "blog", "post.html")]:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+        self.assertEqual(
+            sweep_outputs(output, {kept}),
+            [os.path.join(output, "blog", "post.html"), os.path.join(output, "old.html")],
+        )
+        self.assertEqual(os.listdir(output), ["index.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,349 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from build_manifest import MANIFEST_NAME
+from build_site import build_site, default_chunksize, extract_title, find_pages, render_page
+from main import main
+
+
+TEMPLATE = "<html><title>{{ Title }}</title><body>{{ Content }}</body></html>"
+
+
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def read_file(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def snapshot(directory):
+    """Return {relative path: bytes} for every file under directory"""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, directory)] = f.read()
+    return files
+
+
+class TestRenderPage(unittest.TestCase):
+    """
+    Unit tests for rendering one markdown document into a template.
+    """
+
+    def test_extract_title(self):
+        """Test that the first h1 is the title, wherever it is"""
+        self.assertEqual(extract_title("# Hello"), "Hello")
+        self.assertEqual(extract_title("intro\n\n## Sub\n\n#  Spaced  \n\n# Second"), "Spaced")
+
+    def test_extract_title_skips_code(self):
+        """Test that a "# " line inside a code block is not the title"""
+        self.assertEqual(extract_title("```\n# comment\n```\n\n# Real"), "Real")
+
+    def test_extract_title_missing(self):
+        """Test that a document without an h1 is an error"""
+        with self.assertRaises(ValueError):
+            extract_title("## Only a subheading\n\ntext")
+
+    def test_render_page(self):
+        """Test that both placeholders are filled and the title is escaped"""
+        self.assertEqual(
+            render_page("# Tom & Jerry\n\nSome **bold**", TEMPLATE),
+            "<html><title>Tom &amp; Jerry</title><body><div><h1>Tom &amp; Jerry</h1>"
+            "<p>Some <b>bold</b></p></div></body></html>",
+        )
+
+    def test_placeholder_in_content_is_kept(self):
+        """Test that placeholder text inside the page is not substituted again"""
+        self.assertEqual(
+            render_page("# {{ Content }}", "{{ Title }}|{{ Content }}"),
+            "{{ Content }}|<div><h1>{{ Content }}</h1></div>",
+        )
+
+
+class SiteTestCase(unittest.TestCase):
+    """
+    Base class for tests that build a small site in a temporary directory.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+        self.content = os.path.join(root, "content")
+        self.static = os.path.join(root, "static")
+        self.template = os.path.join(root, "template.html")
+        self.output = os.path.join(root, "public")
+        self.partials = os.path.join(root, "partials")
+        self.data = os.path.join(root, "data")
+        write_file(self.template, TEMPLATE)
+        write_file(os.path.join(self.content, "index.md"), "# Home\n\nWelcome [in](/blog/post.html)")
+        write_file(os.path.join(self.content, "blog", "post.md"), "# Post\n\n- one\n- two")
+        write_file(os.path.join(self.content, "blog", "notes.txt"), "not markdown")
+        write_file(os.path.join(self.static, "css", "site.css"), "body {}")
+
+    def build(self, **kwargs):
+        return build_site(
+            self.content, self.template, self.output, self.static, partials_dir=self.partials, data_dir=self.data,
+            **kwargs,
+        )
+
+    def assert_same_as_clean_build(self):
+        """Check that the output tree is byte-identical to a from-scratch build"""
+        incremental = snapshot(self.output)
+        shutil.rmtree(self.output)
+        self.build(workers=1)
+        self.assertEqual(incremental, snapshot(self.output))
+
+
+class TestBuildSite(SiteTestCase):
+    """
+    Unit tests for building a site directory.
+    """
+
+    def test_find_pages(self):
+        """Test that only markdown files are found, in sorted order, with mirrored output paths"""
+        self.assertEqual(
+            list(find_pages(self.content, self.output)),
+            [
+                (os.path.join(self.content, "index.md"), os.path.join(self.output, "index.html")),
+                (os.path.join(self.content, "blog", "post.md"), os.path.join(self.output, "blog", "post.html")),
+            ],
+        )
+
+    def test_build(self):
+        """Test rendering every page and copying the static files"""
+        report = self.build(workers=1)
+        self.assertEqual(report.pages, [os.path.join(self.output, "index.html"), os.path.join(self.output, "blog", "post.html")])
+        self.assertEqual(
+            read_file(os.path.join(self.output, "blog", "post.html")),
+            "<html><title>Post</title><body><div><h1>Post</h1><ul><li>one</li><li>two</li></ul></div></body></html>",
+        )
+        self.assertEqual(read_file(os.path.join(self.output, "css", "site.css")), "body {}")
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog", "notes.txt")))
+
+    def test_process_pool_matches_serial_build(self):
+        """Test that a pooled, chunked build writes exactly what a serial build does"""
+        for i in range(10):
+            write_file(os.path.join(self.content, "many", f"page{i}.md"), f"# Page {i}\n\n*text* {i}")
+        serial = {path: read_file(path) for path in self.build(workers=1).rendered}
+        for path in serial:
+            os.remove(path)
+        pooled = {path: read_file(path) for path in self.build(workers=2, chunksize=3).rendered}
+        self.assertEqual(pooled, serial)
+
+    def test_missing_title_names_the_file(self):
+        """Test that a page without an h1 fails the build and leaves no output behind"""
+        source = os.path.join(self.content, "blog", "post.md")
+        write_file(source, "no title here")
+        with self.assertRaisesRegex(ValueError, "post.md"):
+            self.build(workers=1)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog", "post.html")))
+
+    def test_invalid_workers(self):
+        """Test that worker and chunk counts below 1 are rejected"""
+        with self.assertRaises(ValueError):
+            self.build(workers=0)
+        with self.assertRaises(ValueError):
+            self.build(chunksize=0)
+
+    def test_default_chunksize(self):
+        """Test that pages are split into a few chunks per worker"""
+        self.assertEqual(default_chunksize(40_000, 8), 1_250)
+        self.assertEqual(default_chunksize(3, 8), 1)
+
+    def test_main_build_command(self):
+        """Test the build command line"""
+        argv = [
+            "build", "--content", self.content, "--template", self.template,
+            "--static", self.static, "--output", self.output, "--workers", "1",
+        ]
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(argv), 0)
+        self.assertIn("built 2 pages", out.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.output, "index.html")))
+
+
+class TestIncrementalBuild(SiteTestCase):
+    """
+    Unit tests for manifest-driven incremental builds.
+    """
+
+    def test_unchanged_site_renders_nothing(self):
+        """Test that a rebuild with no changes renders no pages"""
+        self.build(workers=1)
+        report = self.build(workers=1)
+        self.assertEqual(len(report.pages), 2)
+        self.assertEqual(report.rendered, [])
+        self.assertEqual(report.removed, [])
+
+    def test_only_changed_page_is_rendered(self):
+        """Test that a one-character edit renders just that page"""
+        self.build(workers=1)
+        write_file(os.path.join(self.content, "index.md"), "# Home\n\nWelcome [in](/blog/post.html)!")
+        report = self.build(workers=1)
+        self.assertEqual(report.rendered, [os.path.join(self.output, "index.html")])
+        self.assert_same_as_clean_build()
+
+    def test_template_change_renders_every_page(self):
+        """Test that every page is rendered again when the template changes"""
+        self.build(workers=1)
+        write_file(self.template, "<main>{{ Content }}</main>")
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        self.assert_same_as_clean_build()
+
+    def test_removed_source_deletes_output(self):
+        """Test that removing a source deletes its page and the directory it leaves empty"""
+        self.build(workers=1)
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        report = self.build(workers=1)
+        self.assertEqual(report.removed, [os.path.join(self.output, "blog", "post.html")])
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog")))
+        self.assert_same_as_clean_build()
+
+    def test_removed_static_file_is_deleted(self):
+        """Test that a static file removed from the static directory is removed from the output"""
+        self.build(workers=1)
+        os.remove(os.path.join(self.static, "css", "site.css"))
+        self.build(workers=1)
+        self.assertFalse(os.path.exists(os.path.join(self.output, "css")))
+        self.assert_same_as_clean_build()
+
+    def test_missing_output_is_rendered(self):
+        """Test that a deleted output file is rendered again even if its source didn't change"""
+        self.build(workers=1)
+        os.remove(os.path.join(self.output, "index.html"))
+        self.assertEqual(self.build(workers=1).rendered, [os.path.join(self.output, "index.html")])
+
+    def test_changed_paths_skip_hashing(self):
+        """Test that with changed given, only those files are checked for changes"""
+        self.build(workers=1)
+        index = os.path.join(self.content, "index.md")
+        write_file(index, "# Home\n\nEdited")
+        self.assertEqual(self.build(workers=1, changed=set()).rendered, [])
+        self.assertEqual(self.build(workers=1, changed={index}).rendered, [os.path.join(self.output, "index.html")])
+        self.assert_same_as_clean_build()
+
+    def test_full_and_unreadable_manifest(self):
+        """Test that full=True, or a corrupt manifest, renders every page"""
+        self.build(workers=1)
+        self.assertEqual(len(self.build(workers=1, full=True).rendered), 2)
+        write_file(os.path.join(self.output, MANIFEST_NAME), "{not json")
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        self.assert_same_as_clean_build()
+
+    def test_full_build_deletes_removed_source(self):
+        """Test that full=True still deletes the page of a removed source"""
+        self.build(workers=1)
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        report = self.build(workers=1, full=True)
+        self.assertEqual(report.removed, [os.path.join(self.output, "blog", "post.html")])
+        self.assert_same_as_clean_build()
+
+    def test_unreadable_manifest_sweeps_output(self):
+        """Test that with a corrupt manifest, files this build doesn't write are deleted"""
+        self.build(workers=1)
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        write_file(os.path.join(self.output, MANIFEST_NAME), '{"version": 1}')
+        report = self.build(workers=1)
+        self.assertEqual(report.removed, [os.path.join(self.output, "blog", "post.html")])
+        self.assert_same_as_clean_build()
+
+    def test_missing_content_dir_deletes_nothing(self):
+        """Test that a missing content directory is an error, raised before any output is deleted"""
+        self.build(workers=1)
+        before = snapshot(self.output)
+        shutil.rmtree(self.content)
+        with self.assertRaises(ValueError):
+            self.build(workers=1)
+        self.assertEqual(snapshot(self.output), before)
+
+
+class TestDependencyGraph(SiteTestCase):
+    """
+    Unit tests for invalidating pages through the template/partial/data dependency graph.
+    """
+
+    def setUp(self):
+        super().setUp()
+        write_file(self.template, "<title>{{ Title }}</title>{{> nav }}{{ Content }}")
+        write_file(os.path.join(self.partials, "nav.html"), "<nav>{{ data.site.name }}</nav>")
+        write_file(os.path.join(self.partials, "ad.html"), "<aside>buy</aside>")
+        write_file(os.path.join(self.partials, "unused.html"), "nobody")
+        write_file(os.path.join(self.data, "site.json"), '{"name": "Boot"}')
+        write_file(os.path.join(self.content, "blog", "post.md"), "# Post\n\n{{> ad }}\n\ntext")
+        self.build(workers=1)
+
+    def test_partial_in_markdown(self):
+        """Test that a block holding only a partial include is replaced by the partial"""
+        self.assertEqual(
+            read_file(os.path.join(self.output, "blog", "post.html")),
+            "<title>Post</title><nav>Boot</nav><div><h1>Post</h1><aside>buy</aside><p>text</p></div>",
+        )
+
+    def test_page_partial_invalidates_only_its_pages(self):
+        """Test that changing a partial one page includes renders only that page"""
+        write_file(os.path.join(self.partials, "ad.html"), "<aside>sell</aside>")
+        self.assertEqual(self.build(workers=1).rendered, [os.path.join(self.output, "blog", "post.html")])
+        self.assert_same_as_clean_build()
+
+    def test_template_partial_invalidates_every_page(self):
+        """Test that changing a partial of the template, or data it uses, renders every page"""
+        write_file(os.path.join(self.partials, "nav.html"), "<nav>{{ data.site.name }}!</nav>")
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        write_file(os.path.join(self.data, "site.json"), '{"name": "Boot.dev"}')
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        self.assert_same_as_clean_build()
+
+    def test_unused_partial_renders_nothing(self):
+        """Test that changing a partial no page uses renders no pages"""
+        write_file(os.path.join(self.partials, "unused.html"), "still nobody")
+        self.assertEqual(self.build(workers=1).rendered, [])
+
+    def test_new_include_is_tracked(self):
+        """Test that a partial a page starts including invalidates it from then on"""
+        write_file(os.path.join(self.content, "index.md"), "# Home\n\n{{> unused }}")
+        self.assertEqual(self.build(workers=1).rendered, [os.path.join(self.output, "index.html")])
+        write_file(os.path.join(self.partials, "unused.html"), "used now")
+        self.assertEqual(self.build(workers=1).rendered, [os.path.join(self.output, "index.html")])
+        self.assert_same_as_clean_build()
+
+    def test_graph_from_pool(self):
+        """Test that edges recorded in worker processes invalidate the same pages"""
+        self.build(workers=2, chunksize=1, full=True)
+        write_file(os.path.join(self.partials, "ad.html"), "<aside>pool</aside>")
+        self.assertEqual(self.build(workers=2).rendered, [os.path.join(self.output, "blog", "post.html")])
+        self.assert_same_as_clean_build()
+
+    def test_other_partials_or_data_dir_renders_every_page(self):
+        """Test that building with another partials or data directory renders every page"""
+        partials = self.partials + "-2"
+        shutil.copytree(self.partials, partials)
+        self.partials = partials
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        data = self.data + "-2"
+        shutil.copytree(self.data, data)
+        write_file(os.path.join(data, "site.json"), '{"name": "Boot.dev"}')
+        self.data = data
+        self.assertEqual(len(self.build(workers=1).rendered), 2)
+        self.assertIn("Boot.dev", read_file(os.path.join(self.output, "index.html")))
+        self.assert_same_as_clean_build()
+
+    def test_removed_partial_fails_its_pages(self):
+        """Test that deleting a partial a page still includes is an error naming the page"""
+        os.remove(os.path.join(self.partials, "ad.html"))
+        with self.assertRaisesRegex(ValueError, "post.md"):
+            self.build(workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
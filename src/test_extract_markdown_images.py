@@ -1,6 +1,15 @@
 from textnode import TextNode, TextType
 import unittest
-from extract_markdown_images import extract_markdown_images, extract_markdown_links
+from extract_markdown_images import (
+    extract_markdown_images,
+    extract_markdown_links,
+    extract_markdown_image_spans,
+    extract_markdown_link_spans,
+    extract_markdown_images_and_links,
+    may_contain_autolink,
+    normalize_link_label,
+    scan_brackets,
+)
     
 class TestExtractMarkdown(unittest.TestCase):
     def test_extract_markdown_images(self):
@@ -32,6 +41,112 @@ class TestExtractMarkdown(unittest.TestCase):
             [("link1", "https://www.link1.com"), ("link2", "https://www.link2.com")],
             link_matches
         )
-        
+
+    def test_extract_markdown_image_spans(self):
+        text = "A ![cat](cat.png) and ![dog](dog.png)"
+        spans = extract_markdown_image_spans(text)
+        self.assertListEqual([("cat", "cat.png", 2, 17), ("dog", "dog.png", 22, 37)], spans)
+        for alt, url, start, end in spans:
+            self.assertEqual(f"![{alt}]({url})", text[start:end])
+
+    def test_extract_markdown_link_spans_skips_images(self):
+        text = "An ![image](img.png) and a [link](https://www.example.com)"
+        spans = extract_markdown_link_spans(text)
+        self.assertListEqual([("link", "https://www.example.com", 27, 58)], spans)
+        self.assertEqual("[link](https://www.example.com)", text[27:58])
+
+    def test_spans_agree_with_extractors(self):
+        text = " ".join(f"[l{i}](u{i}) ![i{i}](p{i}.png)" for i in range(50))
+        self.assertListEqual(extract_markdown_links(text), [s[:2] for s in extract_markdown_link_spans(text)])
+        self.assertListEqual(extract_markdown_images(text), [s[:2] for s in extract_markdown_image_spans(text)])
+    def test_scan_brackets(self):
+        text = "A ![cat](cat.png) and [docs](https://boot.dev)"
+        spans = scan_brackets(text)
+        self.assertListEqual(
+            [(TextType.IMAGE, "cat", "cat.png", 2, 17), (TextType.LINK, "docs", "https://boot.dev", 22, 46)],
+            spans,
+        )
+        self.assertListEqual(
+            [(TextType.IMAGE, "cat", "cat.png"), (TextType.LINK, "docs", "https://boot.dev")],
+            extract_markdown_images_and_links(text),
+        )
+
+    def test_nested_brackets_in_label(self):
+        self.assertListEqual(extract_markdown_images("![a [b] c](x.png)"), [("a [b] c", "x.png")])
+        self.assertListEqual(extract_markdown_links("[[1]](#note)"), [("[1]", "#note")])
+
+    def test_balanced_parens_in_url(self):
+        text = "[Foo](https://en.wikipedia.org/wiki/Foo_(bar)) (aside)"
+        self.assertListEqual(extract_markdown_links(text), [("Foo", "https://en.wikipedia.org/wiki/Foo_(bar)")])
+        # An unbalanced "(" means the url never closes
+        self.assertListEqual(extract_markdown_links("[a](b(c)"), [])
+
+    def test_near_misses(self):
+        self.assertListEqual(extract_markdown_links("[a][b] [c] (d) [](e) [f]()"), [])
+        self.assertListEqual(extract_markdown_images("![a] (b) ![c](" + "[" * 100), [])
+
+    def test_bounds(self):
+        text = "x [a](b) [c](d)"
+        self.assertListEqual(scan_brackets(text, 0, 8), [(TextType.LINK, "a", "b", 2, 8)])
+        # The "!" before start doesn't make the link an image
+        self.assertListEqual(scan_brackets("![a](b)", 1), [(TextType.LINK, "a", "b", 1, 7)])
+    def test_normalize_link_label(self):
+        self.assertEqual(normalize_link_label(" Foo \t BAR "), "foo bar")
+
+    def test_reference_links(self):
+        references = {"docs": "https://boot.dev/docs", "boot.dev": "https://boot.dev", "logo": "logo.png"}
+        text = "[the docs][Docs], [docs][], [boot.dev], ![alt][logo], [undefined][nope] and [x](y)"
+        self.assertListEqual(
+            extract_markdown_links(text, references),
+            [
+                ("the docs", "https://boot.dev/docs"),
+                ("docs", "https://boot.dev/docs"),
+                ("boot.dev", "https://boot.dev"),
+                ("x", "y"),
+            ],
+        )
+        self.assertListEqual(extract_markdown_images(text, references), [("alt", "logo.png")])
+        # Without an index only inline links are found
+        self.assertListEqual(extract_markdown_links(text), [("x", "y")])
+
+    def test_reference_link_spans(self):
+        text = "See [docs][d] now"
+        self.assertListEqual(extract_markdown_link_spans(text, references={"d": "u"}), [("docs", "u", 4, 13)])
+
+    def test_fast_paths_agree_with_scan_brackets(self):
+        """Test that the regex fast paths find what the bracket-pairing scan finds"""
+        references = {"r": "https://boot.dev"}
+        texts = [
+            "![a ![b](c)](d)",
+            "![a [b](c) d](e)",
+            "![x [y](z)",
+            "[wiki](x_(y))",
+            "[a](b[c)",
+            "![](x)",
+            "[](x)",
+            "[a][r] and ![b][r] and [c](d)",
+            "Wow! No images here [a](b)!",
+            "[![a](b)](c) [d](e)",
+            "[a](b) ![c](d) [e](f g)",
+        ]
+        for text in texts:
+            for refs in (None, references):
+                with self.subTest(text=text, references=refs):
+                    self.assertListEqual(
+                        extract_markdown_images(text, refs),
+                        [(label, url) for _, label, url, _, _ in scan_brackets(text, links=False, references=refs)],
+                    )
+                    self.assertListEqual(
+                        extract_markdown_links(text, refs),
+                        [(label, url) for _, label, url, _, _ in scan_brackets(text, images=False, references=refs)],
+                    )
+
+    def test_may_contain_autolink(self):
+        self.assertFalse(may_contain_autolink("The whole world watches what happens: nothing."))
+        self.assertTrue(may_contain_autolink("see https://boot.dev"))
+        self.assertTrue(may_contain_autolink("see www.boot.dev"))
+        self.assertTrue(may_contain_autolink("mail <me@boot.dev>"))
+        self.assertFalse(may_contain_autolink("<a> www.b", 3, 6))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from textnode import TextNode
@@ -5,7 +6,11 @@ from textnode import TextType
 from htmlnode import HTMLNode
 from htmlnode import LeafNode
 from htmlnode import ParentNode
+from htmlnode import RenderCache
+from htmlnode import escape_html, escape_html_many
+from textnode import TextSpan
 from htmlnode import text_node_to_html_node
+from htmlnode import text_nodes_to_html_nodes
 
 class TestHTMLNode(unittest.TestCase):
     """
@@ -90,9 +95,43 @@ class TestHTMLNode(unittest.TestCase):
         """
         node = HTMLNode(props={"data-value": "test&value", "id": "main-div"})
         result = node.props_to_html()
-        self.assertIn('data-value="test&value"', result)
+        self.assertIn('data-value="test&amp;value"', result)
         self.assertIn('id="main-div"', result)
 
+    def test_props_to_html_escapes_values(self):
+        """
+        Attribute values are escaped so they can't break out of their quotes.
+        """
+        node = HTMLNode(props={"title": 'say "hi" <b> & bye', "href": "/a?x=1&y=2"})
+        self.assertEqual(
+            node.props_to_html(),
+            'title="say &quot;hi&quot; &lt;b&gt; &amp; bye" href="/a?x=1&amp;y=2"',
+        )
+
+    def test_props_to_html_shared_mapping(self):
+        """
+        Equal props mappings produce the same (cached) attribute string.
+        """
+        first = HTMLNode(props={"class": "nav-link"}).props_to_html()
+        second = HTMLNode(props={"class": "nav-link"}).props_to_html()
+        self.assertEqual(first, 'class="nav-link"')
+        self.assertIs(first, second)
+
+    def test_props_to_html_non_string_values(self):
+        """
+        Non-string and unhashable values are converted with str().
+        """
+        self.assertEqual(HTMLNode(props={"width": 10}).props_to_html(), 'width="10"')
+        self.assertEqual(HTMLNode(props={"data-x": [1, 2]}).props_to_html(), 'data-x="[1, 2]"')
+
+    def test_props_to_html_equal_values_of_other_types(self):
+        """
+        Values that compare equal but print differently don't share a cached string.
+        """
+        self.assertEqual(HTMLNode(props={"a": 1}).props_to_html(), 'a="1"')
+        self.assertEqual(HTMLNode(props={"a": True}).props_to_html(), 'a="True"')
+        self.assertEqual(HTMLNode(props={"a": 1.0}).props_to_html(), 'a="1.0"')
+
     def test_repr_with_all_parameters(self):
         """
         The function `test_repr_with_all_parameters` tests the `repr` method of an `HTMLNode` object
@@ -223,6 +262,32 @@ class TestLeafNode(unittest.TestCase):
         node = LeafNode("h1", "Main Heading")
         self.assertEqual(node.to_html(), "<h1>Main Heading</h1>")
     
+    def test_leaf_to_html_void_elements(self):
+        """
+        Void elements render as a single tag with no content or closing tag.
+        """
+        self.assertEqual(LeafNode("br", None).to_html(), "<br>")
+        self.assertEqual(LeafNode("hr", "").to_html(), "<hr>")
+        self.assertEqual(
+            LeafNode("img", "", {"src": "cat.png", "alt": "A cat"}).to_html(),
+            '<img src="cat.png" alt="A cat">',
+        )
+        self.assertEqual(LeafNode("meta", None, {"charset": "utf-8"}).to_html(), '<meta charset="utf-8">')
+
+    def test_leaf_to_html_void_element_with_value_raises(self):
+        """
+        A void element can't hold content.
+        """
+        with self.assertRaises(ValueError):
+            LeafNode("br", "text").to_html()
+
+    def test_leaf_to_html_uncommon_tag(self):
+        """
+        Tags outside the precomputed set render the same way.
+        """
+        self.assertEqual(LeafNode("mark", "hi").to_html(), "<mark>hi</mark>")
+        self.assertEqual(LeafNode("mark", "hi").to_html(), "<mark>hi</mark>")
+
     def test_leaf_to_html_with_multiple_props(self):
         """
         The function `test_leaf_to_html_with_multiple_props` tests the conversion of a LeafNode object
@@ -287,14 +352,92 @@ class TestLeafNode(unittest.TestCase):
         self.assertEqual(html_node.tag, "code")
         self.assertEqual(html_node.value, "Code Snippet")
 
+    def test_text_node_view(self):
+        """
+        A view-backed TextNode keeps its span in the LeafNode until rendering.
+        """
+        source = "some **bold** words"
+        node = TextNode.view(source, 7, 11, TextType.BOLD)
+        html_node = text_node_to_html_node(node)
+        self.assertEqual(html_node.value, "bold")
+        self.assertEqual(html_node.to_html(), "<b>bold</b>")
+        plain = text_node_to_html_node(TextNode.view(source, 0, 5, TextType.PLAIN))
+        self.assertEqual(plain.to_html(), "some ")
+
+    def test_text_node_is_escaped(self):
+        """
+        Text from markdown is HTML-escaped when converted to a LeafNode.
+        """
+        node = TextNode('if a < b && c > "d"', TextType.CODE)
+        self.assertEqual(
+            text_node_to_html_node(node).to_html(),
+            "<code>if a &lt; b &amp;&amp; c &gt; &quot;d&quot;</code>",
+        )
+
+    def test_plain_text_node_is_escaped(self):
+        """
+        Plain text is escaped whichever special character it holds.
+        """
+        for text, html in (("a & b", "a &amp; b"), ("a < b", "a &lt; b"), ("a > b", "a &gt; b"), ('"a"', "&quot;a&quot;")):
+            with self.subTest(text=text):
+                self.assertEqual(text_node_to_html_node(TextNode(text, TextType.PLAIN)).to_html(), html)
+
+    def test_text_node_without_specials_is_not_copied(self):
+        """
+        Text without special characters is passed through as the same object.
+        """
+        node = TextNode("nothing to escape", TextType.PLAIN)
+        self.assertIs(text_node_to_html_node(node).value, node.text)
+
     def test_image(self):
         """
         The function `test_image` tests the conversion of a TextNode representing an image to an HTML
         node.
         """
         node = TextNode("Image", TextType.IMAGE, url="https://example.com/image.png")
+        html_node = text_node_to_html_node(node)
+        self.assertEqual(html_node.tag, "img")
+        self.assertEqual(html_node.value, "")
+        self.assertEqual(html_node.props, {"src": "https://example.com/image.png", "alt": "Image"})
+
+    def test_image_renders_void_element(self):
+        """
+        An image TextNode renders as a single <img> tag.
+        """
+        node = TextNode("A cat", TextType.IMAGE, url="cat.png")
+        self.assertEqual(text_node_to_html_node(node).to_html(), '<img src="cat.png" alt="A cat">')
+
+    def test_image_alt_escaped_once(self):
+        """
+        Image alt text is escaped as an attribute, not twice.
+        """
+        node = TextNode('Tom & "Jerry"', TextType.IMAGE, url="t.png")
+        self.assertIn('alt="Tom &amp; &quot;Jerry&quot;"', text_node_to_html_node(node).to_html())
+
+    def test_text_nodes_to_html_nodes(self):
+        """
+        The batch converter matches converting each node on its own.
+        """
+        nodes = [
+            TextNode("plain <", TextType.PLAIN),
+            TextNode("bold", TextType.BOLD),
+            TextNode("italic", TextType.ITALIC),
+            TextNode("code & more", TextType.CODE),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+            TextNode("alt", TextType.IMAGE, "img.png"),
+        ]
+        converted = text_nodes_to_html_nodes(iter(nodes))
+        self.assertEqual(
+            [node.to_html() for node in converted],
+            [text_node_to_html_node(node).to_html() for node in nodes],
+        )
+
+    def test_text_nodes_to_html_nodes_unsupported(self):
+        """
+        The batch converter rejects unsupported types too.
+        """
         with self.assertRaises(ValueError):
-            text_node_to_html_node(node)
+            text_nodes_to_html_nodes([TextNode("x", TextType.PLAIN), TextNode("y", "UNSUPPORTED_TYPE")])
 
     def test_unsupported_text_type(self):
         """
@@ -492,6 +635,14 @@ class TestHTMLNodeEdgeCases(unittest.TestCase):
         result = node.to_html()
         self.assertEqual(result, "<p><script>alert('xss')</script></p>")
 
+    def test_nodes_have_no_instance_dict(self):
+        """
+        HTMLNode and its subclasses use __slots__ instead of a per-instance __dict__.
+        """
+        nodes = [HTMLNode("p", "x"), LeafNode("b", "x"), ParentNode("div", [LeafNode("b", "x")])]
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"))
+
     def test_props_ordering_consistency(self):
         """
         The function tests the consistency of the ordering of properties in an HTMLNode object.
@@ -504,5 +655,239 @@ class TestHTMLNodeEdgeCases(unittest.TestCase):
 
     
 
+class TestWriteHTML(unittest.TestCase):
+    """
+    Test suite for streaming HTML output with write_html().
+    """
+    def setUp(self):
+        self.tree = ParentNode(
+            "div",
+            [
+                LeafNode("b", "Bold"),
+                ParentNode("p", [LeafNode(None, "text "), LeafNode("a", "link", {"href": "/x"})]),
+            ],
+            {"class": "box"},
+        )
+        self.expected = '<div class="box"><b>Bold</b><p>text <a href="/x">link</a></p></div>'
+
+    def test_write_html_to_list(self):
+        """
+        Fragments appended to a list join to the same string as to_html().
+        """
+        parts = []
+        self.tree.write_html(parts)
+        self.assertGreater(len(parts), 1)
+        self.assertEqual("".join(parts), self.expected)
+        self.assertEqual(self.tree.to_html(), self.expected)
+
+    def test_write_html_to_file(self):
+        """
+        write_html() streams into any object with a write() method.
+        """
+        out = io.StringIO()
+        self.tree.write_html(out)
+        self.assertEqual(out.getvalue(), self.expected)
+
+    def test_write_html_leaf(self):
+        """
+        A LeafNode writes the same HTML as its to_html().
+        """
+        parts = []
+        LeafNode("a", "Click", {"href": "https://boot.dev"}).write_html(parts)
+        self.assertEqual("".join(parts), '<a href="https://boot.dev">Click</a>')
+
+    def test_write_html_errors(self):
+        """
+        Invalid nodes raise the same errors as to_html().
+        """
+        with self.assertRaises(ValueError):
+            ParentNode("div", [LeafNode("b", None)]).write_html([])
+        with self.assertRaises(ValueError):
+            ParentNode(None, [LeafNode("b", "x")]).write_html([])
+        with self.assertRaises(NotImplementedError):
+            ParentNode("div", [HTMLNode("b", "x")]).write_html([])
+
+    def test_deep_tree_beyond_recursion_limit(self):
+        """
+        Trees deeper than the recursion limit render without RecursionError.
+        """
+        node = LeafNode("span", "x")
+        for _ in range(10000):
+            node = ParentNode("div", [node])
+        html = node.to_html()
+        self.assertEqual(html, "<div>" * 10000 + "<span>x</span>" + "</div>" * 10000)
+
+    def test_siblings_after_nested_parent(self):
+        """
+        Siblings that follow a nested ParentNode are rendered in order.
+        """
+        tree = ParentNode(
+            "ul",
+            [
+                ParentNode("li", [ParentNode("ol", [LeafNode("li", "a")]), LeafNode(None, "b")]),
+                LeafNode("li", "c"),
+                ParentNode("li", [LeafNode(None, "d")]),
+            ],
+        )
+        self.assertEqual(tree.to_html(), "<ul><li><ol><li>a</li></ol>b</li><li>c</li><li>d</li></ul>")
+
+    def test_void_element_children(self):
+        """
+        Void elements inside a ParentNode render without closing tags.
+        """
+        tree = ParentNode("p", [LeafNode(None, "a"), LeafNode("br", None), LeafNode(None, "b")])
+        self.assertEqual(tree.to_html(), "<p>a<br>b</p>")
+
+    def test_wide_tree(self):
+        """
+        A very wide table renders all of its rows.
+        """
+        rows = [ParentNode("tr", [LeafNode("td", str(i))]) for i in range(10000)]
+        html = ParentNode("table", rows).to_html()
+        self.assertTrue(html.startswith("<table><tr><td>0</td></tr>"))
+        self.assertTrue(html.endswith("<tr><td>9999</td></tr></table>"))
+
+
+def _nav():
+    return ParentNode(
+        "nav",
+        [ParentNode("ul", [ParentNode("li", [LeafNode("a", f"Page {i}", {"href": f"/{i}"})]) for i in range(3)])],
+        {"class": "menu"},
+    )
+
+
+class TestRenderCache(unittest.TestCase):
+    """
+    Test suite for memoized subtree rendering with RenderCache.
+    """
+    def test_cached_output_matches(self):
+        """
+        Rendering through a cache produces the same HTML as rendering without one.
+        """
+        page = ParentNode("body", [_nav(), ParentNode("p", [LeafNode(None, "hi")]), _nav()])
+        cache = RenderCache()
+        self.assertEqual(page.to_html(cache=cache), page.to_html())
+        self.assertEqual(page.to_html(cache=cache), page.to_html())
+
+    def test_identical_subtrees_share_entry(self):
+        """
+        Separately built but identical subtrees hit the same entry.
+        """
+        cache = RenderCache()
+        first = ParentNode("body", [_nav(), ParentNode("main", [LeafNode("p", "one")])])
+        second = ParentNode("body", [_nav(), ParentNode("main", [LeafNode("p", "two")])])
+        first.to_html(cache=cache)
+        hits = cache.hits
+        second.to_html(cache=cache)
+        # The nav subtree is served from the cache; body and main are new
+        self.assertEqual(cache.hits, hits + 1)
+        nav_a, nav_b = _nav(), _nav()
+        self.assertEqual(cache.subtree_keys(nav_a)[id(nav_a)], cache.subtree_keys(nav_b)[id(nav_b)])
+
+    def test_changed_subtree_misses(self):
+        """
+        Any change to tag, value or props gives a different key.
+        """
+        cache = RenderCache()
+        keys = [
+            cache.subtree_keys(node)[id(node)]
+            for node in [
+                ParentNode("p", [LeafNode("b", "x")]),
+                ParentNode("p", [LeafNode("i", "x")]),
+                ParentNode("p", [LeafNode("b", "y")]),
+                ParentNode("p", [LeafNode("b", "x", {"class": "c"})]),
+                ParentNode("p", [LeafNode("b", "x")], {"id": "p1"}),
+                ParentNode("p", [LeafNode(None, "x")]),
+            ]
+        ]
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_hit_and_miss_counters(self):
+        """
+        The second render of a tree is a single hit on the root.
+        """
+        cache = RenderCache()
+        nav = _nav()
+        nav.to_html(cache=cache)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 5)
+        self.assertEqual(len(cache), 5)
+        nav.to_html(cache=cache)
+        self.assertEqual(cache.hits, 1)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses, cache.current_bytes), (0, 0, 0, 0))
+
+    def test_lru_eviction_respects_budget(self):
+        """
+        Least recently used entries are evicted to stay within max_bytes.
+        """
+        cache = RenderCache(max_bytes=2000, max_entry_bytes=2000)
+        for i in range(50):
+            ParentNode("p", [LeafNode(None, f"paragraph {i} " * 5)]).to_html(cache=cache)
+        self.assertLessEqual(cache.current_bytes, 2000)
+        self.assertLess(len(cache), 50)
+        latest = ParentNode("p", [LeafNode(None, "paragraph 49 " * 5)])
+        oldest = ParentNode("p", [LeafNode(None, "paragraph 0 " * 5)])
+        self.assertIsNotNone(cache.get(cache.subtree_keys(latest)[id(latest)]))
+        self.assertIsNone(cache.get(cache.subtree_keys(oldest)[id(oldest)]))
+
+    def test_oversized_subtree_not_stored(self):
+        """
+        Subtrees bigger than max_entry_bytes are rendered but not stored.
+        """
+        cache = RenderCache(max_entry_bytes=200)
+        big = ParentNode("div", [ParentNode("p", [LeafNode(None, "x" * 500)]), ParentNode("p", [LeafNode(None, "y")])])
+        self.assertEqual(big.to_html(cache=cache), big.to_html())
+        self.assertEqual(len(cache), 1)
+
+    def test_write_html_with_cache(self):
+        """
+        write_html() accepts a cache too, and leaves ignore it.
+        """
+        cache = RenderCache()
+        out = io.StringIO()
+        _nav().write_html(out, cache=cache)
+        self.assertEqual(out.getvalue(), _nav().to_html())
+        parts = []
+        LeafNode("b", "x").write_html(parts, cache=cache)
+        self.assertEqual(parts, ["<b>x</b>"])
+
+    def test_deep_tree_with_cache(self):
+        """
+        Cached rendering also works beyond the recursion limit.
+        """
+        node = LeafNode("span", "x")
+        for _ in range(5000):
+            node = ParentNode("div", [node])
+        self.assertEqual(node.to_html(cache=RenderCache()), node.to_html())
+
+
+class TestEscapeHTML(unittest.TestCase):
+    """
+    Test suite for escape_html and escape_html_many.
+    """
+    def test_escape(self):
+        self.assertEqual(escape_html('<a href="x">&</a>'), "&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;")
+
+    def test_fast_path_returns_same_object(self):
+        text = "plain prose, with 'single quotes' only"
+        self.assertIs(escape_html(text), text)
+
+    def test_span(self):
+        source = "a <b> c"
+        clean = TextSpan(source, 0, 2)
+        self.assertIs(escape_html(clean), clean)
+        self.assertEqual(escape_html(TextSpan(source, 2, 5)), "&lt;b&gt;")
+
+    def test_escape_many(self):
+        values = ["a & b", "plain", "<tag>", ""]
+        self.assertEqual(escape_html_many(values), ["a &amp; b", "plain", "&lt;tag&gt;", ""])
+        self.assertEqual(escape_html_many(["x", "y"]), ["x", "y"])
+        self.assertEqual(escape_html_many([]), [])
+
+    def test_escape_many_with_separator_in_value(self):
+        self.assertEqual(escape_html_many(["a\x00<", "b"]), ["a\x00&lt;", "b"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,167 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+import inline_html
+from inline_html import text_to_html_nodes
+
+
+def render(text, **kwargs):
+    return "".join(node.to_html() for node in text_to_html_nodes(text, **kwargs))
+
+
+class TestTextToHTMLNodes(unittest.TestCase):
+    """
+    Unit tests for the nested-emphasis inline parser.
+    """
+
+    def test_plain(self):
+        """Test text without any markup, with escaping"""
+        self.assertEqual(render("a < b & c"), "a &lt; b &amp; c")
+        self.assertEqual(text_to_html_nodes(""), [])
+
+    def test_nested_emphasis(self):
+        """Test emphasis nested inside strong emphasis and the other way round"""
+        self.assertEqual(render("**bold _italic_**"), "<b>bold <i>italic</i></b>")
+        self.assertEqual(render("*foo **bar** baz*"), "<i>foo <b>bar</b> baz</i>")
+        self.assertEqual(render("***both***"), "<i><b>both</b></i>")
+
+    def test_nested_parent_nodes(self):
+        """Test that emphasis produces nested ParentNodes"""
+        [bold] = text_to_html_nodes("**a _b_**")
+        self.assertEqual(bold.tag, "b")
+        self.assertEqual(bold.children[1].tag, "i")
+        self.assertEqual(bold.children[1].children[0].value, "b")
+
+    def test_unmatched_delimiters_are_literal(self):
+        """Test that unclosed delimiters are kept as text instead of raising"""
+        self.assertEqual(render("an *unclosed delimiter"), "an *unclosed delimiter")
+        self.assertEqual(render("**foo*"), "*<i>foo</i>")
+        self.assertEqual(render("` unclosed code"), "` unclosed code")
+
+    def test_flanking_rules(self):
+        """Test that delimiters need to touch the emphasised text"""
+        self.assertEqual(render("a * foo bar*"), "a * foo bar*")
+        self.assertEqual(render("foo*bar*"), "foo<i>bar</i>")
+        self.assertEqual(render("snake_case_name"), "snake_case_name")
+
+    def test_code_links_and_images(self):
+        """Test that code, link and image contents are not parsed for emphasis"""
+        self.assertEqual(render("a `code *x*` b"), "a <code>code *x*</code> b")
+        self.assertEqual(render("``a`b``"), "<code>a`b</code>")
+        self.assertEqual(
+            render("[l*i*nk](https://boot.dev) and ![a](b.png) *x*"),
+            '<a href="https://boot.dev">l*i*nk</a> and <img src="b.png" alt="a"> <i>x</i>',
+        )
+
+    def test_autolinks(self):
+        """Test bare and angle-bracket autolinks, including inside emphasis"""
+        self.assertEqual(
+            render("**https://boot.dev** and <me@boot.dev>"),
+            '<b><a href="https://boot.dev">https://boot.dev</a></b> and <a href="mailto:me@boot.dev">me@boot.dev</a>',
+        )
+        self.assertEqual(render("go to www.boot.dev."), 'go to <a href="http://www.boot.dev">www.boot.dev</a>.')
+        self.assertEqual(render("https://boot.dev", autolinks=False), "https://boot.dev")
+
+
+class _CountingDelimiter(inline_html._Delimiter):
+    """
+    A _Delimiter that counts every read of its previous link, i.e. every step down the stack.
+    """
+    __slots__ = ()
+    steps = 0
+    _slot = inline_html._Delimiter.previous
+
+    @property
+    def previous(self):
+        _CountingDelimiter.steps += 1
+        return _CountingDelimiter._slot.__get__(self)
+
+    @previous.setter
+    def previous(self, value):
+        _CountingDelimiter._slot.__set__(self, value)
+
+
+class TestProcessEmphasisLinearSteps(unittest.TestCase):
+    """
+    Check that the delimiter stack stays linear on adversarial input, by counting steps instead of timing.
+
+    Each input is parsed at n and 2n repetitions. Linear work takes about twice
+    as many steps down the stack, quadratic work about four times as many.
+    """
+
+    N = 500
+
+    def steps(self, text):
+        _CountingDelimiter.steps = 0
+        with mock.patch.object(inline_html, "_Delimiter", _CountingDelimiter):
+            text_to_html_nodes(text)
+        return _CountingDelimiter.steps
+
+    def assertLinear(self, make_text):
+        small, large = self.steps(make_text(self.N)), self.steps(make_text(2 * self.N))
+        self.assertGreater(small, 0)
+        self.assertLessEqual(large, 2 * small + 10, f"{small} steps for n, {large} for 2n")
+
+    def test_unmatched_openers(self):
+        """Test openers that never close"""
+        self.assertLinear(lambda n: "*a " * n)
+
+    def test_unmatched_closers(self):
+        """Test closers with nothing to close"""
+        self.assertLinear(lambda n: "a* " * n)
+
+    def test_mixed_lengths(self):
+        """Test openers of different lengths that all fail to match"""
+        self.assertLinear(lambda n: "*a **a " * n)
+
+    def test_closers_of_the_other_char(self):
+        """Test closers that would each search past every opener of the other char"""
+        self.assertLinear(lambda n: "*a " * n + "a_ " * n)
+        self.assertLinear(lambda n: "_a " * n + "a* " * n)
+
+
+@unittest.skipUnless(os.environ.get("SSG_TIMING_TESTS") == "1", "timing test; set SSG_TIMING_TESTS=1 to run")
+class TestTextToHTMLNodesLinearTime(unittest.TestCase):
+    """
+    Check that the delimiter stack stays linear on adversarial input.
+
+    Each input is parsed at n and 4n repetitions; linear work takes about 4
+    times longer, quadratic work 16 times, so a ratio below 10 is linear.
+    """
+
+    SMALL, LARGE = 12_500, 50_000
+
+    def assertLinear(self, make_text):
+        def best_time(n):
+            text = make_text(n)
+            times = []
+            for _ in range(2):
+                start = time.perf_counter()
+                text_to_html_nodes(text)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        ratio = best_time(self.LARGE) / best_time(self.SMALL)
+        self.assertLess(ratio, 10, f"parse time grew {ratio:.1f}x for 4x input")
+
+    def test_unmatched_openers(self):
+        """Test 50k openers that never close"""
+        self.assertLinear(lambda n: "*a " * n)
+
+    def test_unmatched_closers(self):
+        """Test 50k closers with nothing to close"""
+        self.assertLinear(lambda n: "a* " * n)
+
+    def test_mixed_lengths(self):
+        """Test openers of different lengths that all fail to match"""
+        self.assertLinear(lambda n: "*a **a " * n)
+
+    def test_unmatched_backticks(self):
+        """Test backtick runs of many lengths"""
+        self.assertLinear(lambda n: "".join("`" * (i % 50 + 1) + "x" for i in range(n)))
+
+
+if __name__ == "__main__":
+    unittest.main()
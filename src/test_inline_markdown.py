@@ -1,7 +1,8 @@
 import unittest
 
 from textnode import TextNode, TextType
-from inline_markdown import split_nodes_delimiter
+from inline_markdown import split_nodes_delimiter, text_to_textnodes
+from split_nodes_images_links import split_nodes_image, split_nodes_link
 
 
 class TestSplitNodesDelimiter(unittest.TestCase):
@@ -157,5 +158,130 @@ class TestSplitNodesDelimiter(unittest.TestCase):
         self.assertEqual(nodes, expected)
 
 
+class TestTextToTextNodes(unittest.TestCase):
+    """
+    Unit tests for the single-pass text_to_textnodes tokenizer.
+    """
+
+    def test_all_inline_types(self):
+        """Test a line containing every inline type"""
+        text = (
+            "This is **text** with an _italic_ word and a `code block` and an "
+            "![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
+        )
+        expected = [
+            TextNode("This is ", TextType.PLAIN),
+            TextNode("text", TextType.BOLD),
+            TextNode(" with an ", TextType.PLAIN),
+            TextNode("italic", TextType.ITALIC),
+            TextNode(" word and a ", TextType.PLAIN),
+            TextNode("code block", TextType.CODE),
+            TextNode(" and an ", TextType.PLAIN),
+            TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
+            TextNode(" and a ", TextType.PLAIN),
+            TextNode("link", TextType.LINK, "https://boot.dev"),
+        ]
+        self.assertEqual(text_to_textnodes(text), expected)
+
+    def test_matches_chained_passes(self):
+        """Test that the single pass agrees with chaining the split functions"""
+        text = "A **b** and _c_ then `d` with ![e](e.png) and [f](f.com) end"
+        nodes = [TextNode(text, TextType.PLAIN)]
+        nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+        nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+        nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+        nodes = split_nodes_image(nodes)
+        nodes = split_nodes_link(nodes)
+        self.assertEqual(text_to_textnodes(text), nodes)
+
+    def test_plain_text(self):
+        """Test text without markup becomes a single PLAIN node"""
+        self.assertEqual(text_to_textnodes("just words"), [TextNode("just words", TextType.PLAIN)])
+
+    def test_empty_text(self):
+        """Test empty text produces no nodes"""
+        self.assertEqual(text_to_textnodes(""), [])
+
+    def test_code_is_literal(self):
+        """Test that delimiters inside a code span are not parsed"""
+        expected = [
+            TextNode("call ", TextType.PLAIN),
+            TextNode("snake_case_name", TextType.CODE),
+        ]
+        self.assertEqual(text_to_textnodes("call `snake_case_name`"), expected)
+
+    def test_link_url_is_literal(self):
+        """Test that an underscore inside a link URL does not start italics"""
+        expected = [
+            TextNode("see ", TextType.PLAIN),
+            TextNode("docs", TextType.LINK, "https://example.com/a_b"),
+        ]
+        self.assertEqual(text_to_textnodes("see [docs](https://example.com/a_b)"), expected)
+
+    def test_incomplete_link_is_plain(self):
+        """Test that brackets without a URL stay plain text"""
+        self.assertEqual(text_to_textnodes("a [b] c"), [TextNode("a [b] c", TextType.PLAIN)])
+
+    def test_unclosed_delimiter_raises_error(self):
+        """Test that an unclosed delimiter raises ValueError"""
+        with self.assertRaises(ValueError):
+            text_to_textnodes("This is **unclosed")
+
+    def test_bare_url_autolinks(self):
+        """Test that bare URLs become links without their trailing punctuation"""
+        expected = [
+            TextNode("See ", TextType.PLAIN),
+            TextNode("https://boot.dev/a_b", TextType.LINK, "https://boot.dev/a_b"),
+            TextNode(" or (", TextType.PLAIN),
+            TextNode("www.boot.dev", TextType.LINK, "http://www.boot.dev"),
+            TextNode(").", TextType.PLAIN),
+        ]
+        text = "See https://boot.dev/a_b or (www.boot.dev)."
+        self.assertEqual(text_to_textnodes(text), expected)
+        self.assertEqual(text_to_textnodes(text, views=True), expected)
+
+    def test_angle_autolinks(self):
+        """Test <scheme:...> and <email> autolinks, and that other <...> stays plain"""
+        expected = [
+            TextNode("https://boot.dev/?a=1", TextType.LINK, "https://boot.dev/?a=1"),
+            TextNode(" or ", TextType.PLAIN),
+            TextNode("help@boot.dev", TextType.LINK, "mailto:help@boot.dev"),
+            TextNode(" not <b>", TextType.PLAIN),
+        ]
+        self.assertEqual(text_to_textnodes("<https://boot.dev/?a=1> or <help@boot.dev> not <b>"), expected)
+
+    def test_autolink_needs_boundary(self):
+        """Test that URLs inside words, empty URLs and disabled autolinks stay plain"""
+        for text in ["xhttps://boot.dev", "http:// and www.", "awww.boot.dev"]:
+            self.assertEqual(text_to_textnodes(text), [TextNode(text, TextType.PLAIN)])
+        text = "see https://boot.dev"
+        self.assertEqual(text_to_textnodes(text, autolinks=False), [TextNode(text, TextType.PLAIN)])
+
+    def test_views_match_copies(self):
+        """Test that view-backed nodes share the source and compare equal to copies"""
+        text = "A **b** and _c_ then `d` with ![e](e.png) and [f](f.com) end"
+        nodes = text_to_textnodes(text, views=True)
+        self.assertEqual(nodes, text_to_textnodes(text))
+        for node in nodes:
+            self.assertTrue(node.is_view)
+            self.assertIs(node.raw_text.source, text)
+
+    def test_split_views_of_views(self):
+        """Test that splitters scan view-backed nodes in place"""
+        text = "x `a **b** c` y **d**"
+        nodes = split_nodes_delimiter([TextNode(text, TextType.PLAIN)], "`", TextType.CODE, views=True)
+        nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD, views=True)
+        self.assertEqual(
+            nodes,
+            [
+                TextNode("x ", TextType.PLAIN),
+                TextNode("a **b** c", TextType.CODE),
+                TextNode(" y ", TextType.PLAIN),
+                TextNode("d", TextType.BOLD),
+            ],
+        )
+        self.assertIs(nodes[-1].raw_text.source, text)
+
+
 if __name__ == "__main__":
     unittest.main()
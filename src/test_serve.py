@@ -0,0 +1,185 @@
+import os
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+
+from test_build_site import SiteTestCase, read_file, write_file
+import serve
+from serve import SiteRenderer, make_server
+
+
+class TestSiteRenderer(SiteTestCase):
+    """
+    Unit tests for rendering pages on demand with an in-memory cache.
+    """
+
+    def setUp(self):
+        super().setUp()
+        write_file(self.template, "<title>{{ Title }}</title>{{> nav }}{{ Content }}")
+        write_file(os.path.join(self.partials, "nav.html"), "<nav>{{ data.site.name }}</nav>")
+        write_file(os.path.join(self.partials, "ad.html"), "<aside>buy</aside>")
+        write_file(os.path.join(self.data, "site.json"), '{"name": "Boot"}')
+        write_file(os.path.join(self.content, "blog", "post.md"), "# Post\n\n{{> ad }}")
+        self.site = SiteRenderer(self.content, self.template, self.static, self.partials, self.data)
+        self.index = os.path.join(self.content, "index.md")
+        self.post = os.path.join(self.content, "blog", "post.md")
+
+    def test_resolve(self):
+        """Test mapping URLs to pages and static files the way build_site lays them out"""
+        self.assertEqual(self.site.resolve("/"), ("page", self.index))
+        self.assertEqual(self.site.resolve("/index.html"), ("page", self.index))
+        self.assertEqual(self.site.resolve("/blog/post.html"), ("page", self.post))
+        self.assertEqual(self.site.resolve("/blog/post"), ("page", self.post))
+        self.assertEqual(self.site.resolve("/css/site.css"), ("static", os.path.join(self.static, "css", "site.css")))
+        self.assertIsNone(self.site.resolve("/blog/"))
+        self.assertIsNone(self.site.resolve("/missing.html"))
+        self.assertIsNone(self.site.resolve("/../template.html"))
+        self.assertIsNone(self.site.resolve("/%2e%2e/template.html"))
+
+    def test_page_matches_build(self):
+        """Test that a served page is byte-identical to the built one, and nothing is written"""
+        served = self.site.page(self.post)
+        self.assertFalse(os.path.exists(self.output))
+        self.build(workers=1)
+        self.assertEqual(served.decode("utf-8"), read_file(os.path.join(self.output, "blog", "post.html")))
+
+    def test_cache(self):
+        """Test that a page is rendered once and then served from memory"""
+        first = self.site.page(self.index)
+        write_file(self.index, "# Changed")
+        self.assertIs(self.site.page(self.index), first)
+        self.assertEqual(len(self.site), 1)
+
+    def test_invalidate_partial(self):
+        """Test that a changed partial drops only the pages that use it"""
+        self.site.page(self.index)
+        self.site.page(self.post)
+        write_file(os.path.join(self.partials, "ad.html"), "<aside>sell</aside>")
+        self.assertEqual(self.site.refresh(), {os.path.join(self.partials, "ad.html")})
+        self.assertEqual(len(self.site), 1)
+        self.assertIn(b"sell", self.site.page(self.post))
+
+    def test_invalidate_data(self):
+        """Test that a changed data file used by the template drops every page"""
+        self.site.page(self.index)
+        self.site.page(self.post)
+        write_file(os.path.join(self.data, "site.json"), '{"name": "Boot.dev!"}')
+        self.site.refresh()
+        self.assertEqual(len(self.site), 0)
+        self.assertIn(b"<nav>Boot.dev!</nav>", self.site.page(self.index))
+
+    def test_invalidate_source(self):
+        """Test that editing a page drops just that page"""
+        self.site.page(self.index)
+        self.site.page(self.post)
+        write_file(self.index, "# Home\n\nEdited")
+        self.site.refresh()
+        self.assertEqual(len(self.site), 1)
+        self.assertIn(b"Edited", self.site.page(self.index))
+
+    def block_render(self, source_path):
+        """Make renders of source_path signal started, then wait for release; return both events"""
+        started, release = threading.Event(), threading.Event()
+        write_page = serve.write_page
+
+        def blocking_write_page(markdown, pieces, sink, loader=None):
+            if markdown == read_file(source_path):
+                started.set()
+                release.wait(10)
+            return write_page(markdown, pieces, sink, loader)
+
+        patcher = mock.patch("serve.write_page", blocking_write_page)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(release.set)
+        return started, release
+
+    def test_render_does_not_block_other_pages(self):
+        """Test that while one page renders, cached and other pages are still served"""
+        about = os.path.join(self.content, "about.md")
+        write_file(about, "# About")
+        cached = self.site.page(self.post)
+        started, release = self.block_render(self.index)
+        thread = threading.Thread(target=self.site.page, args=(self.index,))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.assertTrue(started.wait(5))
+        served = []
+        other = threading.Thread(target=lambda: served.extend([self.site.page(self.post), self.site.page(about)]))
+        other.start()
+        self.addCleanup(other.join)
+        other.join(5)
+        # Both answered while index.md was still rendering
+        self.assertEqual(len(served), 2)
+        self.assertIs(served[0], cached)
+        self.assertIn(b"<h1>About</h1>", served[1])
+        release.set()
+        thread.join()
+        self.assertEqual(len(self.site), 3)
+
+    def test_invalidate_during_render(self):
+        """Test that a page whose files change while it renders is served but not cached"""
+        started, release = self.block_render(self.index)
+        result = []
+        thread = threading.Thread(target=lambda: result.append(self.site.page(self.index)))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.assertTrue(started.wait(5))
+        self.site.invalidate([os.path.join(self.data, "site.json")])
+        release.set()
+        thread.join()
+        self.assertIn(b"<nav>Boot</nav>", result[0])
+        self.assertEqual(len(self.site), 0)
+        write_file(os.path.join(self.data, "site.json"), '{"name": "Boot.dev"}')
+        self.assertIn(b"<nav>Boot.dev</nav>", self.site.page(self.index))
+
+
+class TestServer(SiteTestCase):
+    """
+    Unit tests for the HTTP server, on a free local port.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.site = SiteRenderer(self.content, self.template, self.static, self.partials, self.data)
+        self.server = make_server(self.site, port=0, quiet=True)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.shutdown)
+
+    def get(self, path):
+        host, port = self.server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=5) as response:
+            return response.status, response.headers["Content-Type"], response.read()
+
+    def test_page(self):
+        """Test serving a rendered page"""
+        status, content_type, body = self.get("/blog/post.html")
+        self.assertEqual((status, content_type), (200, "text/html; charset=utf-8"))
+        self.assertIn(b"<li>one</li>", body)
+
+    def test_static(self):
+        """Test serving a static file with its content type"""
+        self.assertEqual(self.get("/css/site.css"), (200, "text/css", b"body {}"))
+
+    def test_not_found(self):
+        """Test that unknown paths are a 404"""
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            self.get("/nope.html")
+        self.assertEqual(caught.exception.code, 404)
+
+    def test_render_error(self):
+        """Test that a page that can't be rendered is a 500 naming the file"""
+        write_file(os.path.join(self.content, "index.md"), "no title")
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            self.get("/")
+        self.assertEqual(caught.exception.code, 500)
+        self.assertIn(b"index.md", caught.exception.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from textnode import TextNode, TextType
-from split_nodes_images_links import split_nodes_image, split_nodes_link
+from split_nodes_images_links import split_nodes_image, split_nodes_images_and_links, split_nodes_link
 
 
 class TestSplitNodesImage(unittest.TestCase):
@@ -330,6 +330,26 @@ class TestSplitNodesLink(unittest.TestCase):
             new_nodes,
         )
     
+    def test_many_links(self):
+        """Test a paragraph with hundreds of links splits around every one"""
+        text = "".join(f"item {i} [link{i}](https://example.com/{i}) " for i in range(500))
+        new_nodes = split_nodes_link([TextNode(text, TextType.PLAIN)])
+        self.assertEqual(len(new_nodes), 1001)
+        self.assertEqual(new_nodes[1], TextNode("link0", TextType.LINK, "https://example.com/0"))
+        self.assertEqual(new_nodes[-1], TextNode(" ", TextType.PLAIN))
+
+    def test_repeated_identical_links(self):
+        """Test identical links are each split at their own position"""
+        node = TextNode("[a](u) x [a](u)", TextType.PLAIN)
+        self.assertListEqual(
+            [
+                TextNode("a", TextType.LINK, "u"),
+                TextNode(" x ", TextType.PLAIN),
+                TextNode("a", TextType.LINK, "u"),
+            ],
+            split_nodes_link([node]),
+        )
+
     def test_link_does_not_match_image(self):
         """Test that links don't accidentally match image syntax"""
         node = TextNode(
@@ -418,6 +438,51 @@ class TestSplitNodesCombined(unittest.TestCase):
             final_nodes,
         )
 
+    def test_single_scan_matches_two_passes(self):
+        """Test that split_nodes_images_and_links agrees with the two separate splitters"""
+        node = TextNode(
+            "Start ![img1](img1.png) then [link1](url1.com) middle ![](img2.png) end",
+            TextType.PLAIN,
+        )
+        expected = split_nodes_link(split_nodes_image([node]))
+        self.assertListEqual(split_nodes_images_and_links([node]), expected)
+        self.assertListEqual(split_nodes_images_and_links([node], views=True), expected)
+
+    def test_nested_brackets_and_parens(self):
+        """Test labels with balanced brackets and URLs with balanced parentheses"""
+        node = TextNode(
+            "See [Foo [bar]](https://en.wikipedia.org/wiki/Foo_(bar)) and ![a [b]](c.png).",
+            TextType.PLAIN,
+        )
+        self.assertListEqual(
+            [
+                TextNode("See ", TextType.PLAIN),
+                TextNode("Foo [bar]", TextType.LINK, "https://en.wikipedia.org/wiki/Foo_(bar)"),
+                TextNode(" and ", TextType.PLAIN),
+                TextNode("a [b]", TextType.IMAGE, "c.png"),
+                TextNode(".", TextType.PLAIN),
+            ],
+            split_nodes_images_and_links([node]),
+        )
+
+
+    def test_reference_links(self):
+        """Test resolving reference links and images from a definitions index"""
+        node = TextNode("Read [the docs][docs] or [Boot.dev], see ![logo][]", TextType.PLAIN)
+        references = {"docs": "https://boot.dev/docs", "boot.dev": "https://boot.dev", "logo": "logo.png"}
+        expected = [
+            TextNode("Read ", TextType.PLAIN),
+            TextNode("the docs", TextType.LINK, "https://boot.dev/docs"),
+            TextNode(" or ", TextType.PLAIN),
+            TextNode("Boot.dev", TextType.LINK, "https://boot.dev"),
+            TextNode(", see ", TextType.PLAIN),
+            TextNode("logo", TextType.IMAGE, "logo.png"),
+        ]
+        self.assertListEqual(
+            split_nodes_link(split_nodes_image([node], references=references), references=references), expected
+        )
+        self.assertListEqual(split_nodes_images_and_links([node], views=True, references=references), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
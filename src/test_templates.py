@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import unittest
+
+from htmlnode import LeafNode
+from templates import CONTENT, DATA, PARTIAL, PARTIAL_BLOCK, TEXT, TITLE, TemplateLoader, parse_template
+
+
+class TestParseTemplate(unittest.TestCase):
+    """
+    Unit tests for parse_template.
+    """
+
+    def test_placeholders(self):
+        """Test every kind of placeholder between literal text"""
+        self.assertEqual(
+            parse_template("<title>{{ Title }}</title>{{> nav }}{{ Content }}{{ data.site.footer.year }}!"),
+            [
+                (TEXT, "<title>"), (TITLE, None), (TEXT, "</title>"), (PARTIAL, "nav"),
+                (CONTENT, None), (DATA, ("site", ("footer", "year"))), (TEXT, "!"),
+            ],
+        )
+
+    def test_partial_spellings(self):
+        """Test that partial names may have subdirectories and optional spaces"""
+        self.assertEqual(parse_template("{{>nav }}{{ > blog/side-bar }}"), [(PARTIAL, "nav"), (PARTIAL, "blog/side-bar")])
+
+    def test_unspaced_partial(self):
+        """Test that a template accepts every spelling a markdown partial block accepts"""
+        for text in ["{{>nav}}", "{{> nav}}", "{{>nav }}", "{{ >  nav  }}"]:
+            with self.subTest(text=text):
+                self.assertEqual(parse_template(f"<body>{text}</body>"), [(TEXT, "<body>"), (PARTIAL, "nav"), (TEXT, "</body>")])
+                self.assertEqual(PARTIAL_BLOCK.fullmatch(text).group(1), "nav")
+
+    def test_not_placeholders(self):
+        """Test that unknown fields and names climbing out of the partials directory stay text"""
+        for text in ["{{ Author }}", "{{> ../secret }}", "{{Title}}", "{{ data.site }}"]:
+            self.assertEqual(parse_template(text), [(TEXT, text)])
+
+
+class TestTemplateLoader(unittest.TestCase):
+    """
+    Unit tests for loading and rendering templates with partials and data files.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.loader = TemplateLoader(os.path.join(self.tmp.name, "partials"), os.path.join(self.tmp.name, "data"))
+        self.write_partial("footer", "<footer>{{> copyright }}</footer>")
+        self.write_partial("copyright", "&copy; {{ data.site.author }}")
+        os.makedirs(self.loader.data_dir)
+        with open(self.loader.data_path("site"), "w", encoding="utf-8") as f:
+            json.dump({"author": "Tom & Jerry", "year": 2024}, f)
+
+    def write_partial(self, name, text):
+        path = self.loader.partial_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def render(self, template, **kwargs):
+        fragments = []
+        self.loader.write(parse_template(template), fragments, **kwargs)
+        return "".join(fragments)
+
+    def test_nested_partials_and_data(self):
+        """Test that partials expand recursively and data values are escaped"""
+        self.assertEqual(
+            self.render("<h1>{{ Title }}</h1>{{ Content }}{{> footer }} {{ data.site.year }}",
+                        title="Hi", page=LeafNode("p", "body")),
+            "<h1>Hi</h1><p>body</p><footer>&copy; Tom &amp; Jerry</footer> 2024",
+        )
+
+    def test_records_edges(self):
+        """Test that each file read records the files it uses, once"""
+        self.render("{{> footer }}{{> footer }}")
+        self.assertEqual(
+            self.loader.take_edges(),
+            {
+                self.loader.partial_path("footer"): [self.loader.partial_path("copyright")],
+                self.loader.partial_path("copyright"): [self.loader.data_path("site")],
+                self.loader.data_path("site"): [],
+            },
+        )
+        self.render("{{> footer }}")
+        self.assertEqual(self.loader.take_edges(), {})
+
+    def test_missing_files_and_keys(self):
+        """Test that missing partials, data files and keys are errors"""
+        for template in ["{{> nope }}", "{{ data.nope.key }}", "{{ data.site.nope }}"]:
+            with self.assertRaises(ValueError):
+                self.render(template)
+
+    def test_missing_values(self):
+        """Test that {{ Title }} and {{ Content }} need something to fill them"""
+        with self.assertRaises(ValueError):
+            self.render("{{ Title }}")
+        with self.assertRaises(ValueError):
+            self.render("{{ Content }}")
+
+    def test_recursive_partial(self):
+        """Test that a partial including itself is an error, not a hang"""
+        self.write_partial("loop", "again {{> loop }}")
+        with self.assertRaisesRegex(ValueError, "includes itself"):
+            self.render("{{> loop }}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from textnode import TextNode, TextType
+from textnode import TextNode, TextSpan, TextType
 
 class TestTextNode(unittest.TestCase):
     """
@@ -68,6 +68,12 @@ class TestTextNode(unittest.TestCase):
         expected = "TextNode(Plain text, TextType.PLAIN, None)"
         self.assertEqual(repr(node), expected)
 
+    def test_no_instance_dict(self):
+        node = TextNode("Text", TextType.PLAIN)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = "not allowed"
+
     def test_text_types(self):
         self.assertEqual(TextType.PLAIN.value, "plain")
         self.assertEqual(TextType.BOLD.value, "bold")
@@ -77,5 +83,32 @@ class TestTextNode(unittest.TestCase):
         self.assertEqual(TextType.IMAGE.value, "image")
 
 
+class TestTextNodeView(unittest.TestCase):
+    """
+    Unit tests for view-backed TextNodes created with TextNode.view().
+    """
+    def test_view_text(self):
+        source = "This is **bold** text"
+        node = TextNode.view(source, 10, 14, TextType.BOLD)
+        self.assertTrue(node.is_view)
+        self.assertEqual(node.text, "bold")
+        self.assertEqual(node.raw_text, TextSpan(source, 10, 14))
+
+    def test_view_eq_plain_node(self):
+        node = TextNode.view("see [docs](u)", 5, 9, TextType.LINK, "u")
+        self.assertEqual(node, TextNode("docs", TextType.LINK, "u"))
+        self.assertFalse(TextNode("docs", TextType.LINK, "u").is_view)
+
+    def test_view_repr(self):
+        node = TextNode.view("abc", 1, 3, TextType.CODE)
+        self.assertEqual(repr(node), "TextNode(bc, TextType.CODE, None)")
+
+    def test_span_write_to(self):
+        parts = []
+        TextSpan("hello world", 6, 11).write_to(parts.append)
+        self.assertEqual(parts, ["world"])
+        self.assertEqual(len(TextSpan("hello world", 6, 11)), 5)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
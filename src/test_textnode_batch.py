@@ -0,0 +1,112 @@
+import unittest
+
+from textnode import TextNode, TextType
+from htmlnode import text_node_to_html_node
+from inline_markdown import split_nodes_delimiter, text_to_textnodes
+from split_nodes_images_links import split_nodes_image, split_nodes_link
+from textnode_batch import (
+    TEXT_TYPE_CODES,
+    TextNodeBatch,
+    split_nodes_delimiter_batch,
+    split_nodes_image_batch,
+    split_nodes_link_batch,
+    text_to_textnode_batch,
+    text_node_batch_to_html_nodes,
+    text_node_batch_to_html,
+)
+
+
+class TestTextNodeBatch(unittest.TestCase):
+    """
+    Unit tests for the columnar TextNodeBatch container.
+    """
+
+    def setUp(self):
+        self.nodes = [
+            TextNode("Plain ", TextType.PLAIN),
+            TextNode("bold", TextType.BOLD),
+            TextNode("", TextType.PLAIN),
+            TextNode("docs", TextType.LINK, "https://boot.dev"),
+            TextNode("more docs", TextType.LINK, "https://boot.dev"),
+            TextNode("cat", TextType.IMAGE, "cat.png"),
+        ]
+
+    def test_round_trip(self):
+        """Test that packing and unpacking nodes is lossless"""
+        batch = TextNodeBatch.from_nodes(self.nodes)
+        self.assertEqual(len(batch), len(self.nodes))
+        self.assertEqual(batch.to_nodes(), self.nodes)
+        self.assertEqual(batch.to_nodes(views=True), self.nodes)
+
+    def test_columns(self):
+        """Test the type codes and interned URL ids"""
+        batch = TextNodeBatch.from_nodes(self.nodes)
+        self.assertEqual(list(batch.types), [TEXT_TYPE_CODES[node.text_type] for node in self.nodes])
+        self.assertEqual(batch.urls, ["https://boot.dev", "cat.png"])
+        self.assertEqual(list(batch.url_ids), [-1, -1, -1, 0, 0, 1])
+        self.assertEqual(batch.buffer, "Plain bolddocsmore docscat")
+
+    def test_unsupported_text_type(self):
+        """Test that an unknown text type is rejected"""
+        with self.assertRaises(ValueError):
+            TextNodeBatch.from_nodes([TextNode("x", "UNSUPPORTED_TYPE")])
+
+    def test_split_delimiter_batch(self):
+        """Test that the batch splitter matches split_nodes_delimiter"""
+        nodes = [
+            TextNode("Plain text with `code`", TextType.PLAIN),
+            TextNode("Already bold", TextType.BOLD),
+            TextNode("More `code here` end", TextType.PLAIN),
+        ]
+        batch = split_nodes_delimiter_batch(TextNodeBatch.from_nodes(nodes), "`", TextType.CODE)
+        self.assertEqual(batch.to_nodes(), split_nodes_delimiter(nodes, "`", TextType.CODE))
+
+    def test_split_delimiter_batch_unclosed(self):
+        """Test that an unclosed delimiter raises ValueError"""
+        batch = TextNodeBatch.from_text("an `unclosed delimiter")
+        with self.assertRaises(ValueError):
+            split_nodes_delimiter_batch(batch, "`", TextType.CODE)
+
+    def test_split_image_and_link_batch(self):
+        """Test that the batch splitters match split_nodes_image and split_nodes_link"""
+        nodes = [TextNode("A ![img](img.png) and [link](url.com) and x!", TextType.PLAIN),
+                 TextNode("[next](n.com)", TextType.PLAIN)]
+        batch = split_nodes_link_batch(split_nodes_image_batch(TextNodeBatch.from_nodes(nodes)))
+        self.assertEqual(batch.to_nodes(), split_nodes_link(split_nodes_image(nodes)))
+
+    def test_split_shares_buffer(self):
+        """Test that splitting a batch never copies the buffer"""
+        text = "A **b** and [c](d) at https://boot.dev."
+        batch = text_to_textnode_batch(text)
+        self.assertIs(batch.buffer, text)
+        self.assertEqual(batch.to_nodes(), text_to_textnodes(text))
+
+    def test_to_html(self):
+        """Test both batch HTML conversions against text_node_to_html_node"""
+        text = "A **b** _c_ `d` and [e](f.com)"
+        batch = text_to_textnode_batch(text)
+        expected = [text_node_to_html_node(node).to_html() for node in text_to_textnodes(text)]
+        self.assertEqual([node.to_html() for node in text_node_batch_to_html_nodes(batch)], expected)
+        self.assertEqual(text_node_batch_to_html(batch), "".join(expected))
+
+    def test_to_html_escapes(self):
+        """Test that batch conversion escapes text like text_node_to_html_node"""
+        text = "a < b and **x & y** and [q](/s?a=1&b=2)"
+        batch = text_to_textnode_batch(text)
+        expected = "".join(text_node_to_html_node(node).to_html() for node in text_to_textnodes(text))
+        self.assertEqual(text_node_batch_to_html(batch), expected)
+        self.assertEqual("".join(node.to_html() for node in text_node_batch_to_html_nodes(batch)), expected)
+        self.assertIn("<b>x &amp; y</b>", expected)
+        self.assertIn('href="/s?a=1&amp;b=2"', expected)
+
+    def test_to_html_image(self):
+        """Test that IMAGE rows become <img> elements like text_node_to_html_node does"""
+        nodes = [TextNode("a \"cat\"", TextType.IMAGE, "cat.png"), TextNode(" & more", TextType.PLAIN)]
+        batch = TextNodeBatch.from_nodes(nodes)
+        expected = [text_node_to_html_node(node).to_html() for node in nodes]
+        self.assertEqual([node.to_html() for node in text_node_batch_to_html_nodes(batch)], expected)
+        self.assertEqual(text_node_batch_to_html(batch), "".join(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
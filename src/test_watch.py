@@ -0,0 +1,109 @@
+import os
+import queue
+import threading
+import unittest
+
+from test_build_site import SiteTestCase, read_file, write_file
+from watch import diff_snapshots, snapshot, watch
+
+
+class TestSnapshot(SiteTestCase):
+    """
+    Unit tests for the mtime/size snapshots.
+    """
+
+    def test_snapshot(self):
+        """Test that files under directories and single files are recorded, and missing paths skipped"""
+        files = snapshot([self.content, self.template, os.path.join(self.tmp.name, "missing"), None])
+        self.assertEqual(
+            sorted(files),
+            sorted([
+                self.template,
+                os.path.join(self.content, "index.md"),
+                os.path.join(self.content, "blog", "post.md"),
+                os.path.join(self.content, "blog", "notes.txt"),
+            ]),
+        )
+        stat = os.stat(self.template)
+        self.assertEqual(files[self.template], (stat.st_mtime_ns, stat.st_size))
+
+    def test_diff(self):
+        """Test that added, removed and modified files are all reported"""
+        before = snapshot([self.content])
+        index = os.path.join(self.content, "index.md")
+        post = os.path.join(self.content, "blog", "post.md")
+        new = os.path.join(self.content, "new.md")
+        write_file(index, "# Home\n\nchanged")
+        os.remove(post)
+        write_file(new, "# New")
+        self.assertEqual(diff_snapshots(before, snapshot([self.content])), {index, post, new})
+        self.assertEqual(diff_snapshots(before, before), set())
+
+
+class TestWatch(SiteTestCase):
+    """
+    Unit tests for the watch loop, run in a thread against a real directory.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.builds = queue.Queue()
+        self.errors = queue.Queue()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=watch,
+            args=(self.content, self.template, self.output, self.static, self.partials, self.data, 1),
+            kwargs={
+                "interval": 0.01, "quiet": 0.2, "stop": self.stop,
+                "on_build": lambda report, changed, seconds: self.builds.put((report, changed)),
+                "on_error": self.errors.put,
+            },
+        )
+        self.thread.start()
+        self.addCleanup(self.thread.join)
+        self.addCleanup(self.stop.set)
+
+    def next_build(self):
+        return self.builds.get(timeout=5)
+
+    def test_initial_build(self):
+        """Test that watching starts with a build of the whole site"""
+        report, changed = self.next_build()
+        self.assertEqual(len(report.rendered), 2)
+        self.assertEqual(changed, set())
+
+    def test_rebuilds_changed_page(self):
+        """Test that saving a page renders just that page"""
+        self.next_build()
+        index = os.path.join(self.content, "index.md")
+        write_file(index, "# Home\n\nEdited")
+        report, changed = self.next_build()
+        self.assertEqual(changed, {index})
+        self.assertEqual(report.rendered, [os.path.join(self.output, "index.html")])
+        self.assertIn("Edited", read_file(os.path.join(self.output, "index.html")))
+
+    def test_burst_is_one_build(self):
+        """Test that several files saved together cause one rebuild"""
+        self.next_build()
+        paths = [os.path.join(self.content, f"new{i}.md") for i in range(5)]
+        for i, path in enumerate(paths):
+            write_file(path, f"# New {i}")
+        report, changed = self.next_build()
+        self.assertEqual(changed, set(paths))
+        self.assertEqual(len(report.rendered), 5)
+
+    def test_failed_build_is_retried(self):
+        """Test that a broken page is reported, and its fix rebuilds it"""
+        self.next_build()
+        index = os.path.join(self.content, "index.md")
+        write_file(index, "no title yet")
+        self.assertIn("index.md", str(self.errors.get(timeout=5)))
+        write_file(os.path.join(self.content, "blog", "post.md"), "# Post\n\nAlso edited")
+        write_file(index, "# Home\n\nTitled")
+        report, _ = self.next_build()
+        self.assertEqual(len(report.rendered), 2)
+        self.assertIn("Titled", read_file(os.path.join(self.output, "index.html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,8 +24,72 @@ class TextType(Enum):
     LINK = "link"
     IMAGE = "image"
 
+# The `TextSpan` class is a lazy view of source[start:end] that is only sliced when it is needed.
+class TextSpan:
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, source: str, start: int, end: int):
+        """
+        Initialize a TextSpan instance.
+
+        Args:
+            source (str): The buffer the span points into (usually a whole paragraph or document).
+            start (int): Offset of the first character of the span.
+            end (int): Offset one past the last character of the span.
+        """
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def __str__(self):
+        """
+        Materialize the span as a new string.
+
+        Returns:
+            str: source[start:end]
+        """
+        return self.source[self.start:self.end]
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __eq__(self, other):
+        """
+        Compare the text of this span with another span or a plain string.
+
+        Returns:
+            bool: True if both hold the same characters; NotImplemented for other types.
+        """
+        if isinstance(other, TextSpan):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return f"TextSpan({self.start}, {self.end})"
+
+    def write_to(self, write):
+        """
+        Pass the span to a write callable (e.g. list.append or file.write).
+
+        The slice is handed straight to the writer and never stored, so the
+        only copy of the text that stays alive is the source buffer.
+
+        Args:
+            write (callable): Function that accepts a string fragment.
+        """
+        write(self.source[self.start:self.end])
+
+
 # The `TextNode` class represents a text node with specified text, text type, and optional URL.
 class TextNode:
+    # Slots: the inline parser creates one per span of every block, most of them short-lived
+    __slots__ = ("_text", "text_type", "url")
+
     def __init__(self, text: str, text_type: TextType, url: str = None):
         """
         Initialize a TextNode instance.
@@ -39,6 +103,67 @@ class TextNode:
         self.text_type = text_type
         self.url = url
 
+    @classmethod
+    def view(cls, source: str, start: int, end: int, text_type: TextType, url: str = None):
+        """
+        Create a TextNode whose text is a view of source[start:end].
+
+        The text is not copied out of the source buffer until .text is read, so
+        many nodes can share one paragraph or document without duplicating it.
+
+        Args:
+            source (str): The buffer holding the node's text.
+            start (int): Offset of the first character of the text.
+            end (int): Offset one past the last character of the text.
+            text_type (TextType): The type of text formatting to apply.
+            url (str, optional): The URL associated with the text node. Defaults to None.
+
+        Returns:
+            TextNode: A node backed by a TextSpan.
+        """
+        node = cls.__new__(cls)
+        node._text = TextSpan(source, start, end)
+        node.text_type = text_type
+        node.url = url
+        return node
+
+    @property
+    def text(self):
+        """
+        The text content of the node, materialized from the source buffer for views.
+
+        Returns:
+            str: The node's text.
+        """
+        text = self._text
+        if type(text) is TextSpan:
+            return text.source[text.start:text.end]
+        return text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    @property
+    def raw_text(self):
+        """
+        The stored text without materializing it.
+
+        Returns:
+            str | TextSpan: A plain string, or a TextSpan for nodes created with TextNode.view().
+        """
+        return self._text
+
+    @property
+    def is_view(self):
+        """
+        Whether this node is backed by a TextSpan instead of its own string.
+
+        Returns:
+            bool: True for nodes created with TextNode.view().
+        """
+        return type(self._text) is TextSpan
+
     def __eq__(self, other):
         """
         Compare this TextNode with another object for equality.
@@ -0,0 +1,320 @@
+from array import array
+
+from textnode import TextNode, TextType
+from htmlnode import TEXT_TYPE_TAGS, LeafNode, attributes_to_html, escape_html, needs_escape
+from inline_markdown import INLINE_DELIMITERS, _scan_inline
+
+
+# Small integer code for every TextType, stored in the type column of a batch
+TEXT_TYPE_CODES = {text_type: code for code, text_type in enumerate(TextType)}
+CODE_TEXT_TYPES = tuple(TextType)
+
+# HTML tag for every type code (None renders as raw text)
+_TAGS_BY_CODE = tuple(TEXT_TYPE_TAGS[text_type] for text_type in CODE_TEXT_TYPES)
+
+_PLAIN = TEXT_TYPE_CODES[TextType.PLAIN]
+_LINK = TEXT_TYPE_CODES[TextType.LINK]
+_IMAGE = TEXT_TYPE_CODES[TextType.IMAGE]
+_NO_URL = -1
+
+
+class TextNodeBatch:
+    """
+    Struct-of-arrays container for a long run of inline nodes.
+
+    Instead of one TextNode object per node, a batch keeps parallel columns:
+
+    - types: type code of each node (see TEXT_TYPE_CODES)
+    - starts / lengths: where each node's text sits in the shared buffer
+    - url_ids: index into urls, or -1 when the node has no URL
+
+    URLs are interned, so a link repeated a thousand times is stored once.
+    """
+    __slots__ = ("buffer", "types", "starts", "lengths", "url_ids", "urls", "_url_index")
+
+    def __init__(self, buffer: str = "", urls: list[str] = None):
+        """
+        Initialize an empty TextNodeBatch over buffer.
+
+        Args:
+            buffer (str, optional): The text every row points into. Defaults to "".
+            urls (list[str], optional): Initial URL table to share ids with. Defaults to None.
+        """
+        self.buffer = buffer
+        self.types = array("B")
+        self.starts = array("q")
+        self.lengths = array("q")
+        self.url_ids = array("i")
+        self.urls = list(urls) if urls else []
+        self._url_index = {url: url_id for url_id, url in enumerate(self.urls)}
+
+    def __len__(self):
+        return len(self.types)
+
+    def __repr__(self):
+        return f"TextNodeBatch({len(self)} nodes, {len(self.buffer)} chars, {len(self.urls)} urls)"
+
+    def intern_url(self, url):
+        """
+        Return the id of url in this batch's URL table, adding it if needed.
+
+        Args:
+            url (str | None): The URL to intern.
+
+        Returns:
+            int: The URL id, or -1 for None.
+        """
+        if url is None:
+            return _NO_URL
+        url_id = self._url_index.get(url)
+        if url_id is None:
+            url_id = self._url_index[url] = len(self.urls)
+            self.urls.append(url)
+        return url_id
+
+    def append(self, code: int, start: int, end: int, url_id: int = _NO_URL):
+        """
+        Add a row whose text is buffer[start:end].
+
+        Args:
+            code (int): Type code of the node (see TEXT_TYPE_CODES).
+            start (int): Offset of the text in the buffer.
+            end (int): Offset one past the end of the text in the buffer.
+            url_id (int, optional): Id returned by intern_url. Defaults to -1 (no URL).
+        """
+        self.types.append(code)
+        self.starts.append(start)
+        self.lengths.append(end - start)
+        self.url_ids.append(url_id)
+
+    @classmethod
+    def from_text(cls, text: str):
+        """
+        Create a batch holding text as a single PLAIN node, without copying it.
+
+        Args:
+            text (str): Raw markdown text.
+
+        Returns:
+            TextNodeBatch: A one-row batch over text.
+        """
+        batch = cls(text)
+        if text:
+            batch.append(_PLAIN, 0, len(text))
+        return batch
+
+    @classmethod
+    def from_nodes(cls, nodes):
+        """
+        Pack a list of TextNode objects into a batch.
+
+        Args:
+            nodes (Iterable[TextNode]): The nodes to pack.
+
+        Returns:
+            TextNodeBatch: A batch whose to_nodes() equals the input.
+
+        Raises:
+            ValueError: If a node has a text_type that is not a TextType.
+        """
+        batch = cls()
+        parts = []
+        offset = 0
+        for node in nodes:
+            code = TEXT_TYPE_CODES.get(node.text_type)
+            if code is None:
+                raise ValueError(f"Unsupported TextType: {node.text_type}")
+            text = node.text
+            batch.append(code, offset, offset + len(text), batch.intern_url(node.url))
+            parts.append(text)
+            offset += len(text)
+        batch.buffer = "".join(parts)
+        return batch
+
+    def to_nodes(self, views=False):
+        """
+        Unpack the batch into a list of TextNode objects.
+
+        Args:
+            views (bool, optional): Emit TextNode.view() nodes into the buffer
+                instead of copying each text. Defaults to False.
+
+        Returns:
+            list[TextNode]: One node per row, in order.
+        """
+        buffer = self.buffer
+        urls = self.urls
+        nodes = []
+        for code, start, length, url_id in zip(self.types, self.starts, self.lengths, self.url_ids):
+            url = urls[url_id] if url_id != _NO_URL else None
+            if views:
+                nodes.append(TextNode.view(buffer, start, start + length, CODE_TEXT_TYPES[code], url))
+            else:
+                nodes.append(TextNode(buffer[start:start + length], CODE_TEXT_TYPES[code], url))
+        return nodes
+
+
+def _split_batch(batch, delimiters, images=False, links=False, autolinks=False):
+    """
+    Run the inline scanner over every PLAIN row of batch.
+
+    New rows point into the same buffer, so splitting never copies text.
+
+    Args:
+        batch (TextNodeBatch): The batch to split.
+        delimiters (dict[str, TextType]): Enabled delimiters and the TextType each produces.
+        images (bool): Whether to split out images.
+        links (bool): Whether to split out links.
+        autolinks (bool): Whether to split out <https://...> and bare URLs as links.
+
+    Returns:
+        TextNodeBatch: A new batch over the same buffer.
+
+    Raises:
+        ValueError: If a delimiter is opened but not closed (invalid markdown syntax).
+    """
+    buffer = batch.buffer
+    out = TextNodeBatch(buffer, batch.urls)
+    append = out.append
+    for code, start, length, url_id in zip(batch.types, batch.starts, batch.lengths, batch.url_ids):
+        end = start + length
+        if code != _PLAIN or not length:
+            append(code, start, end, url_id)
+            continue
+        spans = list(_scan_inline(buffer, delimiters, images, links, start, end, autolinks=autolinks))
+        # Nothing found: keep the row as it was (including any URL)
+        if spans == [(TextType.PLAIN, start, end, None)]:
+            append(code, start, end, url_id)
+            continue
+        for text_type, span_start, span_end, url in spans:
+            append(TEXT_TYPE_CODES[text_type], span_start, span_end, out.intern_url(url))
+    return out
+
+
+def split_nodes_delimiter_batch(batch, delimiter, text_type):
+    """
+    Batch variant of inline_markdown.split_nodes_delimiter.
+
+    Args:
+        batch (TextNodeBatch): The batch to split.
+        delimiter (str): The delimiter string to split on (e.g., "`", "**", "_").
+        text_type (TextType): The TextType to apply to text found between delimiters.
+
+    Returns:
+        TextNodeBatch: A new batch over the same buffer.
+    """
+    return _split_batch(batch, {delimiter: text_type})
+
+
+def split_nodes_image_batch(batch):
+    """
+    Batch variant of split_nodes_images_links.split_nodes_image.
+
+    Args:
+        batch (TextNodeBatch): The batch to split.
+
+    Returns:
+        TextNodeBatch: A new batch over the same buffer.
+    """
+    return _split_batch(batch, {}, images=True)
+
+
+def split_nodes_link_batch(batch):
+    """
+    Batch variant of split_nodes_images_links.split_nodes_link.
+
+    Args:
+        batch (TextNodeBatch): The batch to split.
+
+    Returns:
+        TextNodeBatch: A new batch over the same buffer.
+    """
+    return _split_batch(batch, {}, links=True)
+
+
+def text_to_textnode_batch(text):
+    """
+    Batch variant of inline_markdown.text_to_textnodes.
+
+    Args:
+        text (str): Raw markdown text.
+
+    Returns:
+        TextNodeBatch: The inline nodes of text, pointing into text itself.
+    """
+    return _split_batch(TextNodeBatch.from_text(text), INLINE_DELIMITERS, images=True, links=True, autolinks=True)
+
+
+def _image_node(alt, urls, url_id):
+    """Build the <img> LeafNode for an IMAGE row; alt is escaped as an attribute."""
+    url = urls[url_id] if url_id != _NO_URL else None
+    return LeafNode(tag="img", value="", props={"src": url, "alt": alt})
+
+
+def text_node_batch_to_html_nodes(batch):
+    """
+    Batch variant of htmlnode.text_node_to_html_node.
+
+    Values are HTML-escaped like text_node_to_html_node does, but the buffer is
+    checked once up front, so a batch without & < > " skips escaping entirely.
+
+    Args:
+        batch (TextNodeBatch): The batch to convert.
+
+    Returns:
+        list[LeafNode]: One LeafNode per row, in order.
+    """
+    buffer = batch.buffer
+    urls = batch.urls
+    escape = needs_escape(buffer)
+    html_nodes = []
+    for code, start, length, url_id in zip(batch.types, batch.starts, batch.lengths, batch.url_ids):
+        value = buffer[start:start + length]
+        if code == _IMAGE:
+            html_nodes.append(_image_node(value, urls, url_id))
+            continue
+        if escape:
+            value = escape_html(value)
+        if code == _LINK:
+            url = urls[url_id] if url_id != _NO_URL else None
+            html_nodes.append(LeafNode(tag="a", value=value, props={"href": url}))
+        else:
+            html_nodes.append(LeafNode(tag=_TAGS_BY_CODE[code], value=value))
+    return html_nodes
+
+
+def text_node_batch_to_html(batch):
+    """
+    Render a batch straight to an HTML string, without building LeafNodes.
+
+    Produces the same output as joining LeafNode.to_html() over
+    text_node_batch_to_html_nodes(batch), including escaping.
+
+    Args:
+        batch (TextNodeBatch): The batch to render.
+
+    Returns:
+        str: The concatenated HTML of every row.
+    """
+    buffer = batch.buffer
+    urls = batch.urls
+    tags = _TAGS_BY_CODE
+    escape = needs_escape(buffer)
+    parts = []
+    append = parts.append
+    for code, start, length, url_id in zip(batch.types, batch.starts, batch.lengths, batch.url_ids):
+        value = buffer[start:start + length]
+        if code == _IMAGE:
+            append(_image_node(value, urls, url_id).to_html())
+            continue
+        if escape:
+            value = escape_html(value)
+        tag = tags[code]
+        if tag is None:
+            append(value)
+        elif code == _LINK:
+            url = urls[url_id] if url_id != _NO_URL else None
+            append(f'<a {attributes_to_html({"href": url})}>{value}</a>')
+        else:
+            append(f"<{tag}>{value}</{tag}>")
+    return "".join(parts)
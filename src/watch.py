@@ -0,0 +1,180 @@
+import os
+import sys
+import time
+
+from templates import DEFAULT_DATA_DIR, DEFAULT_PARTIALS_DIR
+from build_site import (
+    DEFAULT_CONTENT_DIR,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_STATIC_DIR,
+    DEFAULT_TEMPLATE_PATH,
+    build_site,
+)
+
+
+# Seconds between two snapshots
+DEFAULT_INTERVAL = 0.2
+
+# Seconds without a further change before a burst of changes is rebuilt
+DEFAULT_QUIET = 0.2
+
+
+def snapshot(paths):
+    """
+    Record the modification time and size of every file under paths.
+
+    Directories are walked with os.scandir(), whose entries carry their stat
+    results on most platforms, so no file is opened or read.
+
+    Args:
+        paths (Iterable[str | None]): Files and directories to look at. Missing
+            paths and None are skipped.
+
+    Returns:
+        dict[str, tuple[int, int]]: File path -> (st_mtime_ns, st_size).
+    """
+    files = {}
+    stack = []
+    for path in paths:
+        if path is None:
+            continue
+        if os.path.isdir(path):
+            stack.append(path)
+        elif os.path.isfile(path):
+            stat = os.stat(path)
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            # Removed while walking: its files are gone from this snapshot
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                except FileNotFoundError:
+                    continue
+    return files
+
+
+def diff_snapshots(old, new):
+    """
+    Return the files added, removed or modified between two snapshots.
+
+    Args:
+        old (dict[str, tuple[int, int]]): The earlier snapshot().
+        new (dict[str, tuple[int, int]]): The later snapshot().
+
+    Returns:
+        set[str]: The paths that differ.
+
+    Examples:
+        >>> sorted(diff_snapshots({"a": (1, 1), "b": (1, 1)}, {"a": (2, 1), "c": (1, 1)}))
+        ['a', 'b', 'c']
+    """
+    changed = {path for path, stat in new.items() if old.get(path) != stat}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+def _print_report(report, changed, seconds):
+    """
+    Default on_build for watch(): one line per rebuild.
+    """
+    print(
+        f"{len(changed):,} file(s) changed: rendered {len(report.rendered):,} of {len(report.pages):,} pages, "
+        f"removed {len(report.removed):,} in {seconds:.2f}s"
+    )
+
+
+def _print_error(error):
+    """
+    Default on_error for watch(): report the failed build and keep watching.
+    """
+    print(f"build failed: {error}", file=sys.stderr)
+
+
+def watch(content_dir=DEFAULT_CONTENT_DIR, template_path=DEFAULT_TEMPLATE_PATH, output_dir=DEFAULT_OUTPUT_DIR,
+          static_dir=DEFAULT_STATIC_DIR, partials_dir=DEFAULT_PARTIALS_DIR, data_dir=DEFAULT_DATA_DIR, workers=None,
+          chunksize=None, interval=DEFAULT_INTERVAL, quiet=DEFAULT_QUIET, on_build=_print_report,
+          on_error=_print_error, stop=None):
+    """
+    Build the site, then rebuild the pages affected by every change until stopped.
+
+    Every interval seconds the content, template, partial, data and static
+    files are snapshotted by modification time and size. When a snapshot
+    differs, more snapshots are taken until none has changed for quiet seconds,
+    so an editor saving several files at once causes one rebuild. The changed
+    paths are handed to build_site(), which hashes only those files and renders
+    only the pages that depend on them.
+
+    A failed build (e.g. a page saved without its h1 yet) is reported and the
+    files it was given are tried again with the next change.
+
+    Args:
+        content_dir, template_path, output_dir, static_dir, partials_dir, data_dir,
+            workers, chunksize: As for build_site().
+        interval (float, optional): Seconds between snapshots. Defaults to DEFAULT_INTERVAL.
+        quiet (float, optional): Seconds without changes that end a burst. Defaults to DEFAULT_QUIET.
+        on_build (callable, optional): Called as on_build(report, changed paths, seconds)
+            after each successful build; the first build has no changed paths.
+            Defaults to printing one line.
+        on_error (callable, optional): Called with the OSError or ValueError of a
+            failed build. Defaults to printing it to stderr.
+        stop (threading.Event, optional): Stops watching once set. Defaults to None
+            (watch until interrupted).
+    """
+    watched = (content_dir, template_path, partials_dir, data_dir, static_dir)
+    options = {
+        "workers": workers, "chunksize": chunksize, "partials_dir": partials_dir, "data_dir": data_dir,
+    }
+
+    def build(changed, unbuilt):
+        # Build with the paths known to have changed since the last good build
+        # (None: check everything) and report the paths that prompted it
+        start = time.perf_counter()
+        try:
+            report = build_site(content_dir, template_path, output_dir, static_dir, changed=unbuilt, **options)
+        except (OSError, ValueError) as error:
+            on_error(error)
+            return False
+        on_build(report, changed, time.perf_counter() - start)
+        return True
+
+    def sleep(seconds):
+        # Returns True once stop is set
+        if stop is None:
+            time.sleep(seconds)
+            return False
+        return stop.wait(seconds)
+
+    current = snapshot(watched)
+    # Changed paths not yet built successfully. After a failed first build there is no
+    # manifest to trust, so every build checks every file until one succeeds
+    pending = set() if build(set(), None) else None
+    while not sleep(interval):
+        latest = snapshot(watched)
+        changed = diff_snapshots(current, latest)
+        if not changed:
+            continue
+        # Coalesce a burst: wait until nothing has changed for quiet seconds
+        settled = time.monotonic() + quiet
+        while time.monotonic() < settled:
+            if sleep(min(interval, quiet)):
+                return
+            following = snapshot(watched)
+            more = diff_snapshots(latest, following)
+            if more:
+                changed |= more
+                latest = following
+                settled = time.monotonic() + quiet
+        current = latest
+        if pending is not None:
+            pending |= changed
+        if build(changed, pending):
+            pending = set()